@@ -0,0 +1,67 @@
+"""query indexes
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18 09:12:41.208113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '002'
+down_revision: Union[str, Sequence[str], None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_organizations_name', 'organizations', ['name'], None),
+    ('ix_organization_members_user_org', 'organization_members', ['user_id', 'organization_id'], None),
+    ('ix_organization_members_org_created', 'organization_members', ['organization_id', 'created_at', 'id'], None),
+    ('ix_contacts_org_created', 'contacts', ['organization_id', 'created_at', 'id'], None),
+    ('ix_contacts_org_active_created', 'contacts', ['organization_id', 'created_at', 'id'], 'is_active'),
+    ('ix_contacts_org_email', 'contacts', ['organization_id', 'email'], None),
+    ('ix_contacts_org_company', 'contacts', ['organization_id', 'company'], None),
+    ('ix_deals_org_created', 'deals', ['organization_id', 'created_at', 'id'], None),
+    ('ix_deals_org_status_created', 'deals', ['organization_id', 'status', 'created_at', 'id'], None),
+    ('ix_deals_assigned_org_created', 'deals', ['assigned_to', 'organization_id', 'created_at', 'id'], None),
+    ('ix_deals_contact_created', 'deals', ['contact_id', 'created_at', 'id'], None),
+    ('ix_tasks_org_created', 'tasks', ['organization_id', 'created_at', 'id'], None),
+    ('ix_tasks_org_status_created', 'tasks', ['organization_id', 'status', 'created_at', 'id'], None),
+    ('ix_tasks_org_priority_created', 'tasks', ['organization_id', 'priority', 'created_at', 'id'], None),
+    ('ix_tasks_assigned_org_created', 'tasks', ['assigned_to', 'organization_id', 'created_at', 'id'], None),
+    ('ix_tasks_org_due_date', 'tasks', ['organization_id', 'due_date'], 'due_date IS NOT NULL'),
+    ('ix_tasks_contact_created', 'tasks', ['contact_id', 'created_at', 'id'], 'contact_id IS NOT NULL'),
+    ('ix_tasks_deal_created', 'tasks', ['deal_id', 'created_at', 'id'], 'deal_id IS NOT NULL'),
+    ('ix_activities_org_created', 'activities', ['organization_id', 'created_at', 'id'], None),
+    ('ix_activities_org_type_created', 'activities', ['organization_id', 'activity_type', 'created_at', 'id'], None),
+    ('ix_activities_creator_org_created', 'activities', ['created_by', 'organization_id', 'created_at', 'id'], None),
+    ('ix_activities_contact_created', 'activities', ['contact_id', 'created_at', 'id'], 'contact_id IS NOT NULL'),
+    ('ix_activities_deal_created', 'activities', ['deal_id', 'created_at', 'id'], 'deal_id IS NOT NULL'),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,118 @@
+"""search documents
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18 11:37:05.441920
+
+"""
+import uuid
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '003'
+down_revision: Union[str, Sequence[str], None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_DOCUMENTS = {
+    'contacts': (
+        ('A', ('first_name', 'last_name')),
+        ('B', ('email', 'company')),
+        ('C', ('phone',)),
+    ),
+    'deals': (
+        ('A', ('title',)),
+        ('B', ('description',)),
+    ),
+    'tasks': (
+        ('A', ('title',)),
+        ('B', ('description',)),
+    ),
+}
+
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def _document(columns, row=''):
+    return " || ' ' || ".join(f"coalesce({row}{column}, '')" for column in columns)
+
+
+def _columns(weights):
+    return [column for _, columns in weights for column in columns]
+
+
+def _expressions(weights, row=''):
+    vector = ' || '.join(
+        f"setweight(to_tsvector('simple', {_document(columns, row)}), '{weight}')"
+        for weight, columns in weights
+    )
+    return vector, f'lower({_document(_columns(weights), row)})'
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    for table, weights in SEARCH_DOCUMENTS.items():
+        vector, text = _expressions(weights, 'NEW.')
+        op.execute(
+            f'ALTER TABLE {table} '
+            f'ADD COLUMN search_vector tsvector, ADD COLUMN search_text text'
+        )
+        op.execute(
+            f'CREATE FUNCTION {table}_search_document() RETURNS trigger AS $$ '
+            f'BEGIN NEW.search_vector := {vector}; NEW.search_text := {text}; RETURN NEW; END '
+            f'$$ LANGUAGE plpgsql'
+        )
+        op.execute(
+            f'CREATE TRIGGER {table}_search_document '
+            f'BEFORE INSERT OR UPDATE OF {", ".join(_columns(weights))} ON {table} '
+            f'FOR EACH ROW EXECUTE FUNCTION {table}_search_document()'
+        )
+
+    with op.get_context().autocommit_block():
+        for table, weights in SEARCH_DOCUMENTS.items():
+            _backfill(table, weights)
+        for table in SEARCH_DOCUMENTS:
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_search_vector '
+                f'ON {table} USING gin (search_vector)'
+            )
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_search_text_trgm '
+                f'ON {table} USING gin (search_text gin_trgm_ops)'
+            )
+
+
+def _backfill(table, weights) -> None:
+    bind = op.get_bind()
+    vector, text = _expressions(weights, f'{table}.')
+    batch = sa.text(
+        f'UPDATE {table} SET search_vector = {vector}, search_text = {text} '
+        f'FROM (SELECT id FROM {table} WHERE id > :last_id ORDER BY id '
+        f'LIMIT {BACKFILL_BATCH_SIZE}) AS batch '
+        f'WHERE {table}.id = batch.id RETURNING {table}.id'
+    )
+    last_id = uuid.UUID(int=0)
+    while True:
+        ids = bind.execute(batch, {'last_id': last_id}).scalars().all()
+        if not ids:
+            break
+        last_id = max(ids)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in SEARCH_DOCUMENTS:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_search_text_trgm')
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_search_vector')
+
+    for table in SEARCH_DOCUMENTS:
+        op.execute(f'DROP TRIGGER {table}_search_document ON {table}')
+        op.execute(f'DROP FUNCTION {table}_search_document()')
+        op.execute(
+            f'ALTER TABLE {table} DROP COLUMN search_text, DROP COLUMN search_vector'
+        )
@@ -0,0 +1,100 @@
+"""org stats
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18 15:02:47.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = '004'
+down_revision: Union[str, Sequence[str], None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COUNTERS = [
+    'contacts_total',
+    'deals_total',
+    'deals_new',
+    'deals_in_progress',
+    'deals_won',
+    'deals_lost',
+    'deals_closed',
+    'tasks_total',
+    'tasks_todo',
+    'tasks_in_progress',
+    'tasks_done',
+    'tasks_cancelled',
+    'activities_total',
+    'activities_call',
+    'activities_email',
+    'activities_meeting',
+    'activities_note',
+    'activities_task',
+]
+
+AMOUNTS = ['won_amount', 'pipeline_amount']
+
+GROUPED = {
+    'contacts': ('contacts', None, []),
+    'deals': ('deals', 'status', ['new', 'in_progress', 'won', 'lost', 'closed']),
+    'tasks': ('tasks', 'status', ['todo', 'in_progress', 'done', 'cancelled']),
+    'activities': ('activities', 'activity_type', ['call', 'email', 'meeting', 'note', 'task']),
+}
+
+
+def _grouped(alias: str) -> str:
+    table, column, values = GROUPED[alias]
+    aggregates = [f'count(*) AS {alias}_total']
+    aggregates += [
+        f"count(*) FILTER (WHERE lower({column}::text) = '{value}') AS {alias}_{value}"
+        for value in values
+    ]
+    if alias == 'deals':
+        aggregates += [
+            "sum(amount) FILTER (WHERE lower(status::text) = 'won') AS won_amount",
+            "sum(amount) FILTER (WHERE lower(status::text) = 'in_progress') AS pipeline_amount",
+        ]
+    return (
+        f'LEFT JOIN (SELECT organization_id, {", ".join(aggregates)} '
+        f'FROM {table} GROUP BY organization_id) AS {alias} '
+        f'ON {alias}.organization_id = organizations.id'
+    )
+
+
+def _source(name: str) -> str:
+    return 'deals' if name in AMOUNTS else name.split('_')[0]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'org_stats',
+        sa.Column('organization_id', postgresql.UUID(as_uuid=True), nullable=False),
+        *[
+            sa.Column(name, sa.Integer(), nullable=False, server_default='0')
+            for name in COUNTERS
+        ],
+        sa.Column('won_amount', sa.Numeric(16, 2), nullable=False, server_default='0'),
+        sa.Column('pipeline_amount', sa.Numeric(16, 2), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('organization_id')
+    )
+
+    columns = [*COUNTERS, *AMOUNTS]
+    op.execute(
+        f'INSERT INTO org_stats (organization_id, {", ".join(columns)}, updated_at) '
+        f'SELECT organizations.id, '
+        f'{", ".join(f"coalesce({_source(name)}.{name}, 0)" for name in columns)}, '
+        f"now() AT TIME ZONE 'utc' "
+        f'FROM organizations {" ".join(_grouped(alias) for alias in GROUPED)}'
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('org_stats')
@@ -0,0 +1,65 @@
+"""daily rollups
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18 16:24:09.537811
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = '005'
+down_revision: Union[str, Sequence[str], None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_deals_created', 'deals', ['created_at'], None),
+    ('ix_deals_closed_date', 'deals', ['closed_date'], 'closed_date IS NOT NULL'),
+    ('ix_tasks_completed_at', 'tasks', ['completed_at'], 'completed_at IS NOT NULL'),
+    ('ix_activities_created', 'activities', ['created_at'], None),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'daily_rollups',
+        sa.Column('organization_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('deals_created', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('deals_won', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('won_amount', sa.Numeric(16, 2), nullable=False, server_default='0'),
+        sa.Column('tasks_completed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('activities_logged', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('organization_id', 'day')
+    )
+
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+    op.drop_table('daily_rollups')
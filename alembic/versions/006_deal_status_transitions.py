@@ -0,0 +1,148 @@
+"""deal status transitions
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 17:41:52.906318
+
+"""
+import re
+import uuid
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = '006'
+down_revision: Union[str, Sequence[str], None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+STATUSES = ('NEW', 'IN_PROGRESS', 'WON', 'LOST', 'CLOSED')
+
+STATUS_NOTE = re.compile(
+    r'^Status changed from (?:DealStatusEnum\.)?(\w+) to (?:DealStatusEnum\.)?(\w+)$'
+)
+
+BACKFILL_BATCH_SIZE = 5000
+
+transition_status = postgresql.ENUM(*STATUSES, name='dealtransitionstatus', create_type=False)
+
+
+def upgrade() -> None:
+    transition_status.create(op.get_bind(), checkfirst=True)
+    op.create_table(
+        'deal_status_transitions',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('organization_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('deal_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('from_status', transition_status, nullable=False),
+        sa.Column('to_status', transition_status, nullable=False),
+        sa.Column('changed_by', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('amount', sa.Numeric(12, 2), nullable=True),
+        sa.Column('changed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['deal_id'], ['deals.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['changed_by'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_deal_status_transitions_deal_changed',
+        'deal_status_transitions',
+        ['deal_id', 'changed_at'],
+    )
+    op.create_index(
+        'ix_deal_status_transitions_org_changed',
+        'deal_status_transitions',
+        ['organization_id', 'changed_at'],
+    )
+    op.create_index(
+        'ix_deal_status_transitions_org_to_changed',
+        'deal_status_transitions',
+        ['organization_id', 'to_status', 'changed_at'],
+    )
+
+    _backfill()
+
+
+def downgrade() -> None:
+    op.drop_table('deal_status_transitions')
+    transition_status.drop(op.get_bind(), checkfirst=True)
+
+
+def _backfill() -> None:
+    bind = op.get_bind()
+    activities = sa.table(
+        'activities',
+        sa.column('id', postgresql.UUID(as_uuid=True)),
+        sa.column('organization_id', postgresql.UUID(as_uuid=True)),
+        sa.column('deal_id', postgresql.UUID(as_uuid=True)),
+        sa.column('created_by', postgresql.UUID(as_uuid=True)),
+        sa.column('title', sa.String()),
+        sa.column('description', sa.Text()),
+        sa.column('created_at', sa.DateTime()),
+    )
+    deals = sa.table(
+        'deals',
+        sa.column('id', postgresql.UUID(as_uuid=True)),
+        sa.column('amount', sa.Numeric(12, 2)),
+    )
+    transitions = sa.table(
+        'deal_status_transitions',
+        sa.column('id', postgresql.UUID(as_uuid=True)),
+        sa.column('organization_id', postgresql.UUID(as_uuid=True)),
+        sa.column('deal_id', postgresql.UUID(as_uuid=True)),
+        sa.column('from_status', transition_status),
+        sa.column('to_status', transition_status),
+        sa.column('changed_by', postgresql.UUID(as_uuid=True)),
+        sa.column('amount', sa.Numeric(12, 2)),
+        sa.column('changed_at', sa.DateTime()),
+    )
+    notes = (
+        sa.select(
+            activities.c.id,
+            activities.c.organization_id,
+            activities.c.deal_id,
+            activities.c.created_by,
+            activities.c.description,
+            activities.c.created_at,
+            deals.c.amount,
+        )
+        .select_from(activities.join(deals, deals.c.id == activities.c.deal_id))
+        .where(
+            activities.c.title.like('Deal status changed to %'),
+            activities.c.description.like('Status changed from %'),
+        )
+        .order_by(activities.c.id)
+        .limit(BACKFILL_BATCH_SIZE)
+    )
+
+    last_id = None
+    while True:
+        stmt = notes if last_id is None else notes.where(activities.c.id > last_id)
+        rows = bind.execute(stmt).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        batch = []
+        for row in rows:
+            match = STATUS_NOTE.match(row.description.strip())
+            if match is None:
+                continue
+            from_status, to_status = (status.upper() for status in match.groups())
+            if from_status not in STATUSES or to_status not in STATUSES:
+                continue
+            batch.append({
+                'id': uuid.uuid4(),
+                'organization_id': row.organization_id,
+                'deal_id': row.deal_id,
+                'from_status': from_status,
+                'to_status': to_status,
+                'changed_by': row.created_by,
+                'amount': row.amount,
+                'changed_at': row.created_at,
+            })
+        if batch:
+            bind.execute(sa.insert(transitions), batch)
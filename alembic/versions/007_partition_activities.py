@@ -0,0 +1,106 @@
+"""partition activities by month
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18 19:02:37.114208
+
+"""
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '007'
+down_revision: Union[str, Sequence[str], None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_activities_org_created', ['organization_id', 'created_at', 'id'], None),
+    ('ix_activities_created', ['created_at'], None),
+    ('ix_activities_org_type_created', ['organization_id', 'activity_type', 'created_at', 'id'], None),
+    ('ix_activities_creator_org_created', ['created_by', 'organization_id', 'created_at', 'id'], None),
+    ('ix_activities_contact_created', ['contact_id', 'created_at', 'id'], 'contact_id IS NOT NULL'),
+    ('ix_activities_deal_created', ['deal_id', 'created_at', 'id'], 'deal_id IS NOT NULL'),
+]
+
+FOREIGN_KEYS = [
+    ('organization_id', 'organizations'),
+    ('contact_id', 'contacts'),
+    ('deal_id', 'deals'),
+    ('created_by', 'users'),
+]
+
+PARTITIONS_AHEAD = 3
+ARCHIVE_SCHEMA = 'activities_archive'
+
+
+def _month(day: date, offset: int = 0) -> date:
+    month = day.year * 12 + day.month - 1 + offset
+    return date(month // 12, month % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    boundary = _month(datetime.utcnow().date(), 1)
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS activities_legacy_id_created '
+            'ON activities (id, created_at)'
+        )
+        op.execute(
+            'ALTER TABLE activities ADD CONSTRAINT activities_legacy_bound '
+            f"CHECK (created_at < '{boundary.isoformat()}') NOT VALID"
+        )
+        op.execute('ALTER TABLE activities VALIDATE CONSTRAINT activities_legacy_bound')
+
+    op.execute('ALTER TABLE activities DROP CONSTRAINT activities_pkey')
+    op.execute(
+        'ALTER TABLE activities ADD CONSTRAINT activities_legacy_pkey '
+        'PRIMARY KEY USING INDEX activities_legacy_id_created'
+    )
+    op.execute('ALTER TABLE activities RENAME TO activities_legacy')
+    for name, _, _ in INDEXES:
+        op.execute(f'ALTER INDEX {name} RENAME TO {name}_legacy')
+
+    op.execute(
+        'CREATE TABLE activities (LIKE activities_legacy INCLUDING DEFAULTS) '
+        'PARTITION BY RANGE (created_at)'
+    )
+    op.execute('ALTER TABLE activities ADD CONSTRAINT activities_pkey PRIMARY KEY (id, created_at)')
+    for column, target in FOREIGN_KEYS:
+        op.execute(
+            f'ALTER TABLE activities ADD CONSTRAINT activities_{column}_fkey '
+            f'FOREIGN KEY ({column}) REFERENCES {target} (id)'
+        )
+    for name, columns, where in INDEXES:
+        op.execute(
+            f"CREATE INDEX {name} ON ONLY activities ({', '.join(columns)})"
+            + (f' WHERE {where}' if where else '')
+        )
+
+    op.execute(
+        'ALTER TABLE activities ATTACH PARTITION activities_legacy '
+        f"FOR VALUES FROM (MINVALUE) TO ('{boundary.isoformat()}')"
+    )
+    for offset in range(PARTITIONS_AHEAD + 1):
+        start = _month(boundary, offset)
+        op.execute(
+            f'CREATE TABLE activities_p{start:%Y%m} PARTITION OF activities '
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{_month(start, 1).isoformat()}')"
+        )
+    op.execute(f'CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}')
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE activities DETACH PARTITION activities_legacy')
+    op.execute('INSERT INTO activities_legacy SELECT * FROM activities')
+    op.execute('DROP TABLE activities')
+
+    op.execute('ALTER TABLE activities_legacy RENAME TO activities')
+    op.execute('ALTER TABLE activities DROP CONSTRAINT activities_legacy_pkey')
+    op.execute('ALTER TABLE activities ADD CONSTRAINT activities_pkey PRIMARY KEY (id)')
+    for name, _, _ in INDEXES:
+        op.execute(f'ALTER INDEX {name}_legacy RENAME TO {name}')
+    op.execute('ALTER TABLE activities DROP CONSTRAINT activities_legacy_bound')
@@ -0,0 +1,38 @@
+"""contact timeline index
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18 20:11:45.402917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '008'
+down_revision: Union[str, Sequence[str], None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_contact_completed',
+            'tasks',
+            ['contact_id', 'completed_at', 'id'],
+            postgresql_concurrently=True,
+            postgresql_where=sa.text('contact_id IS NOT NULL AND completed_at IS NOT NULL'),
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_contact_completed',
+            table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
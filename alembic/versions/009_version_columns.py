@@ -0,0 +1,32 @@
+"""version columns for optimistic concurrency
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18 21:04:19.583710
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '009'
+down_revision: Union[str, Sequence[str], None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ['contacts', 'deals', 'tasks']
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column('version', sa.Integer(), nullable=False, server_default=sa.text('1')),
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_column(table, 'version')
@@ -0,0 +1,40 @@
+"""archived activity counts
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18 23:12:40.261937
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = '010'
+down_revision: Union[str, Sequence[str], None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TYPES = ('CALL', 'EMAIL', 'MEETING', 'NOTE', 'TASK')
+
+archived_activity_type = postgresql.ENUM(*TYPES, name='archivedactivitytype', create_type=False)
+
+
+def upgrade() -> None:
+    archived_activity_type.create(op.get_bind(), checkfirst=True)
+    op.create_table(
+        'archived_activity_counts',
+        sa.Column('organization_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('activity_type', archived_activity_type, nullable=False),
+        sa.Column('activities', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('organization_id', 'day', 'activity_type')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('archived_activity_counts')
+    archived_activity_type.drop(op.get_bind(), checkfirst=True)
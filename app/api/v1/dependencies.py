@@ -2,12 +2,13 @@ from typing import Optional
 from uuid import UUID
 from fastapi import Depends, HTTPException, status, Header
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
 from app.database import get_db
 from app.core.security import extract_user_id_from_token
 from app.core.permissions import Role, has_permission, Permission
+from app.core.versioning import parse_if_match
 from app.models import User, OrganizationMember
+from app.services import PrincipalService
 
 
 async def get_token_from_header(
@@ -29,8 +30,16 @@ async def get_token_from_header(
     return parts[1]
 
 
+def _parse_organization_id(value: Optional[str]) -> Optional[UUID]:
+    try:
+        return UUID(value) if value else None
+    except (ValueError, TypeError):
+        return None
+
+
 async def get_current_user(
     token: str = Depends(get_token_from_header),
+    x_organization_id: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db),
 ) -> User:
     user_id = extract_user_id_from_token(token)
@@ -41,17 +50,17 @@ async def get_current_user(
             detail="Invalid or expired token",
         )
 
-    stmt = select(User).where(User.id == user_id)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+    principal = await PrincipalService(db).resolve(
+        user_id, _parse_organization_id(x_organization_id)
+    )
 
-    if user is None or not user.is_active:
+    if principal is None or not principal.user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found or inactive",
         )
 
-    return user
+    return principal.user
 
 
 async def get_organization_context(
@@ -77,13 +86,8 @@ async def check_organization_member(
     organization_id: UUID = Depends(get_organization_context),
     db: AsyncSession = Depends(get_db),
 ) -> OrganizationMember:
-    stmt = select(OrganizationMember).where(
-        (OrganizationMember.user_id == current_user.id)
-        & (OrganizationMember.organization_id == organization_id)
-        & (OrganizationMember.is_active == True)
-    )
-    result = await db.execute(stmt)
-    member = result.scalar_one_or_none()
+    principal = await PrincipalService(db).resolve(current_user.id, organization_id)
+    member = principal.member if principal is not None else None
 
     if member is None:
         raise HTTPException(
@@ -120,3 +124,7 @@ def require_role(role: Role):
         return member
 
     return role_checker
+
+
+async def get_expected_version(if_match: Optional[str] = Header(None)) -> Optional[int]:
+    return parse_if_match(if_match)
@@ -5,6 +5,7 @@ from app.api.v1.endpoints.deals import router as deals_router
 from app.api.v1.endpoints.tasks import router as tasks_router
 from app.api.v1.endpoints.activities import router as activities_router
 from app.api.v1.endpoints.analytics import router as analytics_router
+from app.api.v1.endpoints.exports import router as exports_router
 
 __all__ = [
     "auth_router",
@@ -14,4 +15,5 @@ __all__ = [
     "tasks_router",
     "activities_router",
     "analytics_router",
+    "exports_router",
 ]
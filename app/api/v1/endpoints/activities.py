@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from typing import Optional, List
@@ -8,6 +8,7 @@ from app.models import User
 from app.api.v1.dependencies import get_current_user, get_organization_context, check_organization_member
 from app.api.v1.schemas import ActivityCreate, ActivityResponse
 from app.services import ActivityService
+from app.core.pagination import set_next_cursor
 
 router = APIRouter(prefix="/activities", tags=["activities"])
 
@@ -15,7 +16,9 @@ router = APIRouter(prefix="/activities", tags=["activities"])
 @router.get("/deals/{deal_id}", response_model=List[ActivityResponse])
 async def list_deal_activities(
     deal_id: UUID,
+    response: Response,
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     organization_id: UUID = Depends(get_organization_context),
     db: AsyncSession = Depends(get_db),
@@ -23,7 +26,8 @@ async def list_deal_activities(
     await check_organization_member(current_user, organization_id, db)
 
     service = ActivityService(db)
-    activities = await service.list_deal_activities(deal_id, limit)
+    activities = await service.list_deal_activities(deal_id, limit, cursor)
+    set_next_cursor(response, activities, limit)
     return activities
 
 
@@ -31,6 +35,8 @@ async def list_deal_activities(
 async def create_deal_activity(
     deal_id: UUID,
     request: ActivityCreate,
+    response: Response,
+    durable: bool = Query(True),
     current_user: User = Depends(get_current_user),
     organization_id: UUID = Depends(get_organization_context),
     db: AsyncSession = Depends(get_db),
@@ -43,15 +49,20 @@ async def create_deal_activity(
         organization_id=organization_id,
         created_by=current_user.id,
         deal_id=deal_id,
+        durable=durable,
         **data
     )
+    if not durable:
+        response.status_code = status.HTTP_202_ACCEPTED
     return activity
 
 
 @router.get("/contacts/{contact_id}", response_model=List[ActivityResponse])
 async def list_contact_activities(
     contact_id: UUID,
+    response: Response,
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     organization_id: UUID = Depends(get_organization_context),
     db: AsyncSession = Depends(get_db),
@@ -59,7 +70,8 @@ async def list_contact_activities(
     await check_organization_member(current_user, organization_id, db)
 
     service = ActivityService(db)
-    activities = await service.list_contact_activities(contact_id, limit)
+    activities = await service.list_contact_activities(contact_id, limit, cursor)
+    set_next_cursor(response, activities, limit)
     return activities
 
 
@@ -67,6 +79,8 @@ async def list_contact_activities(
 async def create_contact_activity(
     contact_id: UUID,
     request: ActivityCreate,
+    response: Response,
+    durable: bool = Query(True),
     current_user: User = Depends(get_current_user),
     organization_id: UUID = Depends(get_organization_context),
     db: AsyncSession = Depends(get_db),
@@ -79,6 +93,9 @@ async def create_contact_activity(
         organization_id=organization_id,
         created_by=current_user.id,
         contact_id=contact_id,
+        durable=durable,
         **data
     )
+    if not durable:
+        response.status_code = status.HTTP_202_ACCEPTED
     return activity
@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from app.database import get_db
 from app.models import User
 from app.api.v1.dependencies import get_current_user, get_organization_context, check_organization_member
 from app.services import AnalyticsService
+from app.services.analytics_service import Granularity
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
@@ -20,10 +22,25 @@ async def get_deals_summary(
     await check_organization_member(current_user, organization_id, db)
 
     service = AnalyticsService(db)
-    summary = await service.get_deals_summary(organization_id)
+    summary = await service.cached("get_deals_summary", organization_id)
     return summary
 
 
+@router.get("/deals/funnel", response_model=Dict[str, Any])
+async def get_deals_funnel(
+    start: Optional[date] = Query(None),
+    end: Optional[date] = Query(None),
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_organization_context),
+    db: AsyncSession = Depends(get_db),
+):
+    await check_organization_member(current_user, organization_id, db)
+
+    service = AnalyticsService(db)
+    funnel = await service.get_deals_funnel(organization_id, start, end)
+    return funnel
+
+
 @router.get("/tasks/summary", response_model=Dict[str, Any])
 async def get_tasks_summary(
     current_user: User = Depends(get_current_user),
@@ -33,7 +50,7 @@ async def get_tasks_summary(
     await check_organization_member(current_user, organization_id, db)
 
     service = AnalyticsService(db)
-    summary = await service.get_tasks_summary(organization_id)
+    summary = await service.cached("get_tasks_summary", organization_id)
     return summary
 
 
@@ -46,7 +63,7 @@ async def get_contacts_statistics(
     await check_organization_member(current_user, organization_id, db)
 
     service = AnalyticsService(db)
-    stats = await service.get_contact_statistics(organization_id)
+    stats = await service.cached("get_contact_statistics", organization_id)
     return stats
 
 
@@ -59,10 +76,26 @@ async def get_activities_statistics(
     await check_organization_member(current_user, organization_id, db)
 
     service = AnalyticsService(db)
-    stats = await service.get_activity_statistics(organization_id)
+    stats = await service.cached("get_activity_statistics", organization_id)
     return stats
 
 
+@router.get("/timeseries", response_model=Dict[str, Any])
+async def get_timeseries(
+    granularity: Granularity = Query(Granularity.DAY),
+    start: Optional[date] = Query(None),
+    end: Optional[date] = Query(None),
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_organization_context),
+    db: AsyncSession = Depends(get_db),
+):
+    await check_organization_member(current_user, organization_id, db)
+
+    service = AnalyticsService(db)
+    series = await service.get_timeseries(organization_id, granularity, start, end)
+    return series
+
+
 @router.get("/dashboard", response_model=Dict[str, Any])
 async def get_dashboard_summary(
     current_user: User = Depends(get_current_user),
@@ -72,5 +105,5 @@ async def get_dashboard_summary(
     await check_organization_member(current_user, organization_id, db)
 
     service = AnalyticsService(db)
-    dashboard = await service.get_dashboard_summary(organization_id)
+    dashboard = await service.cached("get_dashboard_summary", organization_id)
     return dashboard
@@ -4,15 +4,13 @@ from sqlalchemy import select
 from datetime import datetime, timedelta
 
 from app.database import get_db
-from app.models import User, Organization, OrganizationMember
+from app.models import User
 from app.core.security import (
-    hash_password,
-    verify_password,
     create_access_token,
     create_refresh_token,
     decode_token,
 )
-from app.core.permissions import Role
+from app.core.hashing import hash_password_async, verify_password_async
 from app.api.v1.schemas import (
     LoginRequest,
     RegisterRequest,
@@ -22,6 +20,8 @@ from app.api.v1.schemas import (
     ChangePasswordRequest,
 )
 from app.api.v1.dependencies import get_current_user
+from app.services import AuthService
+from app.services.principal_service import invalidate_principal
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -31,54 +31,18 @@ async def register(
     request: RegisterRequest,
     db: AsyncSession = Depends(get_db),
 ):
-    stmt = select(User).where(User.email == request.email)
-    result = await db.execute(stmt)
-    if result.scalar_one_or_none() is not None:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Email already registered",
-        )
-
-    stmt = select(User).where(User.username == request.username)
-    result = await db.execute(stmt)
-    if result.scalar_one_or_none() is not None:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Username already taken",
-        )
-
-    user = User(
+    service = AuthService(db)
+    registered = await service.register(
         email=request.email,
         username=request.username,
         first_name=request.first_name,
         last_name=request.last_name,
-        password_hash=hash_password(request.password),
+        password=request.password,
     )
-    db.add(user)
-    await db.commit()
-    await db.refresh(user)
-
-    org = Organization(
-        name=f"{request.first_name} {request.last_name}'s Organization",
-    )
-    db.add(org)
-    await db.commit()
-    await db.refresh(org)
-
-    org_member = OrganizationMember(
-        user_id=user.id,
-        organization_id=org.id,
-        role=Role.OWNER,
-    )
-    db.add(org_member)
-    await db.commit()
-
-    access_token = create_access_token({"sub": str(user.id)})
-    refresh_token = create_refresh_token({"sub": str(user.id)})
 
     return TokenResponse(
-        access_token=access_token,
-        refresh_token=refresh_token,
+        access_token=registered["access_token"],
+        refresh_token=registered["refresh_token"],
     )
 
 
@@ -91,7 +55,9 @@ async def login(
     result = await db.execute(stmt)
     user = result.scalar_one_or_none()
 
-    if user is None or not verify_password(request.password, user.password_hash):
+    if user is None or not await verify_password_async(
+        request.password, user.password_hash
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
@@ -105,6 +71,7 @@ async def login(
 
     user.last_login = datetime.utcnow()
     await db.commit()
+    invalidate_principal(user.id)
 
     access_token = create_access_token({"sub": str(user.id)})
     refresh_token = create_refresh_token({"sub": str(user.id)})
@@ -168,13 +135,16 @@ async def change_password(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    if not verify_password(request.old_password, current_user.password_hash):
+    if not await verify_password_async(
+        request.old_password, current_user.password_hash
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Old password is incorrect",
         )
 
-    current_user.password_hash = hash_password(request.new_password)
+    current_user.password_hash = await hash_password_async(request.new_password)
     await db.commit()
+    invalidate_principal(current_user.id)
 
     return {"message": "Password changed successfully"}
@@ -1,22 +1,41 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from typing import Optional, List
 
 from app.database import get_db
 from app.models import User
-from app.api.v1.dependencies import get_current_user, get_organization_context, check_organization_member
-from app.api.v1.schemas import ContactCreate, ContactUpdate, ContactResponse
-from app.services import ContactService
+from app.api.v1.dependencies import (
+    check_organization_member,
+    get_current_user,
+    get_expected_version,
+    get_organization_context,
+)
+from app.api.v1.schemas import (
+    ContactCreate,
+    ContactUpdate,
+    ContactResponse,
+    ContactImportJobResponse,
+    ContactTimelineEvent,
+    ContactBulkCreate,
+    ContactBulkUpdate,
+    BulkDeleteRequest,
+    BulkResponse,
+)
+from app.services import ContactService, ContactImportService
 from app.core.exceptions import NotFound
+from app.core.pagination import CURSOR_HEADER, set_next_cursor
+from app.core.versioning import set_etag
 
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
 
 @router.get("", response_model=List[ContactResponse])
 async def list_contacts(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     search: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     organization_id: UUID = Depends(get_organization_context),
@@ -27,10 +46,11 @@ async def list_contacts(
     service = ContactService(db)
 
     if search:
-        contacts = await service.search_contacts(organization_id, search, skip, limit)
-    else:
-        contacts = await service.list_contacts(organization_id, skip, limit)
+        return await service.search_contacts(organization_id, search, skip, limit)
 
+    contacts = await service.list_contacts(organization_id, skip, limit, cursor)
+
+    set_next_cursor(response, contacts, limit)
     return contacts
 
 
@@ -48,9 +68,92 @@ async def create_contact(
     return contact
 
 
+@router.post("/bulk", response_model=BulkResponse)
+async def bulk_create_contacts(
+    request: ContactBulkCreate,
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_organization_context),
+    db: AsyncSession = Depends(get_db),
+):
+    await check_organization_member(current_user, organization_id, db)
+
+    service = ContactService(db)
+    return await service.bulk_create_contacts(
+        organization_id, [item.model_dump() for item in request.items]
+    )
+
+
+@router.patch("/bulk", response_model=BulkResponse)
+async def bulk_update_contacts(
+    request: ContactBulkUpdate,
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_organization_context),
+    db: AsyncSession = Depends(get_db),
+):
+    await check_organization_member(current_user, organization_id, db)
+
+    service = ContactService(db)
+    return await service.bulk_update_contacts(
+        organization_id,
+        [item.model_dump(exclude_unset=True) for item in request.items],
+    )
+
+
+@router.post("/bulk/delete", response_model=BulkResponse)
+async def bulk_delete_contacts(
+    request: BulkDeleteRequest,
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_organization_context),
+    db: AsyncSession = Depends(get_db),
+):
+    await check_organization_member(current_user, organization_id, db)
+
+    service = ContactService(db)
+    return await service.bulk_delete_contacts(organization_id, request.ids)
+
+
+@router.post(
+    "/import",
+    response_model=ContactImportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def import_contacts(
+    http_request: Request,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_organization_context),
+    db: AsyncSession = Depends(get_db),
+):
+    await check_organization_member(current_user, organization_id, db)
+
+    service = ContactImportService(db, ContactCreate)
+    job, path = await service.start(organization_id, http_request.stream())
+    background_tasks.add_task(service.run, job, path)
+    return job
+
+
+@router.get("/import/{job_id}", response_model=ContactImportJobResponse)
+async def get_contact_import(
+    job_id: UUID,
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_organization_context),
+    db: AsyncSession = Depends(get_db),
+):
+    await check_organization_member(current_user, organization_id, db)
+
+    service = ContactImportService(db, ContactCreate)
+    job = service.get_job(organization_id, job_id)
+
+    if job is None:
+        raise NotFound("Import job not found")
+
+    return job
+
+
 @router.get("/{contact_id}", response_model=ContactResponse)
 async def get_contact(
     contact_id: UUID,
+    response: Response,
     current_user: User = Depends(get_current_user),
     organization_id: UUID = Depends(get_organization_context),
     db: AsyncSession = Depends(get_db),
@@ -66,13 +169,35 @@ async def get_contact(
             detail="Contact not found",
         )
 
+    set_etag(response, contact)
     return contact
 
 
+@router.get("/{contact_id}/timeline", response_model=List[ContactTimelineEvent])
+async def get_contact_timeline(
+    contact_id: UUID,
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_organization_context),
+    db: AsyncSession = Depends(get_db),
+):
+    await check_organization_member(current_user, organization_id, db)
+
+    service = ContactService(db)
+    events, next_cursor = await service.get_timeline(organization_id, contact_id, limit, cursor)
+    if next_cursor is not None:
+        response.headers[CURSOR_HEADER] = next_cursor
+    return events
+
+
 @router.patch("/{contact_id}", response_model=ContactResponse)
 async def update_contact(
     contact_id: UUID,
+    response: Response,
     request: ContactUpdate,
+    version: Optional[int] = Depends(get_expected_version),
     current_user: User = Depends(get_current_user),
     organization_id: UUID = Depends(get_organization_context),
     db: AsyncSession = Depends(get_db),
@@ -81,7 +206,7 @@ async def update_contact(
 
     service = ContactService(db)
     updates = request.model_dump(exclude_unset=True)
-    contact = await service.update_contact(contact_id, updates)
+    contact = await service.update_contact(contact_id, updates, version)
 
     if contact is None:
         raise HTTPException(
@@ -89,6 +214,7 @@ async def update_contact(
             detail="Contact not found",
         )
 
+    set_etag(response, contact)
     return contact
 
 
@@ -1,22 +1,42 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from typing import Optional, List
 
 from app.database import get_db
 from app.models import User, DealStatusEnum
-from app.api.v1.dependencies import get_current_user, get_organization_context, check_organization_member
-from app.api.v1.schemas import DealCreate, DealUpdate, DealStatusChange, DealResponse
+from app.api.v1.dependencies import (
+    check_organization_member,
+    get_current_user,
+    get_expected_version,
+    get_organization_context,
+)
+from app.api.v1.schemas import (
+    DealCreate,
+    DealUpdate,
+    DealStatusChange,
+    DealResponse,
+    DealBoardColumn,
+    DealBulkCreate,
+    DealBulkUpdate,
+    BulkDeleteRequest,
+    BulkResponse,
+)
 from app.services import DealService
+from app.services.deal_service import DealBoardSort
 from app.core.exceptions import BadRequest
+from app.core.pagination import set_next_cursor
+from app.core.versioning import set_etag
 
 router = APIRouter(prefix="/deals", tags=["deals"])
 
 
 @router.get("", response_model=List[DealResponse])
 async def list_deals(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     status: Optional[str] = None,
     search: Optional[str] = None,
     current_user: User = Depends(get_current_user),
@@ -28,22 +48,42 @@ async def list_deals(
     service = DealService(db)
 
     if search:
-        deals = await service.search_deals(organization_id, search, skip, limit)
-    elif status:
+        return await service.search_deals(organization_id, search, skip, limit)
+
+    if status:
         try:
             status_enum = DealStatusEnum[status.upper()]
-            deals = await service.get_deals_by_status(organization_id, status_enum, skip, limit)
+            deals = await service.get_deals_by_status(
+                organization_id, status_enum, skip, limit, cursor
+            )
         except KeyError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid status",
             )
     else:
-        deals = await service.list_deals(organization_id, skip, limit)
+        deals = await service.list_deals(organization_id, skip, limit, cursor)
 
+    set_next_cursor(response, deals, limit)
     return deals
 
 
+@router.get("/board", response_model=List[DealBoardColumn])
+async def get_deal_board(
+    sort: DealBoardSort = Query(DealBoardSort.AMOUNT),
+    limit: int = Query(20, ge=1, le=200),
+    status: Optional[DealStatusEnum] = None,
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_organization_context),
+    db: AsyncSession = Depends(get_db),
+):
+    await check_organization_member(current_user, organization_id, db)
+
+    service = DealService(db)
+    return await service.get_board(organization_id, sort, limit, status, cursor)
+
+
 @router.post("", response_model=DealResponse, status_code=status.HTTP_201_CREATED)
 async def create_deal(
     request: DealCreate,
@@ -67,9 +107,55 @@ async def create_deal(
         )
 
 
+@router.post("/bulk", response_model=BulkResponse)
+async def bulk_create_deals(
+    request: DealBulkCreate,
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_organization_context),
+    db: AsyncSession = Depends(get_db),
+):
+    await check_organization_member(current_user, organization_id, db)
+
+    service = DealService(db)
+    return await service.bulk_create_deals(
+        organization_id, [item.model_dump() for item in request.items]
+    )
+
+
+@router.patch("/bulk", response_model=BulkResponse)
+async def bulk_update_deals(
+    request: DealBulkUpdate,
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_organization_context),
+    db: AsyncSession = Depends(get_db),
+):
+    await check_organization_member(current_user, organization_id, db)
+
+    service = DealService(db)
+    return await service.bulk_update_deals(
+        organization_id,
+        [item.model_dump(exclude_unset=True) for item in request.items],
+        current_user.id,
+    )
+
+
+@router.post("/bulk/delete", response_model=BulkResponse)
+async def bulk_delete_deals(
+    request: BulkDeleteRequest,
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_organization_context),
+    db: AsyncSession = Depends(get_db),
+):
+    await check_organization_member(current_user, organization_id, db)
+
+    service = DealService(db)
+    return await service.bulk_delete_deals(organization_id, request.ids)
+
+
 @router.get("/{deal_id}", response_model=DealResponse)
 async def get_deal(
     deal_id: UUID,
+    response: Response,
     current_user: User = Depends(get_current_user),
     organization_id: UUID = Depends(get_organization_context),
     db: AsyncSession = Depends(get_db),
@@ -85,13 +171,16 @@ async def get_deal(
             detail="Deal not found",
         )
 
+    set_etag(response, deal)
     return deal
 
 
 @router.patch("/{deal_id}", response_model=DealResponse)
 async def update_deal(
     deal_id: UUID,
+    response: Response,
     request: DealUpdate,
+    version: Optional[int] = Depends(get_expected_version),
     current_user: User = Depends(get_current_user),
     organization_id: UUID = Depends(get_organization_context),
     db: AsyncSession = Depends(get_db),
@@ -102,12 +191,13 @@ async def update_deal(
     updates = request.model_dump(exclude_unset=True)
 
     try:
-        deal = await service.update_deal(deal_id, updates)
+        deal = await service.update_deal(deal_id, updates, current_user.id, version)
         if deal is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Deal not found",
             )
+        set_etag(response, deal)
         return deal
     except BadRequest as e:
         raise HTTPException(
@@ -119,7 +209,9 @@ async def update_deal(
 @router.post("/{deal_id}/status", response_model=DealResponse)
 async def change_deal_status(
     deal_id: UUID,
+    response: Response,
     request: DealStatusChange,
+    version: Optional[int] = Depends(get_expected_version),
     current_user: User = Depends(get_current_user),
     organization_id: UUID = Depends(get_organization_context),
     db: AsyncSession = Depends(get_db),
@@ -129,7 +221,9 @@ async def change_deal_status(
     service = DealService(db)
     try:
         status_enum = DealStatusEnum[request.status.upper()]
-        deal = await service.change_deal_status(deal_id, status_enum, current_user.id)
+        deal = await service.change_deal_status(
+            deal_id, status_enum, current_user.id, version
+        )
 
         if deal is None:
             raise HTTPException(
@@ -137,6 +231,7 @@ async def change_deal_status(
                 detail="Deal not found",
             )
 
+        set_etag(response, deal)
         return deal
     except BadRequest as e:
         raise HTTPException(
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+
+from app.database import get_db
+from app.models import User
+from app.api.v1.dependencies import get_current_user, get_organization_context, check_organization_member
+from app.services import ExportService
+from app.services.export_service import EXPORT_MEDIA_TYPES, ExportFormat, ExportResource
+
+router = APIRouter(prefix="/exports", tags=["exports"])
+
+
+@router.get("/{resource}", response_class=StreamingResponse)
+async def export_resource(
+    resource: ExportResource,
+    format: ExportFormat = Query(ExportFormat.NDJSON),
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_organization_context),
+    db: AsyncSession = Depends(get_db),
+):
+    await check_organization_member(current_user, organization_id, db)
+
+    service = ExportService(db)
+    return StreamingResponse(
+        service.export(resource, organization_id, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{resource.value}.{format.value}"',
+        },
+    )
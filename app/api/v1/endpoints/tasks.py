@@ -1,23 +1,41 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from typing import Optional, List
 
 from app.database import get_db
 from app.models import User, TaskStatusEnum
-from app.api.v1.dependencies import get_current_user, get_organization_context, check_organization_member
-from app.api.v1.schemas import TaskCreate, TaskUpdate, TaskStatusChange, TaskResponse
+from app.api.v1.dependencies import (
+    check_organization_member,
+    get_current_user,
+    get_expected_version,
+    get_organization_context,
+)
+from app.api.v1.schemas import (
+    TaskCreate,
+    TaskUpdate,
+    TaskStatusChange,
+    TaskResponse,
+    TaskBulkCreate,
+    TaskBulkUpdate,
+    BulkDeleteRequest,
+    BulkResponse,
+)
 from app.services import TaskService
 from app.core.exceptions import BadRequest, Forbidden
 from app.core.permissions import Role
+from app.core.pagination import set_next_cursor
+from app.core.versioning import set_etag
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
 @router.get("", response_model=List[TaskResponse])
 async def list_tasks(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     status: Optional[str] = None,
     search: Optional[str] = None,
     current_user: User = Depends(get_current_user),
@@ -29,19 +47,25 @@ async def list_tasks(
     service = TaskService(db)
 
     if search:
-        tasks = await service.search_tasks(organization_id, search, skip, limit)
-    elif status:
+        return await service.search_tasks(organization_id, search, skip, limit)
+
+    if status:
         try:
             status_enum = TaskStatusEnum[status.upper()]
-            tasks = await service.list_tasks_for_user(organization_id, current_user.id, skip, limit)
+            tasks = await service.list_tasks_for_user(
+                organization_id, current_user.id, skip, limit, cursor
+            )
         except KeyError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid status",
             )
     else:
-        tasks = await service.list_tasks_for_user(organization_id, current_user.id, skip, limit)
+        tasks = await service.list_tasks_for_user(
+            organization_id, current_user.id, skip, limit, cursor
+        )
 
+    set_next_cursor(response, tasks, limit)
     return tasks
 
 
@@ -68,9 +92,58 @@ async def create_task(
         )
 
 
+@router.post("/bulk", response_model=BulkResponse)
+async def bulk_create_tasks(
+    request: TaskBulkCreate,
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_organization_context),
+    db: AsyncSession = Depends(get_db),
+):
+    await check_organization_member(current_user, organization_id, db)
+
+    service = TaskService(db)
+    return await service.bulk_create_tasks(
+        organization_id, [item.model_dump() for item in request.items]
+    )
+
+
+@router.patch("/bulk", response_model=BulkResponse)
+async def bulk_update_tasks(
+    request: TaskBulkUpdate,
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_organization_context),
+    db: AsyncSession = Depends(get_db),
+):
+    org_member = await check_organization_member(current_user, organization_id, db)
+    user_role = Role(org_member.role)
+
+    service = TaskService(db)
+    return await service.bulk_update_tasks(
+        organization_id,
+        [item.model_dump(exclude_unset=True) for item in request.items],
+        current_user.id,
+        user_role,
+    )
+
+
+@router.post("/bulk/delete", response_model=BulkResponse)
+async def bulk_delete_tasks(
+    request: BulkDeleteRequest,
+    current_user: User = Depends(get_current_user),
+    organization_id: UUID = Depends(get_organization_context),
+    db: AsyncSession = Depends(get_db),
+):
+    org_member = await check_organization_member(current_user, organization_id, db)
+    user_role = Role(org_member.role)
+
+    service = TaskService(db)
+    return await service.bulk_delete_tasks(organization_id, request.ids, current_user.id, user_role)
+
+
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: UUID,
+    response: Response,
     current_user: User = Depends(get_current_user),
     organization_id: UUID = Depends(get_organization_context),
     db: AsyncSession = Depends(get_db),
@@ -86,19 +159,20 @@ async def get_task(
             detail="Task not found",
         )
 
+    set_etag(response, task)
     return task
 
 
 @router.patch("/{task_id}", response_model=TaskResponse)
 async def update_task(
     task_id: UUID,
+    response: Response,
     request: TaskUpdate,
+    version: Optional[int] = Depends(get_expected_version),
     current_user: User = Depends(get_current_user),
     organization_id: UUID = Depends(get_organization_context),
     db: AsyncSession = Depends(get_db),
 ):
-    await check_organization_member(current_user, organization_id, db)
-
     org_member = await check_organization_member(current_user, organization_id, db)
     user_role = Role(org_member.role)
 
@@ -106,12 +180,15 @@ async def update_task(
     updates = request.model_dump(exclude_unset=True)
 
     try:
-        task = await service.update_task(task_id, updates, current_user.id, user_role)
+        task = await service.update_task(
+            task_id, updates, current_user.id, user_role, version
+        )
         if task is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Task not found",
             )
+        set_etag(response, task)
         return task
     except (BadRequest, Forbidden) as e:
         raise HTTPException(
@@ -123,23 +200,24 @@ async def update_task(
 @router.post("/{task_id}/complete", response_model=TaskResponse)
 async def complete_task(
     task_id: UUID,
+    response: Response,
+    version: Optional[int] = Depends(get_expected_version),
     current_user: User = Depends(get_current_user),
     organization_id: UUID = Depends(get_organization_context),
     db: AsyncSession = Depends(get_db),
 ):
-    await check_organization_member(current_user, organization_id, db)
-
     org_member = await check_organization_member(current_user, organization_id, db)
     user_role = Role(org_member.role)
 
     service = TaskService(db)
     try:
-        task = await service.complete_task(task_id, current_user.id, user_role)
+        task = await service.complete_task(task_id, current_user.id, user_role, version)
         if task is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Task not found",
             )
+        set_etag(response, task)
         return task
     except Forbidden as e:
         raise HTTPException(
@@ -155,8 +233,6 @@ async def delete_task(
     organization_id: UUID = Depends(get_organization_context),
     db: AsyncSession = Depends(get_db),
 ):
-    await check_organization_member(current_user, organization_id, db)
-
     org_member = await check_organization_member(current_user, organization_id, db)
     user_role = Role(org_member.role)
 
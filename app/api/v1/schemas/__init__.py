@@ -6,6 +6,11 @@ from app.api.v1.schemas.auth import (
     UserResponse,
     ChangePasswordRequest,
 )
+from app.api.v1.schemas.bulk import (
+    BulkDeleteRequest,
+    BulkItemResult,
+    BulkResponse,
+)
 from app.api.v1.schemas.organization import (
     OrganizationCreate,
     OrganizationUpdate,
@@ -15,17 +20,30 @@ from app.api.v1.schemas.organization import (
 from app.api.v1.schemas.contact import (
     ContactCreate,
     ContactUpdate,
+    ContactBulkCreate,
+    ContactBulkUpdate,
+    ContactBulkUpdateItem,
     ContactResponse,
+    ContactImportRowError,
+    ContactImportJobResponse,
+    ContactTimelineEvent,
 )
 from app.api.v1.schemas.deal import (
     DealCreate,
     DealUpdate,
+    DealBulkCreate,
+    DealBulkUpdate,
+    DealBulkUpdateItem,
     DealStatusChange,
     DealResponse,
+    DealBoardColumn,
 )
 from app.api.v1.schemas.task import (
     TaskCreate,
     TaskUpdate,
+    TaskBulkCreate,
+    TaskBulkUpdate,
+    TaskBulkUpdateItem,
     TaskStatusChange,
     TaskResponse,
 )
@@ -41,19 +59,35 @@ __all__ = [
     "RefreshTokenRequest",
     "UserResponse",
     "ChangePasswordRequest",
+    "BulkDeleteRequest",
+    "BulkItemResult",
+    "BulkResponse",
     "OrganizationCreate",
     "OrganizationUpdate",
     "OrganizationResponse",
     "OrganizationMemberResponse",
     "ContactCreate",
     "ContactUpdate",
+    "ContactBulkCreate",
+    "ContactBulkUpdate",
+    "ContactBulkUpdateItem",
     "ContactResponse",
+    "ContactImportRowError",
+    "ContactImportJobResponse",
+    "ContactTimelineEvent",
     "DealCreate",
     "DealUpdate",
+    "DealBulkCreate",
+    "DealBulkUpdate",
+    "DealBulkUpdateItem",
     "DealStatusChange",
     "DealResponse",
+    "DealBoardColumn",
     "TaskCreate",
     "TaskUpdate",
+    "TaskBulkCreate",
+    "TaskBulkUpdate",
+    "TaskBulkUpdateItem",
     "TaskStatusChange",
     "TaskResponse",
     "ActivityCreate",
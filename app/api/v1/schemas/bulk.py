@@ -0,0 +1,22 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from uuid import UUID
+
+BULK_MAX_ITEMS = 1000
+
+
+class BulkDeleteRequest(BaseModel):
+    ids: List[UUID] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    status: str
+    id: Optional[UUID] = None
+    error: Optional[str] = None
+
+
+class BulkResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[BulkItemResult]
@@ -1,8 +1,10 @@
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
+from app.api.v1.schemas.bulk import BULK_MAX_ITEMS
+
 
 class ContactCreate(BaseModel):
     first_name: str = Field(..., max_length=100)
@@ -32,6 +34,18 @@ class ContactUpdate(BaseModel):
     notes: Optional[str] = None
 
 
+class ContactBulkCreate(BaseModel):
+    items: List[ContactCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class ContactBulkUpdateItem(ContactUpdate):
+    id: UUID
+
+
+class ContactBulkUpdate(BaseModel):
+    items: List[ContactBulkUpdateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
 class ContactResponse(BaseModel):
     id: UUID
     organization_id: UUID
@@ -49,6 +63,37 @@ class ContactResponse(BaseModel):
     is_active: bool
     created_at: datetime
     updated_at: datetime
+    version: int
+
+    class Config:
+        from_attributes = True
+
+
+class ContactImportRowError(BaseModel):
+    row: int
+    errors: List[str]
+
+
+class ContactImportJobResponse(BaseModel):
+    id: UUID
+    status: str
+    processed: int
+    imported: int
+    skipped: int
+    failed: int
+    errors: List[ContactImportRowError]
+    error: Optional[str]
+    created_at: datetime
+    finished_at: Optional[datetime]
 
     class Config:
         from_attributes = True
+
+
+class ContactTimelineEvent(BaseModel):
+    kind: str
+    occurred_at: datetime
+    id: UUID
+    title: str
+    detail: Optional[str]
+    deal_id: Optional[UUID]
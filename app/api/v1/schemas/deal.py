@@ -1,9 +1,11 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 from decimal import Decimal
 
+from app.api.v1.schemas.bulk import BULK_MAX_ITEMS
+
 
 class DealCreate(BaseModel):
     contact_id: UUID
@@ -23,6 +25,18 @@ class DealUpdate(BaseModel):
     expected_close_date: Optional[datetime] = None
 
 
+class DealBulkCreate(BaseModel):
+    items: List[DealCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class DealBulkUpdateItem(DealUpdate):
+    id: UUID
+
+
+class DealBulkUpdate(BaseModel):
+    items: List[DealBulkUpdateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
 class DealStatusChange(BaseModel):
     status: str = Field(..., pattern="^(new|in_progress|won|lost|closed)$")
 
@@ -40,6 +54,15 @@ class DealResponse(BaseModel):
     closed_date: Optional[datetime]
     created_at: datetime
     updated_at: datetime
+    version: int
 
     class Config:
         from_attributes = True
+
+
+class DealBoardColumn(BaseModel):
+    status: str
+    count: int
+    total_amount: Decimal
+    deals: List[DealResponse]
+    next_cursor: Optional[str]
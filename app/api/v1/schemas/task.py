@@ -1,8 +1,10 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
+from app.api.v1.schemas.bulk import BULK_MAX_ITEMS
+
 
 class TaskCreate(BaseModel):
     contact_id: Optional[UUID] = None
@@ -25,6 +27,18 @@ class TaskUpdate(BaseModel):
     due_date: Optional[datetime] = None
 
 
+class TaskBulkCreate(BaseModel):
+    items: List[TaskCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class TaskBulkUpdateItem(TaskUpdate):
+    id: UUID
+
+
+class TaskBulkUpdate(BaseModel):
+    items: List[TaskBulkUpdateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
 class TaskStatusChange(BaseModel):
     status: str = Field(..., pattern="^(todo|in_progress|done|cancelled)$")
 
@@ -43,6 +57,7 @@ class TaskResponse(BaseModel):
     completed_at: Optional[datetime]
     created_at: datetime
     updated_at: datetime
+    version: int
 
     class Config:
         from_attributes = True
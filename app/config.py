@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Optional
 
 
 class Settings(BaseSettings):
@@ -11,6 +12,39 @@ class Settings(BaseSettings):
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
     LOG_LEVEL: str = "INFO"
+    PASSWORD_HASH_EXECUTOR: str = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS: float = 5.0
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 30.0
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    SEARCH_SIMILARITY_THRESHOLD: float = 0.4
+    IMPORT_CHUNK_SIZE: int = 5000
+    IMPORT_MAX_ROW_ERRORS: int = 1000
+    IMPORT_JOB_TTL_SECONDS: float = 86400.0
+    EXPORT_BATCH_SIZE: int = 1000
+    DASHBOARD_SECTION_TIMEOUT_SECONDS: float = 2.0
+    ANALYTICS_CACHE_TTL_SECONDS: float = 10.0
+    ANALYTICS_CACHE_STALE_SECONDS: float = 60.0
+    ANALYTICS_CACHE_MAX_SIZE: int = 10000
+    ANALYTICS_TIMESERIES_DEFAULT_DAYS: int = 30
+    ANALYTICS_TIMESERIES_MAX_BUCKETS: int = 1000
+    ANALYTICS_FUNNEL_DEFAULT_DAYS: int = 90
+    ROLLUP_REFRESH_LOOKBACK_DAYS: int = 2
+    ROLLUP_BACKFILL_CHUNK_DAYS: int = 7
+    ACTIVITY_INGEST_BUFFERED: bool = False
+    ACTIVITY_INGEST_BATCH_SIZE: int = 500
+    ACTIVITY_INGEST_FLUSH_INTERVAL_SECONDS: float = 0.05
+    ACTIVITY_INGEST_MAX_PENDING: int = 10000
+    ACTIVITY_INGEST_QUEUE_TIMEOUT_SECONDS: float = 1.0
+    ACTIVITY_RECENT_WINDOW_DAYS: int = 31
+    ACTIVITY_PARTITIONS_AHEAD: int = 3
+    ACTIVITY_RETENTION_MONTHS: int = 24
+    ACTIVITY_ARCHIVE_SCHEMA: str = "activities_archive"
+    ACTIVITY_COLD_STORAGE_PATH: Optional[str] = None
+    ACTIVITY_COLD_STORAGE_AFTER_DAYS: int = 365
+    ACTIVITY_COLD_STORAGE_BATCH_SIZE: int = 5000
+    ACTIVITY_COLD_STORAGE_MAX_BATCHES: int = 100
 
     class Config:
         env_file = ".env"
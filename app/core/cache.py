@@ -0,0 +1,141 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        keys = [key for key in self._data if predicate(key)]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class GenerationCounter:
+    def __init__(self):
+        self._generations: Dict[Hashable, int] = {}
+
+    def get(self, key: Hashable) -> int:
+        return self._generations.get(key, 0)
+
+    def bump(self, key: Hashable) -> int:
+        generation = self._generations.get(key, 0) + 1
+        self._generations[key] = generation
+        return generation
+
+    def clear(self) -> None:
+        self._generations.clear()
+
+
+@dataclass
+class _Entry:
+    value: Any
+    generation: int
+    fresh_until: float
+
+
+class StaleWhileRevalidateCache:
+    def __init__(self, maxsize: int = 1024, ttl: float = 10.0, stale_ttl: float = 60.0):
+        self.ttl = ttl
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl + stale_ttl)
+        self._inflight: Dict[Tuple[Hashable, int], "asyncio.Task[Any]"] = {}
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        generation: int,
+        loader: Callable[[], Awaitable[Any]],
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and entry.generation == generation:
+            if entry.fresh_until <= time.monotonic():
+                self._load(key, generation, loader, cacheable)
+            return entry.value
+
+        return await asyncio.shield(self._load(key, generation, loader, cacheable))
+
+    def _load(
+        self,
+        key: Hashable,
+        generation: int,
+        loader: Callable[[], Awaitable[Any]],
+        cacheable: Optional[Callable[[Any], bool]],
+    ) -> "asyncio.Task[Any]":
+        flight = (key, generation)
+        task = self._inflight.get(flight)
+        if task is None:
+            task = asyncio.ensure_future(self._refresh(key, generation, loader, cacheable))
+            task.add_done_callback(_consume_exception)
+            self._inflight[flight] = task
+        return task
+
+    async def _refresh(
+        self,
+        key: Hashable,
+        generation: int,
+        loader: Callable[[], Awaitable[Any]],
+        cacheable: Optional[Callable[[Any], bool]],
+    ) -> Any:
+        try:
+            value = await loader()
+            current = self._entries.get(key)
+            stale = current is not None and current.generation > generation
+            if not stale and (cacheable is None or cacheable(value)):
+                self._entries.set(
+                    key, _Entry(value, generation, time.monotonic() + self.ttl)
+                )
+            return value
+        finally:
+            self._inflight.pop((key, generation), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _consume_exception(task: "asyncio.Task[Any]") -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+_MISSING = object()
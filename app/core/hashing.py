@@ -0,0 +1,87 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+from app.config import get_settings
+from app.core.exceptions import ServiceUnavailable
+from app.core.security import hash_password, verify_password
+
+
+class PasswordHasher:
+    def __init__(
+        self,
+        executor_type: str = "thread",
+        max_workers: int = 4,
+        max_pending: Optional[int] = None,
+        queue_timeout: float = 5.0,
+    ):
+        self.executor = self._create_executor(executor_type, max_workers)
+        self.max_pending = max_pending or max_workers * 4
+        self.queue_timeout = queue_timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    @staticmethod
+    def _create_executor(executor_type: str, max_workers: int) -> Executor:
+        if executor_type == "thread":
+            return ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="password-hasher"
+            )
+        if executor_type == "process":
+            return ProcessPoolExecutor(max_workers=max_workers)
+        raise ValueError(f"Unknown password hash executor: {executor_type}")
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.max_pending)
+        return self._slots
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        slots = self._get_slots()
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise ServiceUnavailable("Too many concurrent authentication requests")
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            slots.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+@lru_cache()
+def get_password_hasher() -> PasswordHasher:
+    settings = get_settings()
+    return PasswordHasher(
+        executor_type=settings.PASSWORD_HASH_EXECUTOR,
+        max_workers=settings.PASSWORD_HASH_WORKERS,
+        max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+        queue_timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS,
+    )
+
+
+def shutdown_password_hasher() -> None:
+    if get_password_hasher.cache_info().currsize:
+        get_password_hasher().shutdown()
+        get_password_hasher.cache_clear()
+
+
+async def hash_password_async(password: str) -> str:
+    return await get_password_hasher().hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await get_password_hasher().verify(plain_password, hashed_password)
@@ -0,0 +1,58 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from decimal import InvalidOperation
+from typing import Any, Callable, Optional, Sequence, Tuple
+from uuid import UUID
+from fastapi import Response
+
+from app.core.exceptions import BadRequest
+
+CURSOR_HEADER = "X-Next-Cursor"
+KEYSET_KINDS = (datetime, UUID)
+
+
+def _serialize(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _parse(kind: Callable[[str], Any], value: Any) -> Any:
+    if value is None:
+        return None
+    if kind is datetime:
+        return datetime.fromisoformat(value)
+    return kind(value)
+
+
+def encode_cursor(*values: Any) -> str:
+    payload = json.dumps([_serialize(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, *kinds: Callable[[str], Any]) -> Tuple[Any, ...]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(kinds):
+            raise ValueError("cursor arity mismatch")
+        return tuple(_parse(kind, value) for kind, value in zip(kinds, values))
+    except (ValueError, TypeError, InvalidOperation, binascii.Error, UnicodeError):
+        raise BadRequest("Invalid pagination cursor")
+
+
+def next_page_cursor(items: Sequence[Any], limit: int) -> Optional[str]:
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(last.created_at, last.id)
+
+
+def set_next_cursor(response: Response, items: Sequence[Any], limit: int) -> None:
+    cursor = next_page_cursor(items, limit)
+    if cursor is not None:
+        response.headers[CURSOR_HEADER] = cursor
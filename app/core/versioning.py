@@ -0,0 +1,26 @@
+from typing import Any, Optional
+from fastapi import Response
+
+from app.core.exceptions import BadRequest
+
+ETAG_HEADER = "ETag"
+
+
+def etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def parse_if_match(value: Optional[str]) -> Optional[int]:
+    if value is None or value.strip() == "*":
+        return None
+    tag = value.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    try:
+        return int(tag.strip('"'))
+    except ValueError:
+        raise BadRequest("Invalid If-Match header")
+
+
+def set_etag(response: Response, obj: Any) -> None:
+    response.headers[ETAG_HEADER] = etag(obj.version)
@@ -12,6 +12,11 @@ engine = create_async_engine(
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    connect_args={
+        "server_settings": {
+            "pg_trgm.word_similarity_threshold": str(settings.SEARCH_SIMILARITY_THRESHOLD),
+        },
+    },
 )
 
 AsyncSessionLocal = sessionmaker(
@@ -0,0 +1,65 @@
+import argparse
+import asyncio
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict
+from uuid import UUID
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.repositories import ActivityRepository
+
+settings = get_settings()
+
+
+async def archive_activities(
+    older_than_days: int = settings.ACTIVITY_COLD_STORAGE_AFTER_DAYS,
+    batch_size: int = settings.ACTIVITY_COLD_STORAGE_BATCH_SIZE,
+    max_batches: int = settings.ACTIVITY_COLD_STORAGE_MAX_BATCHES,
+) -> Dict[UUID, int]:
+    before = datetime.utcnow() - timedelta(days=older_than_days)
+    archived: Dict[UUID, int] = defaultdict(int)
+    async with AsyncSessionLocal() as session:
+        repo = ActivityRepository(session)
+        if repo.archive is None:
+            raise RuntimeError("ACTIVITY_COLD_STORAGE_PATH is not configured")
+
+        batches = 0
+        for organization_id in await repo.organizations_with_activities_before(before):
+            while batches < max_batches:
+                moved = await repo.archive_before(organization_id, before, batch_size)
+                if moved:
+                    archived[organization_id] += moved
+                    batches += 1
+                if moved < batch_size:
+                    break
+    return dict(archived)
+
+
+async def main(args):
+    while True:
+        archived = await archive_activities(args.older_than_days, args.batch_size, args.max_batches)
+        print(
+            f"activities: archived {sum(archived.values())} rows "
+            f"for {len(archived)} organizations"
+        )
+        if args.interval is None:
+            return
+        await asyncio.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Move aged activities into compressed cold-storage segments"
+    )
+    parser.add_argument(
+        "--older-than-days", type=int, default=settings.ACTIVITY_COLD_STORAGE_AFTER_DAYS
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.ACTIVITY_COLD_STORAGE_BATCH_SIZE
+    )
+    parser.add_argument(
+        "--max-batches", type=int, default=settings.ACTIVITY_COLD_STORAGE_MAX_BATCHES
+    )
+    parser.add_argument("--interval", type=float, default=None)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,55 @@
+import argparse
+import asyncio
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, Optional, Tuple
+from uuid import UUID
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.repositories import DailyRollupRepository
+
+settings = get_settings()
+
+
+async def backfill_daily_rollups(
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    chunk_days: int = settings.ROLLUP_BACKFILL_CHUNK_DAYS,
+    organization_id: Optional[UUID] = None,
+) -> AsyncIterator[Tuple[date, date, int]]:
+    end = end or datetime.utcnow().date() + timedelta(days=1)
+    if start is None:
+        async with AsyncSessionLocal() as session:
+            start = await DailyRollupRepository(session).earliest_day(organization_id)
+        if start is None:
+            return
+
+    while start < end:
+        chunk_end = min(start + timedelta(days=chunk_days), end)
+        async with AsyncSessionLocal() as session:
+            written = await DailyRollupRepository(session).rebuild(
+                start, chunk_end, organization_id
+            )
+        yield start, chunk_end, written
+        start = chunk_end
+
+
+async def main(args):
+    chunks = backfill_daily_rollups(
+        args.start, args.end, args.chunk_days, args.organization_id
+    )
+    async for start, end, written in chunks:
+        print(f"daily_rollups: {start} .. {end} rebuilt, {written} rows")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Rebuild daily rollups for a date range in bounded chunks"
+    )
+    parser.add_argument("--start", type=date.fromisoformat, default=None)
+    parser.add_argument("--end", type=date.fromisoformat, default=None)
+    parser.add_argument(
+        "--chunk-days", type=int, default=settings.ROLLUP_BACKFILL_CHUNK_DAYS
+    )
+    parser.add_argument("--organization-id", type=UUID, default=None)
+    asyncio.run(main(parser.parse_args()))
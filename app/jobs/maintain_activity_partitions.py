@@ -0,0 +1,91 @@
+import argparse
+import asyncio
+from datetime import date, datetime, time
+from typing import List, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal, engine
+from app.repositories import ActivityRepository
+from app.repositories.activity_repository import PARTITION_PREFIX, month_start
+
+settings = get_settings()
+
+
+async def maintain_partitions(
+    repo: ActivityRepository,
+    retiring: ActivityRepository,
+    this_month: date,
+    months_ahead: int,
+    cutoff: datetime,
+    archive_schema: str,
+) -> Tuple[List[str], List[str]]:
+    partitions = await repo.partitions()
+    legacy_upper = max(
+        (
+            upper for name, upper in partitions
+            if upper is not None and not name.startswith(PARTITION_PREFIX)
+        ),
+        default=None,
+    )
+
+    created = []
+    for offset in range(months_ahead + 1):
+        month = month_start(this_month, offset)
+        if legacy_upper is not None and datetime.combine(month, time.min) < legacy_upper:
+            continue
+        created.append(await repo.create_partition(month))
+
+    for name, upper in partitions:
+        if upper is not None and upper <= cutoff:
+            await repo.detach_partition(name)
+
+    archived = await repo.detached_partitions()
+    for name in archived:
+        await retiring.retire_partition(name, archive_schema)
+    return created, archived
+
+
+async def maintain_activity_partitions(
+    months_ahead: int = settings.ACTIVITY_PARTITIONS_AHEAD,
+    retention_months: int = settings.ACTIVITY_RETENTION_MONTHS,
+    archive_schema: str = settings.ACTIVITY_ARCHIVE_SCHEMA,
+) -> Tuple[List[str], List[str]]:
+    this_month = month_start(datetime.utcnow().date())
+    cutoff = datetime.combine(month_start(this_month, -retention_months), time.min)
+    async with engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        async with AsyncSession(connection) as session, AsyncSessionLocal() as retiring:
+            return await maintain_partitions(
+                ActivityRepository(session),
+                ActivityRepository(retiring),
+                this_month,
+                months_ahead,
+                cutoff,
+                archive_schema,
+            )
+
+
+async def main(args):
+    while True:
+        created, archived = await maintain_activity_partitions(
+            args.months_ahead, args.retention_months, args.archive_schema
+        )
+        print(f"activities: {len(created)} partitions ensured, archived {archived or 'none'}")
+        if args.interval is None:
+            return
+        await asyncio.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Create upcoming monthly activity partitions and archive expired ones"
+    )
+    parser.add_argument("--months-ahead", type=int, default=settings.ACTIVITY_PARTITIONS_AHEAD)
+    parser.add_argument(
+        "--retention-months", type=int, default=settings.ACTIVITY_RETENTION_MONTHS
+    )
+    parser.add_argument("--archive-schema", default=settings.ACTIVITY_ARCHIVE_SCHEMA)
+    parser.add_argument("--interval", type=float, default=None)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,30 @@
+import argparse
+import asyncio
+from typing import Optional
+from uuid import UUID
+
+from app.database import AsyncSessionLocal
+from app.repositories import OrganizationStatsRepository
+
+
+async def reconcile_org_stats(organization_id: Optional[UUID] = None) -> int:
+    async with AsyncSessionLocal() as session:
+        return await OrganizationStatsRepository(session).reconcile(organization_id)
+
+
+async def main(args):
+    while True:
+        repaired = await reconcile_org_stats(args.organization_id)
+        print(f"org_stats: {repaired} organizations repaired")
+        if args.interval is None:
+            return
+        await asyncio.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Recompute per-organization counters and repair drifted rows"
+    )
+    parser.add_argument("--organization-id", type=UUID, default=None)
+    parser.add_argument("--interval", type=float, default=None)
+    asyncio.run(main(parser.parse_args()))
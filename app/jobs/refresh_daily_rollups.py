@@ -0,0 +1,42 @@
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.repositories import DailyRollupRepository
+
+settings = get_settings()
+
+
+async def refresh_daily_rollups(
+    lookback_days: int = settings.ROLLUP_REFRESH_LOOKBACK_DAYS,
+    organization_id: Optional[UUID] = None,
+) -> int:
+    end = datetime.utcnow().date() + timedelta(days=1)
+    start = end - timedelta(days=lookback_days + 1)
+    async with AsyncSessionLocal() as session:
+        return await DailyRollupRepository(session).rebuild(start, end, organization_id)
+
+
+async def main(args):
+    while True:
+        written = await refresh_daily_rollups(args.lookback_days, args.organization_id)
+        print(f"daily_rollups: {written} rows refreshed")
+        if args.interval is None:
+            return
+        await asyncio.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Recompute daily rollups for today and the last few days"
+    )
+    parser.add_argument(
+        "--lookback-days", type=int, default=settings.ROLLUP_REFRESH_LOOKBACK_DAYS
+    )
+    parser.add_argument("--organization-id", type=UUID, default=None)
+    parser.add_argument("--interval", type=float, default=None)
+    asyncio.run(main(parser.parse_args()))
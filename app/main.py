@@ -10,6 +10,7 @@ from app.api.v1.endpoints import (
     tasks_router,
     activities_router,
     analytics_router,
+    exports_router,
 )
 from app.core.exceptions import (
     NotFound,
@@ -18,6 +19,14 @@ from app.core.exceptions import (
     BadRequest,
     Conflict,
     InternalServerError,
+    ServiceUnavailable,
+)
+from app.core.hashing import shutdown_password_hasher
+from app.core.pagination import CURSOR_HEADER
+from app.core.versioning import ETAG_HEADER
+from app.services.activity_ingestor import (
+    activity_ingest_metrics,
+    shutdown_activity_ingestors,
 )
 
 app = FastAPI(
@@ -55,6 +64,10 @@ app = FastAPI(
         {
             "name": "analytics",
             "description": "Аналитика и отчеты по сделкам, задачам и активностям"
+        },
+        {
+            "name": "exports",
+            "description": "Потоковая выгрузка данных в NDJSON и CSV"
         }
     ]
 )
@@ -67,6 +80,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[CURSOR_HEADER, ETAG_HEADER],
 )
 
 
@@ -118,6 +132,21 @@ async def internal_server_error_handler(request: Request, exc: InternalServerErr
     )
 
 
+@app.exception_handler(ServiceUnavailable)
+async def service_unavailable_handler(request: Request, exc: ServiceUnavailable):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc.detail)},
+        headers=exc.headers,
+    )
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await shutdown_activity_ingestors()
+    shutdown_password_hasher()
+
+
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(organizations_router, prefix="/api/v1")
 app.include_router(contacts_router, prefix="/api/v1")
@@ -125,6 +154,7 @@ app.include_router(deals_router, prefix="/api/v1")
 app.include_router(tasks_router, prefix="/api/v1")
 app.include_router(activities_router, prefix="/api/v1")
 app.include_router(analytics_router, prefix="/api/v1")
+app.include_router(exports_router, prefix="/api/v1")
 
 
 @app.get("/health", tags=["health"])
@@ -140,7 +170,8 @@ async def health_check():
 async def readiness_check():
     return {
         "ready": True,
-        "service": "CRM API"
+        "service": "CRM API",
+        "activity_ingest": activity_ingest_metrics(),
     }
 
 
@@ -2,8 +2,13 @@ from app.models.organization import Organization
 from app.models.user import User, OrganizationMember, RoleEnum
 from app.models.contact import Contact
 from app.models.deal import Deal, DealStatusEnum
+from app.models.deal_status_transition import DealStatusTransition
 from app.models.task import Task, TaskStatusEnum, TaskPriorityEnum
 from app.models.activity import Activity, ActivityTypeEnum
+from app.models.organization_stats import OrganizationStats
+from app.models.daily_rollup import DailyRollup
+from app.models.archived_activity_count import ArchivedActivityCount
+from app.models.search import SEARCH_DOCUMENTS, search_columns
 
 __all__ = [
     "Organization",
@@ -13,9 +18,15 @@ __all__ = [
     "Contact",
     "Deal",
     "DealStatusEnum",
+    "DealStatusTransition",
     "Task",
     "TaskStatusEnum",
     "TaskPriorityEnum",
     "Activity",
     "ActivityTypeEnum",
+    "OrganizationStats",
+    "DailyRollup",
+    "ArchivedActivityCount",
+    "SEARCH_DOCUMENTS",
+    "search_columns",
 ]
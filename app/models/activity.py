@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -17,6 +17,23 @@ class ActivityTypeEnum(str, enum.Enum):
 
 class Activity(Base):
     __tablename__ = "activities"
+    __table_args__ = (
+        Index("ix_activities_org_created", "organization_id", "created_at", "id"),
+        Index("ix_activities_created", "created_at"),
+        Index("ix_activities_org_type_created", "organization_id", "activity_type", "created_at", "id"),
+        Index("ix_activities_creator_org_created", "created_by", "organization_id", "created_at", "id"),
+        Index(
+            "ix_activities_contact_created", "contact_id", "created_at", "id",
+            postgresql_where=text("contact_id IS NOT NULL"),
+            sqlite_where=text("contact_id IS NOT NULL"),
+        ),
+        Index(
+            "ix_activities_deal_created", "deal_id", "created_at", "id",
+            postgresql_where=text("deal_id IS NOT NULL"),
+            sqlite_where=text("deal_id IS NOT NULL"),
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
@@ -27,7 +44,7 @@ class Activity(Base):
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     activity_date = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, primary_key=True, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     contact = relationship("Contact", back_populates="activities")
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Date, Enum, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+from app.models.activity import ActivityTypeEnum
+
+archived_activity_type = Enum(ActivityTypeEnum, name="archivedactivitytype")
+
+
+class ArchivedActivityCount(Base):
+    __tablename__ = "archived_activity_counts"
+
+    organization_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day = Column(Date, primary_key=True)
+    activity_type = Column(archived_activity_type, primary_key=True)
+    activities = Column(Integer, nullable=False, default=0, server_default="0")
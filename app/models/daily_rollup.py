@@ -0,0 +1,21 @@
+from datetime import datetime
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, Numeric
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+
+
+class DailyRollup(Base):
+    __tablename__ = "daily_rollups"
+
+    organization_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day = Column(Date, primary_key=True)
+    deals_created = Column(Integer, nullable=False, default=0, server_default="0")
+    deals_won = Column(Integer, nullable=False, default=0, server_default="0")
+    won_amount = Column(Numeric(16, 2), nullable=False, default=0, server_default="0")
+    tasks_completed = Column(Integer, nullable=False, default=0, server_default="0")
+    activities_logged = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey, Numeric, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Numeric, Enum, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -17,6 +17,18 @@ class DealStatusEnum(str, enum.Enum):
 
 class Deal(Base):
     __tablename__ = "deals"
+    __table_args__ = (
+        Index("ix_deals_org_created", "organization_id", "created_at", "id"),
+        Index("ix_deals_org_status_created", "organization_id", "status", "created_at", "id"),
+        Index("ix_deals_assigned_org_created", "assigned_to", "organization_id", "created_at", "id"),
+        Index("ix_deals_contact_created", "contact_id", "created_at", "id"),
+        Index("ix_deals_created", "created_at"),
+        Index(
+            "ix_deals_closed_date", "closed_date",
+            postgresql_where=text("closed_date IS NOT NULL"),
+            sqlite_where=text("closed_date IS NOT NULL"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
@@ -30,6 +42,7 @@ class Deal(Base):
     closed_date = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    version = Column(Integer, nullable=False, default=1, server_default=text("1"))
 
     contact = relationship("Contact", back_populates="deals")
     activities = relationship("Activity", back_populates="deal")
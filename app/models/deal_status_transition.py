@@ -0,0 +1,35 @@
+from datetime import datetime
+from sqlalchemy import Column, DateTime, ForeignKey, Numeric, Enum, Index
+from sqlalchemy.dialects.postgresql import UUID
+import uuid
+from app.database import Base
+from app.models.deal import DealStatusEnum
+
+transition_status = Enum(DealStatusEnum, name="dealtransitionstatus")
+
+
+class DealStatusTransition(Base):
+    __tablename__ = "deal_status_transitions"
+    __table_args__ = (
+        Index("ix_deal_status_transitions_deal_changed", "deal_id", "changed_at"),
+        Index("ix_deal_status_transitions_org_changed", "organization_id", "changed_at"),
+        Index(
+            "ix_deal_status_transitions_org_to_changed",
+            "organization_id", "to_status", "changed_at",
+        ),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    organization_id = Column(
+        UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
+    )
+    deal_id = Column(
+        UUID(as_uuid=True), ForeignKey("deals.id", ondelete="CASCADE"), nullable=False
+    )
+    from_status = Column(transition_status, nullable=False)
+    to_status = Column(transition_status, nullable=False)
+    changed_by = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+    )
+    amount = Column(Numeric(12, 2), nullable=True)
+    changed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
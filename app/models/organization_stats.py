@@ -0,0 +1,35 @@
+from datetime import datetime
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, Numeric
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+
+
+class OrganizationStats(Base):
+    __tablename__ = "org_stats"
+
+    organization_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    contacts_total = Column(Integer, nullable=False, default=0, server_default="0")
+    deals_total = Column(Integer, nullable=False, default=0, server_default="0")
+    deals_new = Column(Integer, nullable=False, default=0, server_default="0")
+    deals_in_progress = Column(Integer, nullable=False, default=0, server_default="0")
+    deals_won = Column(Integer, nullable=False, default=0, server_default="0")
+    deals_lost = Column(Integer, nullable=False, default=0, server_default="0")
+    deals_closed = Column(Integer, nullable=False, default=0, server_default="0")
+    won_amount = Column(Numeric(16, 2), nullable=False, default=0, server_default="0")
+    pipeline_amount = Column(Numeric(16, 2), nullable=False, default=0, server_default="0")
+    tasks_total = Column(Integer, nullable=False, default=0, server_default="0")
+    tasks_todo = Column(Integer, nullable=False, default=0, server_default="0")
+    tasks_in_progress = Column(Integer, nullable=False, default=0, server_default="0")
+    tasks_done = Column(Integer, nullable=False, default=0, server_default="0")
+    tasks_cancelled = Column(Integer, nullable=False, default=0, server_default="0")
+    activities_total = Column(Integer, nullable=False, default=0, server_default="0")
+    activities_call = Column(Integer, nullable=False, default=0, server_default="0")
+    activities_email = Column(Integer, nullable=False, default=0, server_default="0")
+    activities_meeting = Column(Integer, nullable=False, default=0, server_default="0")
+    activities_note = Column(Integer, nullable=False, default=0, server_default="0")
+    activities_task = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,78 @@
+from typing import Dict, List, Sequence, Tuple
+from sqlalchemy import DDL, Table, event
+
+from app.database import Base
+from app.models.contact import Contact
+from app.models.deal import Deal
+from app.models.task import Task
+
+SEARCH_VECTOR_COLUMN = "search_vector"
+SEARCH_TEXT_COLUMN = "search_text"
+SEARCH_CONFIG = "simple"
+
+SearchWeights = Sequence[Tuple[str, Sequence[str]]]
+
+SEARCH_DOCUMENTS: Dict[Table, SearchWeights] = {
+    Contact.__table__: (
+        ("A", ("first_name", "last_name")),
+        ("B", ("email", "company")),
+        ("C", ("phone",)),
+    ),
+    Deal.__table__: (
+        ("A", ("title",)),
+        ("B", ("description",)),
+    ),
+    Task.__table__: (
+        ("A", ("title",)),
+        ("B", ("description",)),
+    ),
+}
+
+
+def search_columns(table: Table) -> List[str]:
+    return [column for _, columns in SEARCH_DOCUMENTS[table] for column in columns]
+
+
+def _document(columns: Sequence[str], row: str = "") -> str:
+    return " || ' ' || ".join(f"coalesce({row}{column}, '')" for column in columns)
+
+
+def _search_expressions(table: Table, row: str = "") -> Tuple[str, str]:
+    vector = " || ".join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', {_document(columns, row)}), '{weight}')"
+        for weight, columns in SEARCH_DOCUMENTS[table]
+    )
+    return vector, f"lower({_document(search_columns(table), row)})"
+
+
+def search_ddl(table: Table) -> List[str]:
+    vector, text = _search_expressions(table, "NEW.")
+    function = f"{table.name}_search_document"
+    return [
+        f"ALTER TABLE {table.name} ADD COLUMN {SEARCH_VECTOR_COLUMN} tsvector, "
+        f"ADD COLUMN {SEARCH_TEXT_COLUMN} text",
+        f"CREATE FUNCTION {function}() RETURNS trigger AS $$ "
+        f"BEGIN NEW.{SEARCH_VECTOR_COLUMN} := {vector}; "
+        f"NEW.{SEARCH_TEXT_COLUMN} := {text}; RETURN NEW; END "
+        f"$$ LANGUAGE plpgsql",
+        f"CREATE TRIGGER {function} "
+        f"BEFORE INSERT OR UPDATE OF {', '.join(search_columns(table))} ON {table.name} "
+        f"FOR EACH ROW EXECUTE FUNCTION {function}()",
+        f"CREATE INDEX ix_{table.name}_{SEARCH_VECTOR_COLUMN} "
+        f"ON {table.name} USING gin ({SEARCH_VECTOR_COLUMN})",
+        f"CREATE INDEX ix_{table.name}_{SEARCH_TEXT_COLUMN}_trgm "
+        f"ON {table.name} USING gin ({SEARCH_TEXT_COLUMN} gin_trgm_ops)",
+    ]
+
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+for _table in SEARCH_DOCUMENTS:
+    for _statement in search_ddl(_table):
+        event.listen(
+            _table, "after_create", DDL(_statement).execute_if(dialect="postgresql")
+        )
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Enum, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -23,6 +23,37 @@ class TaskPriorityEnum(str, enum.Enum):
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_org_created", "organization_id", "created_at", "id"),
+        Index("ix_tasks_org_status_created", "organization_id", "status", "created_at", "id"),
+        Index("ix_tasks_org_priority_created", "organization_id", "priority", "created_at", "id"),
+        Index("ix_tasks_assigned_org_created", "assigned_to", "organization_id", "created_at", "id"),
+        Index(
+            "ix_tasks_org_due_date", "organization_id", "due_date",
+            postgresql_where=text("due_date IS NOT NULL"),
+            sqlite_where=text("due_date IS NOT NULL"),
+        ),
+        Index(
+            "ix_tasks_contact_created", "contact_id", "created_at", "id",
+            postgresql_where=text("contact_id IS NOT NULL"),
+            sqlite_where=text("contact_id IS NOT NULL"),
+        ),
+        Index(
+            "ix_tasks_deal_created", "deal_id", "created_at", "id",
+            postgresql_where=text("deal_id IS NOT NULL"),
+            sqlite_where=text("deal_id IS NOT NULL"),
+        ),
+        Index(
+            "ix_tasks_contact_completed", "contact_id", "completed_at", "id",
+            postgresql_where=text("contact_id IS NOT NULL AND completed_at IS NOT NULL"),
+            sqlite_where=text("contact_id IS NOT NULL AND completed_at IS NOT NULL"),
+        ),
+        Index(
+            "ix_tasks_completed_at", "completed_at",
+            postgresql_where=text("completed_at IS NOT NULL"),
+            sqlite_where=text("completed_at IS NOT NULL"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
@@ -37,6 +68,7 @@ class Task(Base):
     completed_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    version = Column(Integer, nullable=False, default=1, server_default=text("1"))
 
     contact = relationship("Contact", back_populates="tasks")
     deal = relationship("Deal", back_populates="tasks")
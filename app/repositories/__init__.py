@@ -3,8 +3,12 @@ from app.repositories.organization_repository import OrganizationRepository
 from app.repositories.user_repository import UserRepository
 from app.repositories.contact_repository import ContactRepository
 from app.repositories.deal_repository import DealRepository
+from app.repositories.deal_status_transition_repository import DealStatusTransitionRepository
 from app.repositories.task_repository import TaskRepository
 from app.repositories.activity_repository import ActivityRepository
+from app.repositories.organization_stats_repository import OrganizationStatsRepository
+from app.repositories.daily_rollup_repository import DailyRollupRepository
+from app.repositories.archived_activity_count_repository import ArchivedActivityCountRepository
 
 __all__ = [
     "BaseRepository",
@@ -12,6 +16,10 @@ __all__ = [
     "UserRepository",
     "ContactRepository",
     "DealRepository",
+    "DealStatusTransitionRepository",
     "TaskRepository",
     "ActivityRepository",
+    "OrganizationStatsRepository",
+    "DailyRollupRepository",
+    "ArchivedActivityCountRepository",
 ]
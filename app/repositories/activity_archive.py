@@ -0,0 +1,209 @@
+import gzip
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum as PyEnum
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from uuid import UUID, uuid4
+from sqlalchemy import Column, DateTime, Enum, Uuid
+
+from app.config import get_settings
+from app.models import Activity
+
+SEGMENT_SUFFIX = ".ndjson.gz"
+INDEX_FILE = "index.json"
+OWNER_KEYS = ("contact_id", "deal_id")
+
+ArchiveKey = Tuple[datetime, UUID]
+
+
+@dataclass
+class Segment:
+    name: str
+    min_created_at: datetime
+    max_created_at: datetime
+    rows: int
+    owners: Optional[Dict[str, FrozenSet[UUID]]] = None
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Segment":
+        owners = data.get("owners")
+        return cls(
+            name=data["name"],
+            min_created_at=datetime.fromisoformat(data["min_created_at"]),
+            max_created_at=datetime.fromisoformat(data["max_created_at"]),
+            rows=data["rows"],
+            owners=(
+                {key: frozenset(UUID(id) for id in ids) for key, ids in owners.items()}
+                if owners is not None else None
+            ),
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        data = {
+            "name": self.name,
+            "min_created_at": self.min_created_at.isoformat(),
+            "max_created_at": self.max_created_at.isoformat(),
+            "rows": self.rows,
+        }
+        if self.owners is not None:
+            data["owners"] = {
+                key: sorted(str(id) for id in ids) for key, ids in self.owners.items()
+            }
+        return data
+
+    def may_contain(self, match: Dict[str, Any]) -> bool:
+        if self.owners is None:
+            return True
+        return all(
+            match[key] in self.owners[key]
+            for key in OWNER_KEYS
+            if key in match and key in self.owners
+        )
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, PyEnum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _decode(column: Column, value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(column.type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column.type, Enum):
+        return column.type.enum_class(value)
+    if isinstance(column.type, Uuid):
+        return UUID(value)
+    return value
+
+
+def _key(activity: Activity) -> ArchiveKey:
+    return activity.created_at, activity.id
+
+
+class ActivityArchive:
+    def __init__(self, root: Path):
+        self.root = root
+        self.columns = list(Activity.__table__.columns)
+        self._indexes: Dict[UUID, Tuple[Tuple[int, int], List[Segment]]] = {}
+
+    def segments(self, organization_id: UUID) -> List[Segment]:
+        path = self.root / str(organization_id) / INDEX_FILE
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return []
+
+        version = (stat.st_ino, stat.st_mtime_ns)
+        cached = self._indexes.get(organization_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        segments = [Segment.from_json(data) for data in json.loads(path.read_text())]
+        self._indexes[organization_id] = (version, segments)
+        return segments
+
+    def append(self, organization_id: UUID, activities: Iterable[Activity]) -> Segment:
+        rows = sorted(activities, key=_key)
+        directory = self.root / str(organization_id)
+        directory.mkdir(parents=True, exist_ok=True)
+        segment = Segment(
+            name=f"{rows[0].created_at:%Y%m%dT%H%M%S}-{uuid4().hex[:8]}{SEGMENT_SUFFIX}",
+            min_created_at=rows[0].created_at,
+            max_created_at=rows[-1].created_at,
+            rows=len(rows),
+            owners={
+                key: frozenset(
+                    getattr(activity, key) for activity in rows
+                    if getattr(activity, key) is not None
+                )
+                for key in OWNER_KEYS
+            },
+        )
+
+        with gzip.open(directory / f"{segment.name}.tmp", "wt", encoding="utf-8") as file:
+            for activity in rows:
+                values = {
+                    column.key: _encode(getattr(activity, column.key)) for column in self.columns
+                }
+                file.write(json.dumps(values, separators=(",", ":")) + "\n")
+        self._publish(directory / f"{segment.name}.tmp", directory / segment.name)
+
+        index = [*self.segments(organization_id), segment]
+        (directory / f"{INDEX_FILE}.tmp").write_text(
+            json.dumps([entry.to_json() for entry in index])
+        )
+        self._publish(directory / f"{INDEX_FILE}.tmp", directory / INDEX_FILE)
+        return segment
+
+    def read(
+        self,
+        organization_id: UUID,
+        limit: int,
+        before: Optional[ArchiveKey] = None,
+        **match: Any,
+    ) -> List[Activity]:
+        segments = sorted(
+            (
+                segment for segment in self.segments(organization_id)
+                if (before is None or segment.min_created_at <= before[0])
+                and segment.may_contain(match)
+            ),
+            key=lambda segment: segment.max_created_at,
+            reverse=True,
+        )
+        found: Dict[UUID, Activity] = {}
+        for segment in segments:
+            if len(found) >= limit:
+                floor = sorted(found.values(), key=_key, reverse=True)[limit - 1].created_at
+                if segment.max_created_at < floor:
+                    break
+            for activity in self._scan(organization_id, segment, before, match):
+                found[activity.id] = activity
+        return sorted(found.values(), key=_key, reverse=True)[:limit]
+
+    def _scan(
+        self,
+        organization_id: UUID,
+        segment: Segment,
+        before: Optional[ArchiveKey],
+        match: Dict[str, Any],
+    ) -> Iterable[Activity]:
+        path = self.root / str(organization_id) / segment.name
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                raw = json.loads(line)
+                values = {
+                    column.key: _decode(column, raw.get(column.key)) for column in self.columns
+                }
+                if before is not None and (values["created_at"], values["id"]) >= before:
+                    continue
+                if all(values[key] == value for key, value in match.items()):
+                    yield Activity(**values)
+
+    @staticmethod
+    def _publish(source: Path, target: Path) -> None:
+        with open(source, "rb") as file:
+            os.fsync(file.fileno())
+        os.replace(source, target)
+
+
+activity_archives: Dict[str, ActivityArchive] = {}
+
+
+def get_activity_archive() -> Optional[ActivityArchive]:
+    path = get_settings().ACTIVITY_COLD_STORAGE_PATH
+    if not path:
+        return None
+    archive = activity_archives.get(path)
+    if archive is None:
+        archive = activity_archives[path] = ActivityArchive(Path(path))
+    return archive
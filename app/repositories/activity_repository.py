@@ -1,109 +1,289 @@
-from typing import List, Optional
+import asyncio
+import re
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, List, Optional, Tuple, Union
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, desc
+from sqlalchemy import Select, select, and_, delete, text
 
-from app.models import Activity, ActivityTypeEnum
+from app.config import get_settings
+from app.core.pagination import KEYSET_KINDS, decode_cursor
+from app.models import Activity, ActivityTypeEnum, Contact, Deal
+from app.repositories.activity_archive import get_activity_archive
+from app.repositories.archived_activity_count_repository import (
+    ArchivedActivityCountRepository,
+)
 from app.repositories.base import BaseRepository
 
+settings = get_settings()
+
+PARTITION_PREFIX = "activities_p"
+LEGACY_PARTITION = "activities_legacy"
+PARTITION_UPPER_BOUND = re.compile(r"TO \('([^']+)'\)")
+
+
+def month_start(day: date, offset: int = 0) -> date:
+    month = day.year * 12 + day.month - 1 + offset
+    return date(month // 12, month % 12 + 1, 1)
+
 
 class ActivityRepository(BaseRepository[Activity]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Activity)
+        self.archive = get_activity_archive()
 
     async def list_by_organization(
-        self, organization_id: UUID, skip: int = 0, limit: int = 100
+        self, organization_id: UUID, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Activity]:
         stmt = select(Activity).where(
             Activity.organization_id == organization_id
-        ).order_by(desc(Activity.created_at)).offset(skip).limit(limit)
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        )
+        return await self._list(stmt, organization_id, skip, limit, cursor)
 
     async def list_by_contact(
-        self, contact_id: UUID, skip: int = 0, limit: int = 100
+        self, contact_id: UUID, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Activity]:
         stmt = select(Activity).where(
             Activity.contact_id == contact_id
-        ).order_by(desc(Activity.created_at)).offset(skip).limit(limit)
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        )
+        return await self._list(
+            stmt, self._owner(Contact, contact_id), skip, limit, cursor, contact_id=contact_id
+        )
 
     async def list_by_deal(
-        self, deal_id: UUID, skip: int = 0, limit: int = 100
+        self, deal_id: UUID, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Activity]:
         stmt = select(Activity).where(
             Activity.deal_id == deal_id
-        ).order_by(desc(Activity.created_at)).offset(skip).limit(limit)
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        )
+        return await self._list(
+            stmt, self._owner(Deal, deal_id), skip, limit, cursor, deal_id=deal_id
+        )
 
     async def list_by_created_by(
-        self, organization_id: UUID, user_id: UUID, skip: int = 0, limit: int = 100
+        self, organization_id: UUID, user_id: UUID, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Activity]:
         stmt = select(Activity).where(
             and_(
                 Activity.organization_id == organization_id,
                 Activity.created_by == user_id
             )
-        ).order_by(desc(Activity.created_at)).offset(skip).limit(limit)
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        )
+        return await self._list(
+            stmt, organization_id, skip, limit, cursor, created_by=user_id
+        )
 
     async def list_by_type(
-        self, organization_id: UUID, activity_type: ActivityTypeEnum, skip: int = 0, limit: int = 100
+        self, organization_id: UUID, activity_type: ActivityTypeEnum, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Activity]:
         stmt = select(Activity).where(
             and_(
                 Activity.organization_id == organization_id,
                 Activity.activity_type == activity_type
             )
-        ).order_by(desc(Activity.created_at)).offset(skip).limit(limit)
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        )
+        return await self._list(
+            stmt, organization_id, skip, limit, cursor, activity_type=activity_type
+        )
 
     async def get_recent_by_organization(
         self, organization_id: UUID, limit: int = 10
     ) -> List[Activity]:
         stmt = select(Activity).where(
             Activity.organization_id == organization_id
-        ).order_by(desc(Activity.created_at)).limit(limit)
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        )
+        activities = await self._recent(stmt, limit)
+        return await self._with_archive(activities, stmt, organization_id, 0, limit)
 
     async def get_recent_by_contact(
         self, contact_id: UUID, limit: int = 10
     ) -> List[Activity]:
         stmt = select(Activity).where(
             Activity.contact_id == contact_id
-        ).order_by(desc(Activity.created_at)).limit(limit)
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        )
+        activities = await self._recent(stmt, limit)
+        return await self._with_archive(
+            activities, stmt, self._owner(Contact, contact_id), 0, limit, contact_id=contact_id
+        )
 
     async def get_recent_by_deal(
         self, deal_id: UUID, limit: int = 10
     ) -> List[Activity]:
         stmt = select(Activity).where(
             Activity.deal_id == deal_id
-        ).order_by(desc(Activity.created_at)).limit(limit)
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        )
+        activities = await self._recent(stmt, limit)
+        return await self._with_archive(
+            activities, stmt, self._owner(Deal, deal_id), 0, limit, deal_id=deal_id
+        )
 
     async def count_by_organization(self, organization_id: UUID) -> int:
-        stmt = select(Activity).where(
-            Activity.organization_id == organization_id
-        )
-        result = await self.session.execute(stmt)
-        return len(result.scalars().all())
+        return await self.count(Activity.organization_id == organization_id)
 
     async def count_by_type(
         self, organization_id: UUID, activity_type: ActivityTypeEnum
     ) -> int:
-        stmt = select(Activity).where(
-            and_(
-                Activity.organization_id == organization_id,
-                Activity.activity_type == activity_type
-            )
+        return await self.count(
+            Activity.organization_id == organization_id,
+            Activity.activity_type == activity_type,
+        )
+
+    async def organizations_with_activities_before(self, before: datetime) -> List[UUID]:
+        stmt = select(Activity.organization_id).where(Activity.created_at < before).distinct()
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def archive_before(
+        self, organization_id: UUID, before: datetime, batch_size: int
+    ) -> int:
+        stmt = (
+            select(Activity)
+            .where(Activity.organization_id == organization_id, Activity.created_at < before)
+            .order_by(Activity.created_at, Activity.id)
+            .limit(batch_size)
         )
         result = await self.session.execute(stmt)
-        return len(result.scalars().all())
+        activities = result.scalars().all()
+        if not activities:
+            return 0
+
+        await asyncio.to_thread(self.archive.append, organization_id, activities)
+        await self.session.execute(
+            delete(Activity).where(Activity.id.in_([activity.id for activity in activities]))
+        )
+        await ArchivedActivityCountRepository(self.session).add(organization_id, [
+            (activity.activity_type, activity.created_at.date(), 1) for activity in activities
+        ])
+        await self.commit()
+        return len(activities)
+
+    async def partitions(self) -> List[Tuple[str, Optional[datetime]]]:
+        result = await self.session.execute(text(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+            "FROM pg_inherits JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = CAST(:parent AS regclass) ORDER BY child.relname"
+        ), {"parent": Activity.__tablename__})
+        partitions = []
+        for name, bound in result.all():
+            upper = PARTITION_UPPER_BOUND.search(bound or "")
+            partitions.append((name, datetime.fromisoformat(upper.group(1)) if upper else None))
+        return partitions
+
+    async def create_partition(self, month: date) -> str:
+        name = f"{PARTITION_PREFIX}{month:%Y%m}"
+        await self.session.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {Activity.__tablename__} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{month_start(month, 1).isoformat()}')"
+        ))
+        await self.commit()
+        return name
+
+    async def detach_partition(self, name: str) -> None:
+        await self.session.execute(text(
+            f"ALTER TABLE {Activity.__tablename__} DETACH PARTITION {name} CONCURRENTLY"
+        ))
+        await self.commit()
+
+    async def detached_partitions(self) -> List[str]:
+        result = await self.session.execute(text(
+            "SELECT relname FROM pg_class "
+            "WHERE relkind = 'r' AND NOT relispartition "
+            "AND relnamespace = CAST(current_schema() AS regnamespace) "
+            "AND (left(relname, length(:prefix)) = :prefix OR relname = :legacy) "
+            "ORDER BY relname"
+        ), {"prefix": PARTITION_PREFIX, "legacy": LEGACY_PARTITION})
+        return result.scalars().all()
+
+    async def retire_partition(self, name: str, schema: str) -> None:
+        result = await self.session.execute(text(
+            f"SELECT organization_id, activity_type, CAST(created_at AS date), count(*) "
+            f"FROM {name} GROUP BY 1, 2, 3"
+        ))
+        counts = defaultdict(list)
+        for organization_id, activity_type, day, count in result.all():
+            counts[organization_id].append((activity_type, day, count))
+        archived = ArchivedActivityCountRepository(self.session)
+        for organization_id in sorted(counts):
+            await archived.add(organization_id, counts[organization_id])
+        await self.session.execute(text(f"ALTER TABLE {name} SET SCHEMA {schema}"))
+        await self.commit()
+
+    async def _recent(self, stmt: Select, limit: int) -> List[Activity]:
+        since = datetime.utcnow() - timedelta(days=settings.ACTIVITY_RECENT_WINDOW_DAYS)
+        result = await self.session.execute(
+            self.paginate(stmt.where(Activity.created_at >= since), limit=limit)
+        )
+        activities = result.scalars().all()
+        if len(activities) == limit:
+            return activities
+
+        result = await self.session.execute(
+            self.paginate(stmt.where(Activity.created_at < since), limit=limit - len(activities))
+        )
+        return [*activities, *result.scalars().all()]
+
+    async def _list(
+        self,
+        stmt: Select,
+        organization: Union[UUID, Select],
+        skip: int,
+        limit: int,
+        cursor: Optional[str],
+        **match: Any,
+    ) -> List[Activity]:
+        result = await self.session.execute(self.paginate(stmt, skip, limit, cursor))
+        return await self._with_archive(
+            result.scalars().all(), stmt, organization, skip, limit, cursor, **match
+        )
+
+    async def _with_archive(
+        self,
+        activities: List[Activity],
+        stmt: Select,
+        organization: Union[UUID, Select],
+        skip: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        **match: Any,
+    ) -> List[Activity]:
+        if self.archive is None:
+            return activities
+        owner_created_at = None
+        if isinstance(organization, Select):
+            owner = (await self.session.execute(organization)).one_or_none()
+            if owner is None:
+                return activities
+            organization, owner_created_at = owner
+
+        segments = await asyncio.to_thread(self.archive.segments, organization)
+        if not segments:
+            return activities
+        horizon = max(segment.max_created_at for segment in segments)
+        if owner_created_at is not None and owner_created_at > horizon:
+            return activities
+        if len(activities) == limit and activities[-1].created_at > horizon:
+            return activities
+
+        if skip:
+            result = await self.session.execute(self.paginate(stmt, 0, skip + limit, cursor))
+            activities = result.scalars().all()
+        before = decode_cursor(cursor, *KEYSET_KINDS) if cursor is not None else None
+        archived = await asyncio.to_thread(
+            self.archive.read, organization, skip + limit, before, **match
+        )
+        merged = {activity.id: activity for activity in archived}
+        merged.update((activity.id, activity) for activity in activities)
+        ordered = sorted(
+            merged.values(), key=lambda activity: (activity.created_at, activity.id), reverse=True
+        )
+        return ordered[skip:skip + limit]
+
+    @staticmethod
+    def _owner(model: Any, id: UUID) -> Select:
+        return select(model.organization_id, model.created_at).where(model.id == id)
@@ -0,0 +1,46 @@
+from collections import Counter
+from datetime import date
+from typing import Any, Iterable, Tuple
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.models import ActivityTypeEnum, ArchivedActivityCount
+from app.repositories.base import BaseRepository
+from app.repositories.organization_stats_repository import enum_member
+
+
+class ArchivedActivityCountRepository(BaseRepository[ArchivedActivityCount]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, ArchivedActivityCount)
+
+    async def add(
+        self, organization_id: UUID, counts: Iterable[Tuple[Any, date, int]]
+    ) -> None:
+        totals = Counter()
+        for activity_type, day, count in counts:
+            activity_type = enum_member(ActivityTypeEnum, activity_type, ActivityTypeEnum.NOTE)
+            totals[(day, activity_type)] += count
+        if not totals:
+            return
+
+        table = ArchivedActivityCount.__table__
+        stmt = self._insert().values([
+            {
+                "organization_id": organization_id,
+                "day": day,
+                "activity_type": activity_type,
+                "activities": count,
+            }
+            for (day, activity_type), count in sorted(totals.items())
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.organization_id, table.c.day, table.c.activity_type],
+            set_={"activities": table.c.activities + stmt.excluded.activities},
+        )
+        await self.session.execute(stmt)
+
+    def _insert(self):
+        if self.dialect_name == "postgresql":
+            return postgresql.insert(ArchivedActivityCount.__table__)
+        return sqlite.insert(ArchivedActivityCount.__table__)
@@ -1,10 +1,20 @@
-from typing import TypeVar, Generic, List, Optional, Type, Any
+from collections import defaultdict
+from typing import (
+    TypeVar, Generic, AsyncIterator, Iterable, List, Optional, Sequence, Set, Type, Any, Dict,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, update
+from sqlalchemy import (
+    select, insert, delete, update, func, desc, inspect, tuple_, bindparam, Select, RowMapping,
+)
 from app.database import Base
+from app.core.exceptions import Conflict
+from app.core.pagination import decode_cursor, KEYSET_KINDS
 
 ModelT = TypeVar("ModelT", bound=Base)
 
+UNIT_OF_WORK = "unit_of_work"
+VERSION_COLUMN = "version"
+
 
 class BaseRepository(Generic[ModelT]):
     def __init__(self, session: AsyncSession, model: Type[ModelT]):
@@ -12,34 +22,196 @@ class BaseRepository(Generic[ModelT]):
         self.model = model
 
     async def create(self, obj: ModelT) -> ModelT:
-        self.session.add(obj)
-        await self.session.commit()
-        await self.session.refresh(obj)
-        return obj
+        stmt = insert(self.model).values(**self._column_values(obj)).returning(self.model)
+        result = await self.session.execute(stmt)
+        created = result.scalar_one()
+        await self.commit()
+        return created
+
+    async def create_many(self, objs: List[ModelT]) -> List[ModelT]:
+        if not objs:
+            return []
+
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        result = await self.session.execute(stmt, [self._column_values(obj) for obj in objs])
+        created = result.scalars().all()
+        await self.commit()
+        return created
 
     async def get(self, id: Any) -> Optional[ModelT]:
         stmt = select(self.model).where(self.model.id == id)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def list(self, skip: int = 0, limit: int = 100) -> List[ModelT]:
-        stmt = select(self.model).offset(skip).limit(limit)
+    async def get_for_update(self, id: Any, *conditions: Any) -> Optional[ModelT]:
+        stmt = (
+            select(self.model)
+            .where(self.model.id == id, *conditions)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_many(
+        self, ids: Iterable[Any], *filters: Any, for_update: bool = False
+    ) -> Dict[Any, ModelT]:
+        ids = list(ids)
+        if not ids:
+            return {}
+
+        stmt = select(self.model).where(self.model.id.in_(ids), *filters)
+        if for_update:
+            stmt = stmt.with_for_update().execution_options(populate_existing=True)
+        result = await self.session.execute(stmt)
+        return {obj.id: obj for obj in result.scalars().all()}
+
+    async def list(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> List[ModelT]:
+        stmt = self.paginate(select(self.model), skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
-    async def update(self, id: Any, obj: dict) -> Optional[ModelT]:
-        stmt = update(self.model).where(self.model.id == id).values(**obj)
-        await self.session.execute(stmt)
-        await self.session.commit()
-        return await self.get(id)
+    async def stream_rows(
+        self, *conditions: Any, batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        stmt = (
+            select(*self.model.__table__.columns)
+            .where(*conditions)
+            .order_by(self.model.created_at, self.model.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(stmt)
+        async for rows in result.mappings().partitions():
+            yield rows
+
+    async def commit(self) -> None:
+        if not self.session.info.get(UNIT_OF_WORK):
+            await self.session.commit()
+
+    @staticmethod
+    def _column_values(obj: ModelT) -> Dict[str, Any]:
+        state = inspect(obj)
+        return {
+            attr.key: getattr(obj, attr.key)
+            for attr in state.mapper.column_attrs
+            if attr.key in state.dict
+        }
+
+    def _next_version(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        column = self.model.__table__.c.get(VERSION_COLUMN)
+        if column is None or VERSION_COLUMN in values:
+            return values
+        return {**values, VERSION_COLUMN: column + 1}
+
+    @property
+    def dialect_name(self) -> str:
+        return self.session.get_bind().dialect.name
+
+    def paginate(
+        self, stmt: Select, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> Select:
+        keyset = (self.model.created_at, self.model.id)
+        stmt = stmt.order_by(*[desc(column) for column in keyset])
+        if cursor is None:
+            return stmt.offset(skip).limit(limit)
+
+        after = decode_cursor(cursor, *KEYSET_KINDS)
+        return stmt.where(tuple_(*keyset) < tuple_(*after)).limit(limit)
+
+    async def update(
+        self, id: Any, obj: dict, *conditions: Any, version: Optional[int] = None
+    ) -> Optional[ModelT]:
+        expected = []
+        if version is not None:
+            expected.append(self.model.__table__.c[VERSION_COLUMN] == version)
+        stmt = (
+            update(self.model)
+            .where(self.model.id == id, *conditions, *expected)
+            .values(**self._next_version(obj))
+            .returning(self.model)
+        )
+        result = await self.session.execute(stmt)
+        updated = result.scalar_one_or_none()
+        if updated is None and expected and await self.existing_ids([id], *conditions):
+            raise Conflict(f"{self.model.__name__} was modified by another request")
+        await self.commit()
+        return updated
 
-    async def delete(self, id: Any) -> bool:
-        stmt = delete(self.model).where(self.model.id == id)
+    async def delete(self, id: Any, *conditions: Any) -> bool:
+        stmt = delete(self.model).where(self.model.id == id, *conditions)
         result = await self.session.execute(stmt)
-        await self.session.commit()
+        await self.commit()
         return result.rowcount > 0
 
+    async def update_many(self, changes: Dict[Any, dict], *conditions: Any) -> int:
+        table = self.model.__table__
+        batches = defaultdict(list)
+        for id, values in changes.items():
+            batches[tuple(sorted(values))].append({"_id": id, **values})
+
+        updated = 0
+        for rows in batches.values():
+            stmt = (
+                update(table)
+                .where(table.c.id == bindparam("_id"), *conditions)
+                .values(self._next_version({}))
+            )
+            result = await self.session.execute(stmt, rows)
+            updated += result.rowcount
+        await self.commit()
+        return updated
+
+    async def delete_many(self, ids: Iterable[Any], *conditions: Any) -> Set[Any]:
+        ids = list(ids)
+        if not ids:
+            return set()
+
+        stmt = delete(self.model).where(self.model.id.in_(ids), *conditions).returning(self.model.id)
+        result = await self.session.execute(stmt)
+        deleted = set(result.scalars().all())
+        await self.commit()
+        return deleted
+
+    async def existing_ids(
+        self, ids: Iterable[Any], *filters: Any, for_update: bool = False
+    ) -> Set[Any]:
+        ids = list(ids)
+        if not ids:
+            return set()
+
+        stmt = select(self.model.id).where(self.model.id.in_(ids), *filters)
+        if for_update:
+            stmt = stmt.with_for_update().execution_options(populate_existing=True)
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+
     async def exists(self, id: Any) -> bool:
-        stmt = select(self.model).where(self.model.id == id)
+        stmt = select(self.model.id).where(self.model.id == id)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none() is not None
+
+    async def count(self, *filters: Any, model: Optional[Type[Base]] = None) -> int:
+        stmt = select(func.count()).select_from(model or self.model).where(*filters)
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
+    async def sum(self, column: Any, *filters: Any) -> Any:
+        stmt = select(func.coalesce(func.sum(column), 0)).where(*filters)
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
+    async def count_by(self, column: Any, *filters: Any) -> Dict[Any, int]:
+        stmt = select(column, func.count()).where(*filters).group_by(column)
+        result = await self.session.execute(stmt)
+        return {key: count for key, count in result.all()}
+
+    def aggregate_query(self, *filters: Any, **aggregates: Any) -> Select:
+        columns = [expr.label(name) for name, expr in aggregates.items()]
+        return select(*columns).select_from(self.model).where(*filters)
+
+    async def aggregate(self, *filters: Any, **aggregates: Any) -> RowMapping:
+        stmt = self.aggregate_query(*filters, **aggregates)
+        result = await self.session.execute(stmt)
+        return result.mappings().one()
@@ -1,10 +1,51 @@
-from typing import List, Optional
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import (
+    Boolean, Column, DateTime, Index, Integer, MetaData, RowMapping, String, Table,
+    and_, cast, delete, desc, exists, insert, literal, null, select, tuple_, union_all,
+)
 
-from app.models import Contact
+from app.core.pagination import decode_cursor
+from app.models import Activity, Contact, Deal, DealStatusTransition, Task
+from app.repositories.activity_archive import ArchiveKey, get_activity_archive
 from app.repositories.base import BaseRepository
+from app.repositories.search import TextSearch
+
+CONTACT_SEARCH = TextSearch(Contact)
+
+TIMELINE_CURSOR_KINDS = (datetime, str, UUID)
+
+TimelineRow = Union[RowMapping, Dict[str, Any]]
+
+CONTACT_IMPORT_COLUMNS = (
+    "first_name",
+    "last_name",
+    "email",
+    "phone",
+    "position",
+    "company",
+    "address",
+    "city",
+    "country",
+    "postal_code",
+    "notes",
+)
+
+
+def contact_import_staging(name: str) -> Table:
+    columns = Contact.__table__.c
+    return Table(
+        name,
+        MetaData(),
+        Column("row_number", Integer, nullable=False),
+        Column("id", columns.id.type, nullable=False),
+        *[Column(column, columns[column].type) for column in CONTACT_IMPORT_COLUMNS],
+        Index(f"{name}_email", "email", "row_number"),
+        prefixes=["TEMPORARY"],
+    )
 
 
 class ContactRepository(BaseRepository[Contact]):
@@ -12,23 +53,27 @@ class ContactRepository(BaseRepository[Contact]):
         super().__init__(session, Contact)
 
     async def list_by_organization(
-        self, organization_id: UUID, skip: int = 0, limit: int = 100
+        self, organization_id: UUID, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Contact]:
         stmt = select(Contact).where(
             Contact.organization_id == organization_id
-        ).offset(skip).limit(limit)
+        )
+        stmt = self.paginate(stmt, skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
     async def list_active_by_organization(
-        self, organization_id: UUID, skip: int = 0, limit: int = 100
+        self, organization_id: UUID, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Contact]:
         stmt = select(Contact).where(
             and_(
                 Contact.organization_id == organization_id,
                 Contact.is_active == True
             )
-        ).offset(skip).limit(limit)
+        )
+        stmt = self.paginate(stmt, skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
@@ -36,18 +81,10 @@ class ContactRepository(BaseRepository[Contact]):
         self, organization_id: UUID, query: str, skip: int = 0, limit: int = 100
     ) -> List[Contact]:
         stmt = select(Contact).where(
-            and_(
-                Contact.organization_id == organization_id,
-                (
-                    (Contact.first_name.ilike(f"%{query}%")) |
-                    (Contact.last_name.ilike(f"%{query}%")) |
-                    (Contact.email.ilike(f"%{query}%")) |
-                    (Contact.phone.ilike(f"%{query}%")) |
-                    (Contact.company.ilike(f"%{query}%"))
-                )
-            )
-        ).offset(skip).limit(limit)
-        result = await self.session.execute(stmt)
+            Contact.organization_id == organization_id
+        )
+        stmt = CONTACT_SEARCH.apply(stmt, query, self.dialect_name)
+        result = await self.session.execute(stmt.offset(skip).limit(limit))
         return result.scalars().all()
 
     async def get_by_email(self, organization_id: UUID, email: str) -> Optional[Contact]:
@@ -61,20 +98,187 @@ class ContactRepository(BaseRepository[Contact]):
         return result.scalar_one_or_none()
 
     async def list_by_company(
-        self, organization_id: UUID, company: str, skip: int = 0, limit: int = 100
+        self, organization_id: UUID, company: str, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Contact]:
         stmt = select(Contact).where(
             and_(
                 Contact.organization_id == organization_id,
                 Contact.company == company
             )
-        ).offset(skip).limit(limit)
+        )
+        stmt = self.paginate(stmt, skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
     async def count_by_organization(self, organization_id: UUID) -> int:
-        stmt = select(Contact).where(
-            Contact.organization_id == organization_id
+        return await self.count(Contact.organization_id == organization_id)
+
+    async def create_import_staging(self, staging: Table) -> None:
+        connection = await self.session.connection()
+        await connection.run_sync(staging.create)
+        await self.session.commit()
+
+    async def drop_import_staging(self, staging: Table) -> None:
+        connection = await self.session.connection()
+        await connection.run_sync(staging.drop, checkfirst=True)
+        await self.session.commit()
+
+    async def stage_import(self, staging: Table, rows: List[Dict[str, Any]]) -> None:
+        if self.dialect_name != "postgresql":
+            await self.session.execute(insert(staging), rows)
+            return
+
+        columns = [column.name for column in staging.columns]
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            staging.name,
+            records=[tuple(row[column] for column in columns) for row in rows],
+            columns=columns,
+        )
+
+    async def merge_import(self, staging: Table, organization_id: UUID) -> int:
+        contacts = Contact.__table__
+        earlier = staging.alias("earlier")
+        now = datetime.utcnow()
+        columns = ["id", *CONTACT_IMPORT_COLUMNS]
+        rows = select(
+            *[staging.c[column] for column in columns],
+            literal(organization_id, contacts.c.organization_id.type),
+            literal(True, Boolean),
+            literal(now, DateTime),
+            literal(now, DateTime),
+        ).where(
+            ~exists().where(
+                contacts.c.organization_id == organization_id,
+                contacts.c.email == staging.c.email,
+            ),
+            ~exists().where(
+                earlier.c.email == staging.c.email,
+                earlier.c.row_number < staging.c.row_number,
+            ),
+        )
+        result = await self.session.execute(
+            insert(contacts).from_select(
+                [*columns, "organization_id", "is_active", "created_at", "updated_at"],
+                rows,
+            )
+        )
+        await self.session.execute(delete(staging))
+        return result.rowcount
+
+    async def timeline(
+        self, contact_id: UUID, limit: int = 50, cursor: Optional[str] = None
+    ) -> List[TimelineRow]:
+        after = decode_cursor(cursor, *TIMELINE_CURSOR_KINDS) if cursor else None
+        sources = [
+            ("activity", Activity.created_at, Activity.id, Activity.title,
+             Activity.activity_type, Activity.deal_id, [Activity.contact_id == contact_id]),
+            ("deal_created", Deal.created_at, Deal.id, Deal.title,
+             None, Deal.id, [Deal.contact_id == contact_id]),
+            ("deal_status_changed", DealStatusTransition.changed_at, DealStatusTransition.id,
+             Deal.title, DealStatusTransition.to_status, Deal.id,
+             [Deal.id == DealStatusTransition.deal_id, Deal.contact_id == contact_id]),
+            ("task_created", Task.created_at, Task.id, Task.title,
+             None, Task.deal_id, [Task.contact_id == contact_id]),
+            ("task_completed", Task.completed_at, Task.id, Task.title,
+             None, Task.deal_id, [Task.contact_id == contact_id, Task.completed_at.isnot(None)]),
+        ]
+
+        branches = []
+        for kind, occurred_at, id, title, detail, deal_id, conditions in sources:
+            stmt = (
+                select(
+                    literal(kind, String).label("kind"),
+                    occurred_at.label("occurred_at"),
+                    id.label("id"),
+                    title.label("title"),
+                    cast(detail if detail is not None else null(), String).label("detail"),
+                    deal_id.label("deal_id"),
+                )
+                .where(*conditions)
+                .order_by(desc(occurred_at), desc(id))
+                .limit(limit)
+            )
+            if after is not None:
+                stmt = stmt.where(self._timeline_after(kind, occurred_at, id, after))
+            branches.append(select(stmt.subquery()))
+
+        merged = union_all(*branches).subquery("timeline")
+        stmt = (
+            select(merged)
+            .order_by(desc(merged.c.occurred_at), desc(merged.c.kind), desc(merged.c.id))
+            .limit(limit)
         )
         result = await self.session.execute(stmt)
-        return len(result.scalars().all())
+        return await self._timeline_archive(contact_id, result.mappings().all(), limit, after)
+
+    async def _timeline_archive(
+        self,
+        contact_id: UUID,
+        rows: List[RowMapping],
+        limit: int,
+        after: Optional[tuple],
+    ) -> List[TimelineRow]:
+        archive = get_activity_archive()
+        if archive is None:
+            return rows
+        owner = (await self.session.execute(
+            select(Contact.organization_id, Contact.created_at).where(Contact.id == contact_id)
+        )).one_or_none()
+        if owner is None:
+            return rows
+        organization_id, created_at = owner
+
+        segments = await asyncio.to_thread(archive.segments, organization_id)
+        if not segments:
+            return rows
+        horizon = max(segment.max_created_at for segment in segments)
+        if created_at is not None and created_at > horizon:
+            return rows
+        if len(rows) == limit and rows[-1]["occurred_at"] > horizon:
+            return rows
+
+        archived = await asyncio.to_thread(
+            archive.read, organization_id, limit, self._archive_before(after),
+            contact_id=contact_id,
+        )
+        merged = {
+            ("activity", activity.id): {
+                "kind": "activity",
+                "occurred_at": activity.created_at,
+                "id": activity.id,
+                "title": activity.title,
+                "detail": activity.activity_type.value if activity.activity_type else None,
+                "deal_id": activity.deal_id,
+            }
+            for activity in archived
+        }
+        merged.update(((row["kind"], row["id"]), row) for row in rows)
+        ordered = sorted(
+            merged.values(),
+            key=lambda row: (row["occurred_at"], row["kind"], row["id"]),
+            reverse=True,
+        )
+        return ordered[:limit]
+
+    @staticmethod
+    def _archive_before(after: Optional[tuple]) -> Optional[ArchiveKey]:
+        if after is None:
+            return None
+        after_at, after_kind, after_id = after
+        if "activity" < after_kind:
+            return after_at, UUID(int=2 ** 128 - 1)
+        if "activity" == after_kind:
+            return after_at, after_id
+        return after_at, UUID(int=0)
+
+    @staticmethod
+    def _timeline_after(kind: str, occurred_at: Any, id: Any, after: tuple) -> Any:
+        after_at, after_kind, after_id = after
+        if kind < after_kind:
+            return occurred_at <= after_at
+        if kind == after_kind:
+            return tuple_(occurred_at, id) < tuple_(after_at, after_id)
+        return occurred_at < after_at
@@ -0,0 +1,146 @@
+from datetime import date, datetime, time
+from typing import Any, List, Optional
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    Date, Select, RowMapping, cast, delete, func, insert, literal, literal_column, select,
+    type_coerce, union_all,
+)
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.models import Activity, ArchivedActivityCount, DailyRollup, Deal, DealStatusEnum, Task
+from app.repositories.base import BaseRepository
+
+ROLLUP_METRICS = [
+    "deals_created",
+    "deals_won",
+    "won_amount",
+    "tasks_completed",
+    "activities_logged",
+]
+
+SQLITE_BUCKETS = {
+    "week": ("weekday 0", "-6 days"),
+    "month": ("start of month",),
+}
+
+
+class DailyRollupRepository(BaseRepository[DailyRollup]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, DailyRollup)
+
+    async def rebuild(
+        self, start: date, end: date, organization_id: Optional[UUID] = None
+    ) -> int:
+        conditions = [DailyRollup.day >= start, DailyRollup.day < end]
+        if organization_id is not None:
+            conditions.append(DailyRollup.organization_id == organization_id)
+
+        await self.session.execute(delete(DailyRollup).where(*conditions))
+        result = await self.session.execute(
+            insert(DailyRollup).from_select(
+                ["organization_id", "day", *ROLLUP_METRICS, "updated_at"],
+                self.actual_query(start, end, organization_id),
+            )
+        )
+        await self.commit()
+        return result.rowcount
+
+    async def earliest_day(self, organization_id: Optional[UUID] = None) -> Optional[date]:
+        candidates = []
+        columns = (
+            Deal.created_at, Task.completed_at, Activity.created_at, ArchivedActivityCount.day,
+        )
+        for column in columns:
+            stmt = select(func.min(column))
+            if organization_id is not None:
+                stmt = stmt.where(column.class_.organization_id == organization_id)
+            value = await self.session.scalar(stmt)
+            if value is not None:
+                candidates.append(value.date() if isinstance(value, datetime) else value)
+        return min(candidates, default=None)
+
+    async def series(
+        self, organization_id: UUID, start: date, end: date, unit: str
+    ) -> List[RowMapping]:
+        bucket = self._bucket(unit).label("bucket")
+        stmt = (
+            select(
+                bucket,
+                *[func.sum(DailyRollup.__table__.c[name]).label(name) for name in ROLLUP_METRICS],
+            )
+            .where(
+                DailyRollup.organization_id == organization_id,
+                DailyRollup.day >= start,
+                DailyRollup.day < end,
+            )
+            .group_by(bucket)
+            .order_by(bucket)
+        )
+        result = await self.session.execute(stmt)
+        return result.mappings().all()
+
+    def actual_query(
+        self, start: date, end: date, organization_id: Optional[UUID] = None
+    ) -> Select:
+        lower = datetime.combine(start, time.min)
+        upper = datetime.combine(end, time.min)
+        window = (lower, upper, organization_id)
+        daily = union_all(
+            self._daily(Deal.created_at, *window, deals_created=func.count()),
+            self._daily(
+                Deal.closed_date,
+                *window,
+                Deal.status == DealStatusEnum.WON,
+                deals_won=func.count(),
+                won_amount=func.coalesce(func.sum(Deal.amount), 0),
+            ),
+            self._daily(Task.completed_at, *window, tasks_completed=func.count()),
+            self._daily(Activity.created_at, *window, activities_logged=func.count()),
+            self._daily(
+                ArchivedActivityCount.day,
+                start,
+                end,
+                organization_id,
+                activities_logged=func.sum(ArchivedActivityCount.activities),
+            ),
+        ).subquery("daily")
+
+        return select(
+            daily.c.organization_id,
+            daily.c.day,
+            *[func.sum(daily.c[name]) for name in ROLLUP_METRICS],
+            literal(datetime.utcnow(), DailyRollup.updated_at.type),
+        ).group_by(daily.c.organization_id, daily.c.day)
+
+    @staticmethod
+    def _daily(
+        column: InstrumentedAttribute,
+        lower: date,
+        upper: date,
+        organization_id: Optional[UUID],
+        *conditions: Any,
+        **aggregates: Any,
+    ) -> Select:
+        model = column.class_
+        day = func.date(column)
+        zero = literal_column("0")
+        stmt = (
+            select(
+                model.organization_id.label("organization_id"),
+                type_coerce(day, Date).label("day"),
+                *[aggregates.get(name, zero).label(name) for name in ROLLUP_METRICS],
+            )
+            .where(column >= lower, column < upper, *conditions)
+            .group_by(model.organization_id, day)
+        )
+        if organization_id is not None:
+            stmt = stmt.where(model.organization_id == organization_id)
+        return stmt
+
+    def _bucket(self, unit: str):
+        if unit == "day":
+            return DailyRollup.day
+        if self.dialect_name == "postgresql":
+            return cast(func.date_trunc(unit, DailyRollup.day), Date)
+        return type_coerce(func.date(DailyRollup.day, *SQLITE_BUCKETS[unit]), Date)
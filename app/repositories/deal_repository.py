@@ -1,11 +1,21 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, asc, desc, func, tuple_, RowMapping
+from sqlalchemy.orm import aliased
 from decimal import Decimal
 
 from app.models import Deal, DealStatusEnum
 from app.repositories.base import BaseRepository
+from app.repositories.search import TextSearch
+
+DEAL_SEARCH = TextSearch(Deal)
+
+BOARD_ORDERINGS = {
+    "amount": (func.coalesce(Deal.amount, 0), desc, Decimal),
+    "expected_close_date": (func.coalesce(Deal.expected_close_date, datetime.max), asc, datetime),
+}
 
 
 class DealRepository(BaseRepository[Deal]):
@@ -13,44 +23,52 @@ class DealRepository(BaseRepository[Deal]):
         super().__init__(session, Deal)
 
     async def list_by_organization(
-        self, organization_id: UUID, skip: int = 0, limit: int = 100
+        self, organization_id: UUID, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Deal]:
         stmt = select(Deal).where(
             Deal.organization_id == organization_id
-        ).offset(skip).limit(limit)
+        )
+        stmt = self.paginate(stmt, skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
     async def list_by_contact(
-        self, contact_id: UUID, skip: int = 0, limit: int = 100
+        self, contact_id: UUID, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Deal]:
         stmt = select(Deal).where(
             Deal.contact_id == contact_id
-        ).offset(skip).limit(limit)
+        )
+        stmt = self.paginate(stmt, skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
     async def list_by_status(
-        self, organization_id: UUID, status: DealStatusEnum, skip: int = 0, limit: int = 100
+        self, organization_id: UUID, status: DealStatusEnum, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Deal]:
         stmt = select(Deal).where(
             and_(
                 Deal.organization_id == organization_id,
                 Deal.status == status
             )
-        ).offset(skip).limit(limit)
+        )
+        stmt = self.paginate(stmt, skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
     async def list_by_assigned_to(
-        self, organization_id: UUID, user_id: UUID, skip: int = 0, limit: int = 100
+        self, organization_id: UUID, user_id: UUID, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Deal]:
         stmt = select(Deal).where(
             and_(
                 Deal.organization_id == organization_id,
                 Deal.assigned_to == user_id
             )
-        ).offset(skip).limit(limit)
+        )
+        stmt = self.paginate(stmt, skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
@@ -58,53 +76,92 @@ class DealRepository(BaseRepository[Deal]):
         self, organization_id: UUID, query: str, skip: int = 0, limit: int = 100
     ) -> List[Deal]:
         stmt = select(Deal).where(
-            and_(
-                Deal.organization_id == organization_id,
-                Deal.title.ilike(f"%{query}%")
-            )
-        ).offset(skip).limit(limit)
-        result = await self.session.execute(stmt)
+            Deal.organization_id == organization_id
+        )
+        stmt = DEAL_SEARCH.apply(stmt, query, self.dialect_name)
+        result = await self.session.execute(stmt.offset(skip).limit(limit))
         return result.scalars().all()
 
-    async def get_total_amount_by_organization(self, organization_id: UUID) -> Decimal:
-        stmt = select(func.sum(Deal.amount)).where(
-            and_(
-                Deal.organization_id == organization_id,
-                Deal.status.in_([DealStatusEnum.WON])
-            )
-        )
+    async def contacts_with_deals(self, contact_ids: Iterable[UUID]) -> Set[UUID]:
+        stmt = select(Deal.contact_id).where(
+            Deal.contact_id.in_(list(contact_ids))
+        ).distinct()
         result = await self.session.execute(stmt)
-        total = result.scalar()
-        return total or Decimal(0)
+        return set(result.scalars().all())
+
+    async def get_total_amount_by_organization(self, organization_id: UUID) -> Decimal:
+        return await self.get_total_amount_by_status(organization_id, DealStatusEnum.WON)
 
     async def get_total_amount_by_status(
         self, organization_id: UUID, status: DealStatusEnum
     ) -> Decimal:
-        stmt = select(func.sum(Deal.amount)).where(
-            and_(
-                Deal.organization_id == organization_id,
-                Deal.status == status
-            )
+        total = await self.sum(
+            Deal.amount,
+            Deal.organization_id == organization_id,
+            Deal.status == status,
         )
-        result = await self.session.execute(stmt)
-        total = result.scalar()
-        return total or Decimal(0)
+        return Decimal(total)
 
     async def count_by_organization(self, organization_id: UUID) -> int:
-        stmt = select(Deal).where(
-            Deal.organization_id == organization_id
-        )
-        result = await self.session.execute(stmt)
-        return len(result.scalars().all())
+        return await self.count(Deal.organization_id == organization_id)
 
     async def count_by_status(
         self, organization_id: UUID, status: DealStatusEnum
     ) -> int:
-        stmt = select(Deal).where(
-            and_(
-                Deal.organization_id == organization_id,
-                Deal.status == status
+        return await self.count(
+            Deal.organization_id == organization_id,
+            Deal.status == status,
+        )
+
+    async def board(
+        self,
+        organization_id: UUID,
+        order_by: str,
+        limit: int,
+        status: Optional[DealStatusEnum] = None,
+        after: Optional[Tuple[Any, UUID]] = None,
+    ) -> List[RowMapping]:
+        key, direction, _ = BOARD_ORDERINGS[order_by]
+        conditions = [Deal.organization_id == organization_id]
+        if status is not None:
+            conditions.append(Deal.status == status)
+
+        totals = (
+            select(
+                Deal.status.label("status"),
+                func.count().label("deals"),
+                func.coalesce(func.sum(Deal.amount), 0).label("amount"),
+            )
+            .where(*conditions)
+            .group_by(Deal.status)
+            .subquery("totals")
+        )
+
+        page = select(
+            Deal,
+            key.label("sort_key"),
+            func.row_number().over(
+                partition_by=Deal.status, order_by=(direction(key), direction(Deal.id))
+            ).label("position"),
+        ).where(*conditions)
+        if after is not None:
+            keyset, position = tuple_(key, Deal.id), tuple_(*after)
+            page = page.where(keyset < position if direction is desc else keyset > position)
+        ranked = page.subquery("ranked")
+
+        stmt = (
+            select(
+                totals.c.status,
+                totals.c.deals,
+                totals.c.amount,
+                aliased(Deal, ranked, name="deal"),
+                ranked.c.sort_key,
             )
+            .select_from(totals.outerjoin(
+                ranked,
+                and_(ranked.c.status == totals.c.status, ranked.c.position <= limit),
+            ))
+            .order_by(totals.c.status, ranked.c.position)
         )
         result = await self.session.execute(stmt)
-        return len(result.scalars().all())
+        return result.mappings().all()
@@ -0,0 +1,117 @@
+from datetime import datetime
+from typing import List
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    Float, RowMapping, cast, func, insert, literal, over, select, union_all,
+)
+
+from app.models import Deal, DealStatusEnum, DealStatusTransition
+from app.models.deal_status_transition import transition_status
+from app.repositories.base import BaseRepository
+
+FUNNEL_PERCENTILES = {"p50": (1, 2), "p90": (9, 10)}
+
+
+class DealStatusTransitionRepository(BaseRepository[DealStatusTransition]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, DealStatusTransition)
+
+    async def record(self, transitions: List[DealStatusTransition]) -> None:
+        if not transitions:
+            return
+
+        await self.session.execute(
+            insert(DealStatusTransition),
+            [self._column_values(transition) for transition in transitions],
+        )
+
+    async def list_by_deal(self, deal_id: UUID) -> List[DealStatusTransition]:
+        stmt = (
+            select(DealStatusTransition)
+            .where(DealStatusTransition.deal_id == deal_id)
+            .order_by(DealStatusTransition.changed_at, DealStatusTransition.id)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def funnel_by_assignee(
+        self, organization_id: UUID, start: datetime, end: datetime
+    ) -> List[RowMapping]:
+        cohort = (
+            select(Deal.id, Deal.assigned_to, Deal.created_at)
+            .where(
+                Deal.organization_id == organization_id,
+                Deal.created_at >= start,
+                Deal.created_at < end,
+            )
+            .cte("cohort")
+        )
+        entries = union_all(
+            select(
+                cohort.c.id.label("deal_id"),
+                cohort.c.assigned_to,
+                cast(literal(DealStatusEnum.NEW, transition_status), transition_status).label(
+                    "stage"
+                ),
+                cohort.c.created_at.label("entered_at"),
+            ),
+            select(
+                DealStatusTransition.deal_id,
+                cohort.c.assigned_to,
+                DealStatusTransition.to_status,
+                DealStatusTransition.changed_at,
+            )
+            .select_from(cohort)
+            .join(DealStatusTransition, DealStatusTransition.deal_id == cohort.c.id)
+            .where(DealStatusTransition.changed_at >= start),
+        ).cte("entries")
+
+        path = {"partition_by": entries.c.deal_id, "order_by": entries.c.entered_at}
+        left_at = func.lead(entries.c.entered_at).over(**path)
+        next_stage = func.lead(entries.c.stage, type_=transition_status).over(**path)
+        timed = select(
+            entries.c.deal_id,
+            entries.c.assigned_to,
+            entries.c.stage,
+            next_stage.label("next_stage"),
+            self._seconds(entries.c.entered_at, left_at).label("seconds"),
+        ).cte("timed")
+
+        finished = timed.c.seconds.isnot(None)
+        ranks = select(
+            timed,
+            over(
+                func.row_number(),
+                partition_by=[timed.c.stage, finished],
+                order_by=timed.c.seconds,
+            ).label("duration_rank"),
+            over(func.count(timed.c.seconds), partition_by=timed.c.stage).label("durations"),
+        ).cte("ranked")
+
+        stmt = select(
+            ranks.c.stage,
+            ranks.c.assigned_to,
+            func.count(ranks.c.deal_id.distinct()).label("deals"),
+            func.count().filter(
+                ranks.c.next_stage.isnot(None), ranks.c.next_stage != DealStatusEnum.LOST
+            ).label("advanced"),
+            func.count().filter(ranks.c.next_stage == DealStatusEnum.LOST).label("lost"),
+            *[
+                func.max(ranks.c.seconds).filter(
+                    ranks.c.seconds.isnot(None),
+                    ranks.c.duration_rank
+                    == (ranks.c.durations * numerator + denominator - 1) // denominator,
+                ).label(f"{name}_seconds")
+                for name, (numerator, denominator) in FUNNEL_PERCENTILES.items()
+            ],
+        ).group_by(ranks.c.stage, ranks.c.assigned_to)
+        result = await self.session.execute(stmt)
+        return result.mappings().all()
+
+    def _seconds(self, entered_at, left_at):
+        if self.dialect_name == "postgresql":
+            return func.extract("epoch", left_at - entered_at)
+        return cast(
+            (func.julianday(left_at) - func.julianday(entered_at)) * 86400, Float
+        )
@@ -3,7 +3,7 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.models import Organization
+from app.models import Organization, OrganizationMember
 from app.repositories.base import BaseRepository
 
 
@@ -16,25 +16,29 @@ class OrganizationRepository(BaseRepository[Organization]):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def list_active(self, skip: int = 0, limit: int = 100) -> List[Organization]:
+    async def list_active(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> List[Organization]:
         stmt = select(Organization).where(
             Organization.is_active == True
-        ).offset(skip).limit(limit)
+        )
+        stmt = self.paginate(stmt, skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
-    async def search(self, query: str, skip: int = 0, limit: int = 100) -> List[Organization]:
+    async def search(
+        self, query: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> List[Organization]:
         stmt = select(Organization).where(
             (Organization.name.ilike(f"%{query}%")) |
             (Organization.description.ilike(f"%{query}%"))
-        ).offset(skip).limit(limit)
+        )
+        stmt = self.paginate(stmt, skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
     async def count_members(self, organization_id: UUID) -> int:
-        from app.models import OrganizationMember
-        stmt = select(OrganizationMember).where(
-            OrganizationMember.organization_id == organization_id
+        return await self.count(
+            OrganizationMember.organization_id == organization_id,
+            model=OrganizationMember,
         )
-        result = await self.session.execute(stmt)
-        return len(result.scalars().all())
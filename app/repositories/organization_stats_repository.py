@@ -0,0 +1,239 @@
+from collections import defaultdict
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Optional, Type
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Select, func, literal, or_, select, true
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.database import Base
+from app.models import (
+    Activity,
+    ActivityTypeEnum,
+    ArchivedActivityCount,
+    Contact,
+    Deal,
+    DealStatusEnum,
+    Organization,
+    OrganizationStats,
+    Task,
+    TaskStatusEnum,
+)
+from app.repositories.base import BaseRepository
+
+STATS_COUNTERS = [
+    column.name
+    for column in OrganizationStats.__table__.columns
+    if column.name not in ("organization_id", "updated_at")
+]
+
+CONTACT_COUNTERS = {"contacts_total": 1}
+
+
+def enum_member(enum_class: Type[Enum], value: Any, default: Enum) -> Enum:
+    if value is None:
+        return default
+    if isinstance(value, enum_class):
+        return value
+    try:
+        return enum_class(value)
+    except ValueError:
+        return enum_class[value]
+
+
+def deal_counters(status: Any, amount: Any) -> Dict[str, Any]:
+    status = enum_member(DealStatusEnum, status, DealStatusEnum.NEW)
+    counters = {"deals_total": 1, f"deals_{status.value}": 1}
+    if status == DealStatusEnum.WON:
+        counters["won_amount"] = amount or 0
+    elif status == DealStatusEnum.IN_PROGRESS:
+        counters["pipeline_amount"] = amount or 0
+    return counters
+
+
+def task_counters(status: Any) -> Dict[str, Any]:
+    status = enum_member(TaskStatusEnum, status, TaskStatusEnum.TODO)
+    return {"tasks_total": 1, f"tasks_{status.value}": 1}
+
+
+def activity_counters(activity_type: Any) -> Dict[str, Any]:
+    activity_type = enum_member(ActivityTypeEnum, activity_type, ActivityTypeEnum.NOTE)
+    return {"activities_total": 1, f"activities_{activity_type.value}": 1}
+
+
+class StatsDelta:
+    def __init__(self):
+        self.values: Dict[str, Any] = defaultdict(int)
+
+    def add(self, counters: Dict[str, Any], count: int = 1) -> "StatsDelta":
+        for name, value in counters.items():
+            self.values[name] += count * value
+        return self
+
+    def remove(self, counters: Dict[str, Any], count: int = 1) -> "StatsDelta":
+        return self.add(counters, -count)
+
+    def changes(self) -> Dict[str, Any]:
+        return {name: value for name, value in self.values.items() if value}
+
+
+class OrganizationStatsRepository(BaseRepository[OrganizationStats]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, OrganizationStats)
+
+    async def get_counters(self, organization_id: UUID) -> Dict[str, Any]:
+        stmt = select(*[OrganizationStats.__table__.c[name] for name in STATS_COUNTERS]).where(
+            OrganizationStats.organization_id == organization_id
+        )
+        result = await self.session.execute(stmt)
+        row = result.mappings().one_or_none()
+        if row is None:
+            return {name: 0 for name in STATS_COUNTERS}
+        return dict(row)
+
+    async def apply(self, organization_id: UUID, delta: StatsDelta) -> None:
+        changes = delta.changes()
+        if not changes:
+            return
+
+        table = OrganizationStats.__table__
+        stmt = self._insert().values(
+            organization_id=organization_id, updated_at=datetime.utcnow(), **changes
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.organization_id],
+            set_={
+                **{name: table.c[name] + stmt.excluded[name] for name in changes},
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def reconcile(self, organization_id: Optional[UUID] = None) -> int:
+        if organization_id is not None:
+            return await self._reconcile(organization_id)
+
+        result = await self.session.execute(select(Organization.id).order_by(Organization.id))
+        repaired = 0
+        for id in result.scalars().all():
+            repaired += await self._reconcile(id)
+        return repaired
+
+    async def _reconcile(self, organization_id: UUID) -> int:
+        table = OrganizationStats.__table__
+        await self.session.execute(
+            self._insert()
+            .from_select(["organization_id"], select(Organization.id).where(
+                Organization.id == organization_id
+            ))
+            .on_conflict_do_nothing(index_elements=[table.c.organization_id])
+        )
+        await self.session.execute(
+            select(table.c.organization_id)
+            .where(table.c.organization_id == organization_id)
+            .with_for_update()
+        )
+
+        stmt = self._insert().from_select(
+            ["organization_id", *STATS_COUNTERS, "updated_at"],
+            self.actual_query(organization_id),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.organization_id],
+            set_={
+                **{name: stmt.excluded[name] for name in STATS_COUNTERS},
+                "updated_at": stmt.excluded.updated_at,
+            },
+            where=or_(*[table.c[name] != stmt.excluded[name] for name in STATS_COUNTERS]),
+        )
+        result = await self.session.execute(stmt)
+        await self.commit()
+        return result.rowcount
+
+    def actual_query(self, organization_id: Optional[UUID] = None) -> Select:
+        sources = [
+            self._grouped(organization_id, Contact, contacts_total=func.count()),
+            self._grouped(
+                organization_id,
+                Deal,
+                deals_total=func.count(),
+                **{
+                    f"deals_{status.value}": func.count().filter(Deal.status == status)
+                    for status in DealStatusEnum
+                },
+                won_amount=func.sum(Deal.amount).filter(Deal.status == DealStatusEnum.WON),
+                pipeline_amount=func.sum(Deal.amount).filter(
+                    Deal.status == DealStatusEnum.IN_PROGRESS
+                ),
+            ),
+            self._grouped(
+                organization_id,
+                Task,
+                tasks_total=func.count(),
+                **{
+                    f"tasks_{status.value}": func.count().filter(Task.status == status)
+                    for status in TaskStatusEnum
+                },
+            ),
+            self._grouped(
+                organization_id,
+                Activity,
+                activities_total=func.count(),
+                **{
+                    f"activities_{activity_type.value}": func.count().filter(
+                        Activity.activity_type == activity_type
+                    )
+                    for activity_type in ActivityTypeEnum
+                },
+            ),
+            self._grouped(
+                organization_id,
+                ArchivedActivityCount,
+                activities_total=func.sum(ArchivedActivityCount.activities),
+                **{
+                    f"activities_{activity_type.value}": func.sum(
+                        ArchivedActivityCount.activities
+                    ).filter(ArchivedActivityCount.activity_type == activity_type)
+                    for activity_type in ActivityTypeEnum
+                },
+            ),
+        ]
+
+        joined = Organization.__table__
+        columns = {}
+        for source in sources:
+            joined = joined.outerjoin(source, source.c.organization_id == Organization.id)
+            for column in source.c:
+                if column.key == "organization_id":
+                    continue
+                value = func.coalesce(column, 0)
+                if column.key in columns:
+                    value = columns[column.key] + value
+                columns[column.key] = value
+
+        stmt = select(
+            Organization.id,
+            *[columns[name] for name in STATS_COUNTERS],
+            literal(datetime.utcnow(), OrganizationStats.updated_at.type),
+        ).select_from(joined).where(true())
+        if organization_id is not None:
+            stmt = stmt.where(Organization.id == organization_id)
+        return stmt
+
+    @staticmethod
+    def _grouped(
+        organization_id: Optional[UUID], model: Type[Base], **aggregates: Any
+    ):
+        stmt = select(
+            model.organization_id.label("organization_id"),
+            *[expr.label(name) for name, expr in aggregates.items()],
+        ).group_by(model.organization_id)
+        if organization_id is not None:
+            stmt = stmt.where(model.organization_id == organization_id)
+        return stmt.subquery(model.__tablename__)
+
+    def _insert(self):
+        if self.dialect_name == "postgresql":
+            return postgresql.insert(OrganizationStats.__table__)
+        return sqlite.insert(OrganizationStats.__table__)
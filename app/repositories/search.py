@@ -0,0 +1,71 @@
+import re
+from typing import Any, List, Tuple, Type
+from sqlalchemy import Select, Text, and_, case, desc, false, func, literal, literal_column, or_
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from app.database import Base
+from app.models.search import (
+    SEARCH_CONFIG,
+    SEARCH_TEXT_COLUMN,
+    SEARCH_VECTOR_COLUMN,
+    search_columns,
+)
+
+TERM_PATTERN = re.compile(r"\w+")
+
+
+def search_terms(query: str) -> List[str]:
+    return TERM_PATTERN.findall(query.lower())
+
+
+class TextSearch:
+    def __init__(self, model: Type[Base]):
+        self.model = model
+        table = model.__table__
+        self.columns = [table.c[name] for name in search_columns(table)]
+        self.vector = literal_column(f"{table.name}.{SEARCH_VECTOR_COLUMN}", TSVECTOR)
+        self.text = literal_column(f"{table.name}.{SEARCH_TEXT_COLUMN}", Text)
+
+    def apply(self, stmt: Select, query: str, dialect: str) -> Select:
+        terms = search_terms(query)
+        if not terms:
+            return stmt.where(false())
+
+        if dialect == "postgresql":
+            condition, rank = self._postgresql(terms)
+        else:
+            condition, rank = self._portable(terms)
+        return stmt.where(condition).order_by(
+            desc(rank), desc(self.model.created_at), desc(self.model.id)
+        )
+
+    def _postgresql(self, terms: List[str]) -> Tuple[Any, Any]:
+        tsquery = func.to_tsquery(
+            literal_column(f"'{SEARCH_CONFIG}'::regconfig"),
+            " & ".join(f"{term}:*" for term in terms),
+        )
+        phrase = literal(" ".join(terms), Text)
+        condition = or_(
+            self.vector.op("@@")(tsquery),
+            phrase.op("<%")(self.text),
+        )
+        rank = func.ts_rank(self.vector, tsquery) + func.word_similarity(phrase, self.text)
+        return condition, rank
+
+    def _portable(self, terms: List[str]) -> Tuple[Any, Any]:
+        condition = and_(
+            *[
+                or_(*[column.icontains(term, autoescape=True) for column in self.columns])
+                for term in terms
+            ]
+        )
+        scores = [
+            case(
+                (column.istartswith(term, autoescape=True), 2),
+                (column.icontains(term, autoescape=True), 1),
+                else_=0,
+            )
+            for term in terms
+            for column in self.columns
+        ]
+        return condition, sum(scores[1:], scores[0])
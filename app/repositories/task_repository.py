@@ -5,6 +5,9 @@ from sqlalchemy import select, and_
 
 from app.models import Task, TaskStatusEnum, TaskPriorityEnum
 from app.repositories.base import BaseRepository
+from app.repositories.search import TextSearch
+
+TASK_SEARCH = TextSearch(Task)
 
 
 class TaskRepository(BaseRepository[Task]):
@@ -12,70 +15,83 @@ class TaskRepository(BaseRepository[Task]):
         super().__init__(session, Task)
 
     async def list_by_organization(
-        self, organization_id: UUID, skip: int = 0, limit: int = 100
+        self, organization_id: UUID, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Task]:
         stmt = select(Task).where(
             Task.organization_id == organization_id
-        ).offset(skip).limit(limit)
+        )
+        stmt = self.paginate(stmt, skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
     async def list_by_contact(
-        self, contact_id: UUID, skip: int = 0, limit: int = 100
+        self, contact_id: UUID, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Task]:
         stmt = select(Task).where(
             Task.contact_id == contact_id
-        ).offset(skip).limit(limit)
+        )
+        stmt = self.paginate(stmt, skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
     async def list_by_deal(
-        self, deal_id: UUID, skip: int = 0, limit: int = 100
+        self, deal_id: UUID, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Task]:
         stmt = select(Task).where(
             Task.deal_id == deal_id
-        ).offset(skip).limit(limit)
+        )
+        stmt = self.paginate(stmt, skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
     async def list_by_assigned_to(
-        self, organization_id: UUID, user_id: UUID, skip: int = 0, limit: int = 100
+        self, organization_id: UUID, user_id: UUID, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Task]:
         stmt = select(Task).where(
             and_(
                 Task.organization_id == organization_id,
                 Task.assigned_to == user_id
             )
-        ).offset(skip).limit(limit)
+        )
+        stmt = self.paginate(stmt, skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
     async def list_by_status(
-        self, organization_id: UUID, status: TaskStatusEnum, skip: int = 0, limit: int = 100
+        self, organization_id: UUID, status: TaskStatusEnum, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Task]:
         stmt = select(Task).where(
             and_(
                 Task.organization_id == organization_id,
                 Task.status == status
             )
-        ).offset(skip).limit(limit)
+        )
+        stmt = self.paginate(stmt, skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
     async def list_by_priority(
-        self, organization_id: UUID, priority: TaskPriorityEnum, skip: int = 0, limit: int = 100
+        self, organization_id: UUID, priority: TaskPriorityEnum, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Task]:
         stmt = select(Task).where(
             and_(
                 Task.organization_id == organization_id,
                 Task.priority == priority
             )
-        ).offset(skip).limit(limit)
+        )
+        stmt = self.paginate(stmt, skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
     async def list_overdue(
-        self, organization_id: UUID, skip: int = 0, limit: int = 100
+        self, organization_id: UUID, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Task]:
         from datetime import datetime
         stmt = select(Task).where(
@@ -84,7 +100,8 @@ class TaskRepository(BaseRepository[Task]):
                 Task.due_date < datetime.utcnow(),
                 Task.status != TaskStatusEnum.DONE
             )
-        ).offset(skip).limit(limit)
+        )
+        stmt = self.paginate(stmt, skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
@@ -92,29 +109,27 @@ class TaskRepository(BaseRepository[Task]):
         self, organization_id: UUID, query: str, skip: int = 0, limit: int = 100
     ) -> List[Task]:
         stmt = select(Task).where(
-            and_(
-                Task.organization_id == organization_id,
-                Task.title.ilike(f"%{query}%")
-            )
-        ).offset(skip).limit(limit)
-        result = await self.session.execute(stmt)
+            Task.organization_id == organization_id
+        )
+        stmt = TASK_SEARCH.apply(stmt, query, self.dialect_name)
+        result = await self.session.execute(stmt.offset(skip).limit(limit))
         return result.scalars().all()
 
     async def count_by_organization(self, organization_id: UUID) -> int:
-        stmt = select(Task).where(
-            Task.organization_id == organization_id
-        )
-        result = await self.session.execute(stmt)
-        return len(result.scalars().all())
+        return await self.count(Task.organization_id == organization_id)
 
     async def count_by_status(
         self, organization_id: UUID, status: TaskStatusEnum
     ) -> int:
-        stmt = select(Task).where(
-            and_(
-                Task.organization_id == organization_id,
-                Task.status == status
-            )
+        return await self.count(
+            Task.organization_id == organization_id,
+            Task.status == status,
+        )
+
+    async def count_overdue(self, organization_id: UUID) -> int:
+        from datetime import datetime
+        return await self.count(
+            Task.organization_id == organization_id,
+            Task.due_date < datetime.utcnow(),
+            Task.status != TaskStatusEnum.DONE,
         )
-        result = await self.session.execute(stmt)
-        return len(result.scalars().all())
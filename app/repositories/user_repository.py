@@ -1,7 +1,7 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, or_
 
 from app.models import User, OrganizationMember
 from app.repositories.base import BaseRepository
@@ -16,20 +16,44 @@ class UserRepository(BaseRepository[User]):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_with_membership(
+        self, user_id: UUID, organization_id: Optional[UUID]
+    ) -> Tuple[Optional[User], Optional[OrganizationMember]]:
+        if organization_id is None:
+            return await self.get(user_id), None
+
+        stmt = select(User, OrganizationMember).outerjoin(
+            OrganizationMember,
+            and_(
+                OrganizationMember.user_id == User.id,
+                OrganizationMember.organization_id == organization_id,
+                OrganizationMember.is_active == True
+            )
+        ).where(User.id == user_id)
+        result = await self.session.execute(stmt)
+        row = result.first()
+        if row is None:
+            return None, None
+        return row[0], row[1]
+
     async def get_by_username(self, username: str) -> Optional[User]:
         stmt = select(User).where(User.username == username)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def list_active(self, skip: int = 0, limit: int = 100) -> List[User]:
+    async def list_active(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> List[User]:
         stmt = select(User).where(
             User.is_active == True
-        ).offset(skip).limit(limit)
+        )
+        stmt = self.paginate(stmt, skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
     async def list_by_organization(
-        self, organization_id: UUID, skip: int = 0, limit: int = 100
+        self, organization_id: UUID, skip: int = 0, limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[User]:
         stmt = select(User).join(
             OrganizationMember,
@@ -39,26 +63,25 @@ class UserRepository(BaseRepository[User]):
                 OrganizationMember.organization_id == organization_id,
                 OrganizationMember.is_active == True
             )
-        ).offset(skip).limit(limit)
+        )
+        stmt = self.paginate(stmt, skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
-    async def search(self, query: str, skip: int = 0, limit: int = 100) -> List[User]:
+    async def search(
+        self, query: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> List[User]:
         stmt = select(User).where(
             (User.email.ilike(f"%{query}%")) |
             (User.username.ilike(f"%{query}%")) |
             (User.first_name.ilike(f"%{query}%")) |
             (User.last_name.ilike(f"%{query}%"))
-        ).offset(skip).limit(limit)
+        )
+        stmt = self.paginate(stmt, skip, limit, cursor)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
-    async def email_exists(self, email: str) -> bool:
-        stmt = select(User).where(User.email == email)
+    async def get_by_email_or_username(self, email: str, username: str) -> Optional[User]:
+        stmt = select(User).where(or_(User.email == email, User.username == username)).limit(1)
         result = await self.session.execute(stmt)
-        return result.scalar_one_or_none() is not None
-
-    async def username_exists(self, username: str) -> bool:
-        stmt = select(User).where(User.username == username)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none() is not None
+        return result.scalar_one_or_none()
@@ -1,15 +1,22 @@
+from app.services.principal_service import PrincipalService, Principal
 from app.services.auth_service import AuthService
 from app.services.contact_service import ContactService
+from app.services.contact_import_service import ContactImportService
 from app.services.deal_service import DealService
 from app.services.task_service import TaskService
 from app.services.activity_service import ActivityService
 from app.services.analytics_service import AnalyticsService
+from app.services.export_service import ExportService
 
 __all__ = [
+    "PrincipalService",
+    "Principal",
     "AuthService",
     "ContactService",
+    "ContactImportService",
     "DealService",
     "TaskService",
     "ActivityService",
     "AnalyticsService",
+    "ExportService",
 ]
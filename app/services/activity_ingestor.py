@@ -0,0 +1,208 @@
+import asyncio
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.config import get_settings
+from app.core.exceptions import ServiceUnavailable
+from app.models import Activity
+from app.repositories import ActivityRepository, OrganizationStatsRepository
+from app.repositories.organization_stats_repository import StatsDelta, activity_counters
+from app.services.analytics_cache import invalidate_analytics
+from app.services.unit_of_work import UnitOfWork
+
+settings = get_settings()
+
+PendingActivity = Tuple[Activity, Optional[asyncio.Future]]
+
+
+@dataclass
+class IngestMetrics:
+    enqueued: int = 0
+    written: int = 0
+    failed: int = 0
+    batches: int = 0
+    max_queue_depth: int = 0
+    last_batch_size: int = 0
+    last_flush_ms: float = 0.0
+    max_flush_ms: float = 0.0
+    total_flush_ms: float = 0.0
+
+    def record_flush(self, size: int, failed: int, elapsed_ms: float) -> None:
+        self.batches += 1
+        self.written += size - failed
+        self.failed += failed
+        self.last_batch_size = size
+        self.last_flush_ms = elapsed_ms
+        self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+        self.total_flush_ms += elapsed_ms
+
+
+ingest_metrics = IngestMetrics()
+
+
+class ActivityIngestor:
+    def __init__(
+        self,
+        bind: AsyncEngine,
+        batch_size: int = 500,
+        flush_interval: float = 0.05,
+        max_pending: int = 10000,
+        queue_timeout: float = 1.0,
+    ):
+        self.bind = bind
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._full: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._closing = False
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def _get_queue(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._full = asyncio.Event()
+            self._closing = False
+            self._flusher = loop.create_task(self._run(self._queue, self._full))
+        return self._queue
+
+    async def submit(self, activity: Activity, durable: bool = True) -> Activity:
+        queue = self._get_queue()
+        acknowledged = self._loop.create_future() if durable else None
+        try:
+            await asyncio.wait_for(queue.put((activity, acknowledged)), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise ServiceUnavailable("Activity ingestion queue is full")
+
+        ingest_metrics.enqueued += 1
+        ingest_metrics.max_queue_depth = max(ingest_metrics.max_queue_depth, queue.qsize())
+        if queue.qsize() >= self.batch_size - 1:
+            self._full.set()
+
+        if acknowledged is not None:
+            await acknowledged
+        return activity
+
+    async def close(self) -> None:
+        if self._flusher is None:
+            return
+        if self._loop is asyncio.get_running_loop():
+            self._closing = True
+            self._full.set()
+            await self._queue.join()
+        self._flusher.cancel()
+        self._flusher = None
+        self._queue = None
+
+    async def _run(self, queue: asyncio.Queue, full: asyncio.Event) -> None:
+        while True:
+            batch = [await queue.get()]
+            if queue.qsize() < self.batch_size - 1 and not self._closing:
+                full.clear()
+                try:
+                    await asyncio.wait_for(full.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _flush(self, batch: List[PendingActivity]) -> None:
+        started = time.perf_counter()
+        activities = [activity for activity, _ in batch]
+        try:
+            await self._write(activities)
+            errors = [None] * len(activities)
+        except IntegrityError:
+            errors = [await self._write_isolated(activity) for activity in activities]
+        except Exception as exc:
+            errors = [exc] * len(activities)
+
+        for (activity, acknowledged), error in zip(batch, errors):
+            if acknowledged is None or acknowledged.done():
+                continue
+            if error is None:
+                acknowledged.set_result(activity)
+            else:
+                acknowledged.set_exception(error)
+
+        for organization_id in {
+            activity.organization_id
+            for activity, error in zip(activities, errors)
+            if error is None
+        }:
+            invalidate_analytics(organization_id)
+
+        ingest_metrics.record_flush(
+            len(batch),
+            sum(1 for error in errors if error is not None),
+            (time.perf_counter() - started) * 1000,
+        )
+
+    async def _write_isolated(self, activity: Activity) -> Optional[Exception]:
+        try:
+            await self._write([activity])
+        except Exception as exc:
+            return exc
+        return None
+
+    async def _write(self, activities: List[Activity]) -> None:
+        deltas = defaultdict(StatsDelta)
+        for activity in activities:
+            deltas[activity.organization_id].add(activity_counters(activity.activity_type))
+
+        async with AsyncSession(self.bind, expire_on_commit=False) as session:
+            stats_repo = OrganizationStatsRepository(session)
+            async with UnitOfWork(session):
+                for organization_id in sorted(deltas):
+                    await stats_repo.apply(organization_id, deltas[organization_id])
+                await ActivityRepository(session).create_many(activities)
+
+
+activity_ingestors: Dict[AsyncEngine, ActivityIngestor] = {}
+
+
+def get_activity_ingestor(bind: AsyncEngine) -> ActivityIngestor:
+    ingestor = activity_ingestors.get(bind)
+    if ingestor is None:
+        ingestor = activity_ingestors[bind] = ActivityIngestor(
+            bind,
+            batch_size=settings.ACTIVITY_INGEST_BATCH_SIZE,
+            flush_interval=settings.ACTIVITY_INGEST_FLUSH_INTERVAL_SECONDS,
+            max_pending=settings.ACTIVITY_INGEST_MAX_PENDING,
+            queue_timeout=settings.ACTIVITY_INGEST_QUEUE_TIMEOUT_SECONDS,
+        )
+    return ingestor
+
+
+async def shutdown_activity_ingestors() -> None:
+    for ingestor in list(activity_ingestors.values()):
+        await ingestor.close()
+    activity_ingestors.clear()
+
+
+def activity_ingest_metrics() -> Dict[str, Any]:
+    metrics = asdict(ingest_metrics)
+    metrics.pop("total_flush_ms")
+    metrics["queue_depth"] = sum(ingestor.depth for ingestor in activity_ingestors.values())
+    metrics["avg_flush_ms"] = (
+        ingest_metrics.total_flush_ms / ingest_metrics.batches if ingest_metrics.batches else 0.0
+    )
+    return metrics
@@ -1,17 +1,24 @@
-from uuid import UUID
+from uuid import UUID, uuid4
 from typing import List, Optional
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Activity, ActivityTypeEnum
-from app.repositories import ActivityRepository
+from app.repositories import ActivityRepository, OrganizationStatsRepository
+from app.repositories.organization_stats_repository import StatsDelta, activity_counters
+from app.config import get_settings
 from app.core.exceptions import NotFound
+from app.services.activity_ingestor import get_activity_ingestor
+from app.services.analytics_cache import invalidate_analytics
+
+settings = get_settings()
 
 
 class ActivityService:
     def __init__(self, session: AsyncSession):
         self.session = session
         self.activity_repo = ActivityRepository(session)
+        self.stats_repo = OrganizationStatsRepository(session)
 
     async def create_activity(
         self,
@@ -23,6 +30,7 @@ class ActivityService:
         contact_id: Optional[UUID] = None,
         deal_id: Optional[UUID] = None,
         activity_date: Optional[datetime] = None,
+        durable: bool = True,
     ) -> Activity:
         activity = Activity(
             organization_id=organization_id,
@@ -34,25 +42,42 @@ class ActivityService:
             description=description,
             activity_date=activity_date or datetime.utcnow(),
         )
-        return await self.activity_repo.create(activity)
+        if settings.ACTIVITY_INGEST_BUFFERED:
+            activity.id = uuid4()
+            activity.created_at = activity.updated_at = datetime.utcnow()
+            ingestor = get_activity_ingestor(self.session.bind)
+            return await ingestor.submit(activity, durable)
+
+        await self.stats_repo.apply(
+            organization_id, StatsDelta().add(activity_counters(activity_type))
+        )
+        activity = await self.activity_repo.create(activity)
+        invalidate_analytics(organization_id)
+        return activity
 
     async def get_activity(self, activity_id: UUID) -> Optional[Activity]:
         return await self.activity_repo.get(activity_id)
 
     async def list_activities(
-        self, organization_id: UUID, skip: int = 0, limit: int = 100
+        self,
+        organization_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Activity]:
-        return await self.activity_repo.list_by_organization(organization_id, skip, limit)
+        return await self.activity_repo.list_by_organization(
+            organization_id, skip, limit, cursor
+        )
 
     async def list_contact_activities(
-        self, contact_id: UUID, limit: int = 10
+        self, contact_id: UUID, limit: int = 10, cursor: Optional[str] = None
     ) -> List[Activity]:
-        return await self.activity_repo.get_recent_by_contact(contact_id, limit)
+        return await self.activity_repo.list_by_contact(contact_id, 0, limit, cursor)
 
     async def list_deal_activities(
-        self, deal_id: UUID, limit: int = 10
+        self, deal_id: UUID, limit: int = 10, cursor: Optional[str] = None
     ) -> List[Activity]:
-        return await self.activity_repo.get_recent_by_deal(deal_id, limit)
+        return await self.activity_repo.list_by_deal(deal_id, 0, limit, cursor)
 
     async def list_user_activities(
         self,
@@ -60,9 +85,10 @@ class ActivityService:
         user_id: UUID,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Activity]:
         return await self.activity_repo.list_by_created_by(
-            organization_id, user_id, skip, limit
+            organization_id, user_id, skip, limit, cursor
         )
 
     async def log_call(
@@ -73,6 +99,7 @@ class ActivityService:
         description: Optional[str] = None,
         contact_id: Optional[UUID] = None,
         deal_id: Optional[UUID] = None,
+        durable: bool = True,
     ) -> Activity:
         return await self.create_activity(
             organization_id=organization_id,
@@ -82,6 +109,7 @@ class ActivityService:
             description=description,
             contact_id=contact_id,
             deal_id=deal_id,
+            durable=durable,
         )
 
     async def log_email(
@@ -92,6 +120,7 @@ class ActivityService:
         description: Optional[str] = None,
         contact_id: Optional[UUID] = None,
         deal_id: Optional[UUID] = None,
+        durable: bool = True,
     ) -> Activity:
         return await self.create_activity(
             organization_id=organization_id,
@@ -101,6 +130,7 @@ class ActivityService:
             description=description,
             contact_id=contact_id,
             deal_id=deal_id,
+            durable=durable,
         )
 
     async def log_meeting(
@@ -112,6 +142,7 @@ class ActivityService:
         contact_id: Optional[UUID] = None,
         deal_id: Optional[UUID] = None,
         activity_date: Optional[datetime] = None,
+        durable: bool = True,
     ) -> Activity:
         return await self.create_activity(
             organization_id=organization_id,
@@ -122,6 +153,7 @@ class ActivityService:
             contact_id=contact_id,
             deal_id=deal_id,
             activity_date=activity_date,
+            durable=durable,
         )
 
     async def log_note(
@@ -132,6 +164,7 @@ class ActivityService:
         description: Optional[str] = None,
         contact_id: Optional[UUID] = None,
         deal_id: Optional[UUID] = None,
+        durable: bool = True,
     ) -> Activity:
         return await self.create_activity(
             organization_id=organization_id,
@@ -141,6 +174,7 @@ class ActivityService:
             description=description,
             contact_id=contact_id,
             deal_id=deal_id,
+            durable=durable,
         )
 
     async def get_recent_activities(
@@ -0,0 +1,18 @@
+from uuid import UUID
+
+from app.config import get_settings
+from app.core.cache import GenerationCounter, StaleWhileRevalidateCache
+
+settings = get_settings()
+
+analytics_cache = StaleWhileRevalidateCache(
+    maxsize=settings.ANALYTICS_CACHE_MAX_SIZE,
+    ttl=settings.ANALYTICS_CACHE_TTL_SECONDS,
+    stale_ttl=settings.ANALYTICS_CACHE_STALE_SECONDS,
+)
+
+analytics_generations = GenerationCounter()
+
+
+def invalidate_analytics(organization_id: UUID) -> None:
+    analytics_generations.bump(organization_id)
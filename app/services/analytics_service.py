@@ -1,10 +1,86 @@
+import asyncio
+import time
+from datetime import date, datetime, timedelta
+from enum import Enum
 from uuid import UUID
-from typing import Dict, List
-from decimal import Decimal
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import DealStatusEnum, TaskStatusEnum, ActivityTypeEnum
-from app.repositories import DealRepository, TaskRepository, ContactRepository, ActivityRepository
+from app.config import get_settings
+from app.core.exceptions import BadRequest
+from app.repositories import (
+    DealRepository,
+    TaskRepository,
+    ContactRepository,
+    ActivityRepository,
+    OrganizationStatsRepository,
+    DailyRollupRepository,
+    DealStatusTransitionRepository,
+)
+from app.models import DealStatusEnum
+from app.repositories.daily_rollup_repository import ROLLUP_METRICS
+from app.repositories.deal_status_transition_repository import FUNNEL_PERCENTILES
+from app.services.analytics_cache import analytics_cache, analytics_generations
+from app.services.deal_service import DealService
+
+settings = get_settings()
+
+SECTION_OK = "ok"
+SECTION_TIMEOUT = "timeout"
+
+DASHBOARD_SECTIONS = {
+    "deals": "get_deals_summary",
+    "tasks": "get_tasks_summary",
+    "contacts": "get_contact_statistics",
+    "activities": "get_activity_statistics",
+    "recent_activities": "get_recent_activities",
+}
+
+
+class Granularity(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+def _funnel_stages() -> List[DealStatusEnum]:
+    stages = [DealStatusEnum.NEW]
+    while True:
+        following = [
+            status
+            for status in DealService.VALID_STATUS_TRANSITIONS[stages[-1]]
+            if status != DealStatusEnum.LOST
+        ]
+        if not following:
+            return stages
+        stages.append(following[0])
+
+
+FUNNEL_STAGES = _funnel_stages()
+
+
+def _rate(part: int, total: int) -> float:
+    return round((part / total * 100) if total > 0 else 0, 2)
+
+
+def _hours(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(float(seconds) / 3600, 2)
+
+
+def _period_start(day: date, granularity: Granularity) -> date:
+    if granularity == Granularity.WEEK:
+        return day - timedelta(days=day.weekday())
+    if granularity == Granularity.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+def _next_period(day: date, granularity: Granularity) -> date:
+    if granularity == Granularity.WEEK:
+        return day + timedelta(days=7)
+    if granularity == Granularity.MONTH:
+        return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return day + timedelta(days=1)
 
 
 class AnalyticsService:
@@ -14,108 +90,248 @@ class AnalyticsService:
         self.task_repo = TaskRepository(session)
         self.contact_repo = ContactRepository(session)
         self.activity_repo = ActivityRepository(session)
+        self.stats_repo = OrganizationStatsRepository(session)
+        self.rollup_repo = DailyRollupRepository(session)
+        self.transition_repo = DealStatusTransitionRepository(session)
 
     async def get_deals_summary(self, organization_id: UUID) -> Dict[str, any]:
-        total = await self.deal_repo.count_by_organization(organization_id)
+        stats = await self.stats_repo.get_counters(organization_id)
+        return self._format_deals(stats)
 
-        new_count = await self.deal_repo.count_by_status(organization_id, DealStatusEnum.NEW)
-        in_progress_count = await self.deal_repo.count_by_status(
-            organization_id, DealStatusEnum.IN_PROGRESS
-        )
-        won_count = await self.deal_repo.count_by_status(organization_id, DealStatusEnum.WON)
-        lost_count = await self.deal_repo.count_by_status(organization_id, DealStatusEnum.LOST)
+    async def get_tasks_summary(self, organization_id: UUID) -> Dict[str, any]:
+        stats = await self.stats_repo.get_counters(organization_id)
+        overdue = await self.task_repo.count_overdue(organization_id)
+        return self._format_tasks(stats, overdue)
 
-        won_amount = await self.deal_repo.get_total_amount_by_organization(organization_id)
+    async def get_contact_statistics(self, organization_id: UUID) -> Dict[str, any]:
+        stats = await self.stats_repo.get_counters(organization_id)
+        return self._format_contacts(stats)
 
-        pipeline_amount = (
-            await self.deal_repo.get_total_amount_by_status(
-                organization_id, DealStatusEnum.IN_PROGRESS
-            )
-        )
+    async def get_activity_statistics(self, organization_id: UUID) -> Dict[str, any]:
+        stats = await self.stats_repo.get_counters(organization_id)
+        return self._format_activities(stats)
+
+    async def get_recent_activities(self, organization_id: UUID, limit: int = 10) -> List[Dict[str, any]]:
+        activities = await self.activity_repo.get_recent_by_organization(organization_id, limit)
+        return [
+            {
+                "id": str(a.id),
+                "title": a.title,
+                "type": a.activity_type,
+                "created_at": a.created_at,
+            }
+            for a in activities
+        ]
+
+    async def get_timeseries(
+        self,
+        organization_id: UUID,
+        granularity: Granularity = Granularity.DAY,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> Dict[str, any]:
+        end = end or datetime.utcnow().date()
+        start = start or end - timedelta(days=settings.ANALYTICS_TIMESERIES_DEFAULT_DAYS - 1)
+        if start > end:
+            raise BadRequest("start must not be after end")
+
+        buckets = [_period_start(start, granularity)]
+        while _next_period(buckets[-1], granularity) <= end:
+            buckets.append(_next_period(buckets[-1], granularity))
+            if len(buckets) > settings.ANALYTICS_TIMESERIES_MAX_BUCKETS:
+                raise BadRequest(
+                    f"Range exceeds {settings.ANALYTICS_TIMESERIES_MAX_BUCKETS} buckets"
+                )
 
+        rows = await self.rollup_repo.series(
+            organization_id,
+            buckets[0],
+            _next_period(buckets[-1], granularity),
+            granularity.value,
+        )
+        filled = {row["bucket"]: row for row in rows}
+        empty = {name: 0 for name in ROLLUP_METRICS}
         return {
-            "total_deals": total,
-            "new": new_count,
-            "in_progress": in_progress_count,
-            "won": won_count,
-            "lost": lost_count,
-            "won_amount": won_amount,
-            "pipeline_amount": pipeline_amount,
-            "win_rate": round((won_count / total * 100) if total > 0 else 0, 2),
+            "granularity": granularity.value,
+            "start": buckets[0],
+            "end": _next_period(buckets[-1], granularity) - timedelta(days=1),
+            "buckets": [
+                {"bucket": bucket, **{**empty, **filled.get(bucket, {})}}
+                for bucket in buckets
+            ],
         }
 
-    async def get_tasks_summary(self, organization_id: UUID) -> Dict[str, any]:
-        total = await self.task_repo.count_by_organization(organization_id)
+    async def get_deals_funnel(
+        self,
+        organization_id: UUID,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> Dict[str, any]:
+        end = end or datetime.utcnow().date()
+        start = start or end - timedelta(days=settings.ANALYTICS_FUNNEL_DEFAULT_DAYS - 1)
+        if start > end:
+            raise BadRequest("start must not be after end")
 
-        todo_count = await self.task_repo.count_by_status(organization_id, TaskStatusEnum.TODO)
-        in_progress_count = await self.task_repo.count_by_status(
-            organization_id, TaskStatusEnum.IN_PROGRESS
+        rows = await self.transition_repo.funnel_by_assignee(
+            organization_id,
+            datetime.combine(start, datetime.min.time()),
+            datetime.combine(end + timedelta(days=1), datetime.min.time()),
         )
-        done_count = await self.task_repo.count_by_status(organization_id, TaskStatusEnum.DONE)
 
-        overdue = await self.task_repo.list_overdue(organization_id, 0, 1000)
+        stages = {stage: {"deals": 0, "advanced": 0, "lost": 0} for stage in FUNNEL_STAGES}
+        assignees = {}
+        for row in rows:
+            if row["stage"] not in stages:
+                continue
+            stage = stages[row["stage"]]
+            for key in ("deals", "advanced", "lost"):
+                stage[key] += row[key]
+            for name in FUNNEL_PERCENTILES:
+                if row[f"{name}_seconds"] is not None:
+                    stage[name] = row[f"{name}_seconds"]
 
-        return {
-            "total_tasks": total,
-            "todo": todo_count,
-            "in_progress": in_progress_count,
-            "done": done_count,
-            "overdue": len(overdue),
-            "completion_rate": round((done_count / total * 100) if total > 0 else 0, 2),
-        }
+            assignee = assignees.setdefault(
+                row["assigned_to"], {stage: {"deals": 0, "lost": 0} for stage in FUNNEL_STAGES}
+            )
+            assignee[row["stage"]]["deals"] += row["deals"]
+            assignee[row["stage"]]["lost"] += row["lost"]
 
-    async def get_contact_statistics(self, organization_id: UUID) -> Dict[str, any]:
-        total_contacts = await self.contact_repo.count_by_organization(organization_id)
+        first, last = FUNNEL_STAGES[0], FUNNEL_STAGES[-1]
+        conversion = {
+            f"{current.value}_to_{following.value}": _rate(
+                stages[following]["deals"], stages[current]["deals"]
+            )
+            for current, following in zip(FUNNEL_STAGES, FUNNEL_STAGES[1:])
+        }
+        conversion[f"{first.value}_to_{last.value}"] = _rate(
+            stages[last]["deals"], stages[first]["deals"]
+        )
 
         return {
-            "total_contacts": total_contacts,
+            "start": start,
+            "end": end,
+            "stages": [
+                {
+                    "stage": stage.value,
+                    "deals": values["deals"],
+                    "advanced": values["advanced"],
+                    "lost": values["lost"],
+                    "median_hours": _hours(values.get("p50")),
+                    "p90_hours": _hours(values.get("p90")),
+                }
+                for stage, values in stages.items()
+            ],
+            "conversion": conversion,
+            "assignees": [
+                {
+                    "assigned_to": assigned_to,
+                    **{stage.value: values[stage]["deals"] for stage in FUNNEL_STAGES},
+                    **{
+                        f"lost_from_{stage.value}": values[stage]["lost"]
+                        for stage in FUNNEL_STAGES[:-1]
+                    },
+                    "drop_off_rate": _rate(
+                        sum(values[stage]["lost"] for stage in FUNNEL_STAGES),
+                        values[first]["deals"],
+                    ),
+                    "win_rate": _rate(values[last]["deals"], values[first]["deals"]),
+                }
+                for assigned_to, values in sorted(
+                    assignees.items(), key=lambda item: -item[1][first]["deals"]
+                )
+            ],
         }
 
-    async def get_activity_statistics(self, organization_id: UUID) -> Dict[str, any]:
-        total = await self.activity_repo.count_by_organization(organization_id)
-
-        calls = await self.activity_repo.count_by_type(
-            organization_id, ActivityTypeEnum.CALL
-        )
-        emails = await self.activity_repo.count_by_type(
-            organization_id, ActivityTypeEnum.EMAIL
-        )
-        meetings = await self.activity_repo.count_by_type(
-            organization_id, ActivityTypeEnum.MEETING
+    async def get_dashboard_summary(self, organization_id: UUID) -> Dict[str, any]:
+        names = list(DASHBOARD_SECTIONS)
+        results = await asyncio.gather(
+            *[self._run_section(name, organization_id) for name in names]
         )
-        notes = await self.activity_repo.count_by_type(
-            organization_id, ActivityTypeEnum.NOTE
+        dashboard = {}
+        sections = {}
+        for name, (value, meta) in zip(names, results):
+            dashboard[name] = value
+            sections[name] = meta
+        dashboard["meta"] = {
+            "partial": any(meta["status"] != SECTION_OK for meta in sections.values()),
+            "sections": sections,
+        }
+        return dashboard
+
+    async def _run_section(
+        self, name: str, organization_id: UUID
+    ) -> Tuple[Any, Dict[str, Any]]:
+        started = time.perf_counter()
+        try:
+            value = await asyncio.wait_for(
+                self._load_section(name, organization_id),
+                settings.DASHBOARD_SECTION_TIMEOUT_SECONDS,
+            )
+            status = SECTION_OK
+        except asyncio.TimeoutError:
+            value = None
+            status = SECTION_TIMEOUT
+        duration_ms = round((time.perf_counter() - started) * 1000, 2)
+        return value, {"status": status, "duration_ms": duration_ms}
+
+    async def _load_section(self, name: str, organization_id: UUID) -> Any:
+        return await self._load(DASHBOARD_SECTIONS[name], organization_id)
+
+    async def cached(self, view: str, organization_id: UUID) -> Any:
+        return await analytics_cache.get_or_load(
+            (organization_id, view),
+            analytics_generations.get(organization_id),
+            lambda: self._load(view, organization_id),
+            cacheable=self._complete,
         )
 
+    async def _load(self, view: str, organization_id: UUID) -> Any:
+        async with AsyncSession(self.session.bind, expire_on_commit=False) as session:
+            service = AnalyticsService(session)
+            return await getattr(service, view)(organization_id)
+
+    @staticmethod
+    def _complete(value: Any) -> bool:
+        return not (isinstance(value, dict) and value.get("meta", {}).get("partial"))
+
+    @staticmethod
+    def _format_deals(stats: Mapping[str, Any]) -> Dict[str, any]:
+        total = stats["deals_total"]
         return {
-            "total_activities": total,
-            "calls": calls,
-            "emails": emails,
-            "meetings": meetings,
-            "notes": notes,
+            "total_deals": total,
+            "new": stats["deals_new"],
+            "in_progress": stats["deals_in_progress"],
+            "won": stats["deals_won"],
+            "lost": stats["deals_lost"],
+            "won_amount": stats["won_amount"],
+            "pipeline_amount": stats["pipeline_amount"],
+            "win_rate": round((stats["deals_won"] / total * 100) if total > 0 else 0, 2),
         }
 
-    async def get_dashboard_summary(self, organization_id: UUID) -> Dict[str, any]:
-        deals_summary = await self.get_deals_summary(organization_id)
-        tasks_summary = await self.get_tasks_summary(organization_id)
-        contacts_stats = await self.get_contact_statistics(organization_id)
-        activity_stats = await self.get_activity_statistics(organization_id)
-        recent_activities = await self.activity_repo.get_recent_by_organization(
-            organization_id, 10
-        )
+    @staticmethod
+    def _format_tasks(stats: Mapping[str, Any], overdue: int) -> Dict[str, any]:
+        total = stats["tasks_total"]
+        return {
+            "total_tasks": total,
+            "todo": stats["tasks_todo"],
+            "in_progress": stats["tasks_in_progress"],
+            "done": stats["tasks_done"],
+            "overdue": overdue,
+            "completion_rate": round((stats["tasks_done"] / total * 100) if total > 0 else 0, 2),
+        }
 
+    @staticmethod
+    def _format_contacts(stats: Mapping[str, Any]) -> Dict[str, any]:
         return {
-            "deals": deals_summary,
-            "tasks": tasks_summary,
-            "contacts": contacts_stats,
-            "activities": activity_stats,
-            "recent_activities": [
-                {
-                    "id": str(a.id),
-                    "title": a.title,
-                    "type": a.activity_type,
-                    "created_at": a.created_at,
-                }
-                for a in recent_activities
-            ],
+            "total_contacts": stats["contacts_total"],
+        }
+
+    @staticmethod
+    def _format_activities(stats: Mapping[str, Any]) -> Dict[str, any]:
+        return {
+            "total_activities": stats["activities_total"],
+            "calls": stats["activities_call"],
+            "emails": stats["activities_email"],
+            "meetings": stats["activities_meeting"],
+            "notes": stats["activities_note"],
         }
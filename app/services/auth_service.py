@@ -1,22 +1,22 @@
-from uuid import UUID
+from uuid import UUID, uuid4
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import User, Organization, OrganizationMember
-from app.core.security import (
-    hash_password,
-    verify_password,
-    create_access_token,
-    create_refresh_token,
-)
+from app.core.security import create_access_token, create_refresh_token
+from app.core.hashing import hash_password_async, verify_password_async
 from app.core.permissions import Role
-from app.repositories import UserRepository
-from app.core.exceptions import BadRequest, Unauthorized
+from app.repositories import UserRepository, OrganizationRepository
+from app.services.principal_service import invalidate_principal
+from app.services.unit_of_work import UnitOfWork
+from app.core.exceptions import BadRequest, Conflict, Unauthorized
 
 
 class AuthService:
     def __init__(self, session: AsyncSession):
         self.session = session
         self.user_repo = UserRepository(session)
+        self.org_repo = OrganizationRepository(session)
 
     async def register(
         self,
@@ -26,37 +26,34 @@ class AuthService:
         last_name: str,
         password: str,
     ) -> dict:
-        if await self.user_repo.email_exists(email):
-            raise BadRequest("Email already registered")
-
-        if await self.user_repo.username_exists(username):
-            raise BadRequest("Username already taken")
-
         user = User(
+            id=uuid4(),
             email=email,
             username=username,
             first_name=first_name,
             last_name=last_name,
-            password_hash=hash_password(password),
+            password_hash=await hash_password_async(password),
         )
-        self.session.add(user)
-        await self.session.commit()
-        await self.session.refresh(user)
-
         org = Organization(
+            id=uuid4(),
             name=f"{first_name} {last_name}'s Organization",
         )
-        self.session.add(org)
-        await self.session.commit()
-        await self.session.refresh(org)
-
-        org_member = OrganizationMember(
-            user_id=user.id,
-            organization_id=org.id,
-            role=Role.OWNER,
-        )
-        self.session.add(org_member)
-        await self.session.commit()
+        try:
+            async with UnitOfWork(self.session) as uow:
+                uow.add(
+                    user,
+                    org,
+                    OrganizationMember(
+                        user_id=user.id,
+                        organization_id=org.id,
+                        role=Role.OWNER,
+                    ),
+                )
+        except IntegrityError:
+            existing = await self.user_repo.get_by_email_or_username(email, username)
+            if existing is not None and existing.email == email:
+                raise Conflict("Email already registered")
+            raise Conflict("Username already taken")
 
         access_token = create_access_token({"sub": str(user.id)})
         refresh_token = create_refresh_token({"sub": str(user.id)})
@@ -71,7 +68,7 @@ class AuthService:
     async def login(self, email: str, password: str) -> dict:
         user = await self.user_repo.get_by_email(email)
 
-        if user is None or not verify_password(password, user.password_hash):
+        if user is None or not await verify_password_async(password, user.password_hash):
             raise Unauthorized("Invalid email or password")
 
         if not user.is_active:
@@ -92,9 +89,10 @@ class AuthService:
         if user is None:
             raise BadRequest("User not found")
 
-        if not verify_password(old_password, user.password_hash):
+        if not await verify_password_async(old_password, user.password_hash):
             raise Unauthorized("Old password is incorrect")
 
-        user.password_hash = hash_password(new_password)
+        user.password_hash = await hash_password_async(new_password)
         await self.session.commit()
+        invalidate_principal(user_id)
         return True
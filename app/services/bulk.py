@@ -0,0 +1,53 @@
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+BULK_CREATED = "created"
+BULK_UPDATED = "updated"
+BULK_DELETED = "deleted"
+BULK_FAILED = "failed"
+
+
+@dataclass
+class BulkItemResult:
+    index: int
+    status: str
+    id: Optional[UUID] = None
+    error: Optional[str] = None
+
+
+class BulkResults:
+    def __init__(self, size: int):
+        self._items: List[Optional[BulkItemResult]] = [None] * size
+
+    def succeed(self, index: int, status: str, id: UUID) -> None:
+        self._items[index] = BulkItemResult(index=index, status=status, id=id)
+
+    def fail(self, index: int, error: str, id: Optional[UUID] = None) -> None:
+        self._items[index] = BulkItemResult(
+            index=index, status=BULK_FAILED, id=id, error=error
+        )
+
+    def by_id(self, ids: List[UUID]) -> Dict[UUID, int]:
+        indexes = {}
+        for index, id in enumerate(ids):
+            if id in indexes:
+                self.fail(index, "Duplicate id in batch", id)
+            else:
+                indexes[id] = index
+        return indexes
+
+    def summary(self) -> Dict[str, Any]:
+        results = [asdict(item) for item in self._items]
+        failed = sum(1 for item in results if item["status"] == BULK_FAILED)
+        return {
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "results": results,
+        }
+
+
+def split_ids(items: List[Dict[str, Any]]) -> Tuple[List[UUID], List[Dict[str, Any]]]:
+    ids = [item["id"] for item in items]
+    changes = [{key: value for key, value in item.items() if key != "id"} for item in items]
+    return ids, changes
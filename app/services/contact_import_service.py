@@ -0,0 +1,177 @@
+import asyncio
+import csv
+import os
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type
+from uuid import UUID, uuid4
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import Table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.core.cache import TTLCache
+from app.core.exceptions import BadRequest
+from app.repositories import ContactRepository, OrganizationStatsRepository
+from app.repositories.contact_repository import CONTACT_IMPORT_COLUMNS, contact_import_staging
+from app.repositories.organization_stats_repository import CONTACT_COUNTERS, StatsDelta
+from app.services.analytics_cache import invalidate_analytics
+
+settings = get_settings()
+
+IMPORT_PENDING = "pending"
+IMPORT_RUNNING = "running"
+IMPORT_COMPLETED = "completed"
+IMPORT_FAILED = "failed"
+
+IMPORT_ENCODING = "utf-8-sig"
+IMPORT_REQUIRED_COLUMNS = ("first_name", "last_name")
+
+
+@dataclass
+class ContactImportJob:
+    organization_id: UUID
+    id: UUID = field(default_factory=uuid4)
+    status: str = IMPORT_PENDING
+    processed: int = 0
+    imported: int = 0
+    skipped: int = 0
+    failed: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+
+    def reject(self, row: int, exc: ValidationError) -> None:
+        self.failed += 1
+        if len(self.errors) < settings.IMPORT_MAX_ROW_ERRORS:
+            self.errors.append({
+                "row": row,
+                "errors": [
+                    f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                    for error in exc.errors()
+                ],
+            })
+
+
+import_jobs = TTLCache(ttl=settings.IMPORT_JOB_TTL_SECONDS)
+
+
+def _read_header(path: str) -> List[str]:
+    with open(path, newline="", encoding=IMPORT_ENCODING) as handle:
+        return next(csv.reader(handle), [])
+
+
+class ContactImportService:
+    def __init__(self, session: AsyncSession, row_model: Type[BaseModel]):
+        self.bind = session.bind
+        self.row_model = row_model
+
+    def get_job(self, organization_id: UUID, job_id: UUID) -> Optional[ContactImportJob]:
+        job = import_jobs.get(job_id)
+        if job is None or job.organization_id != organization_id:
+            return None
+        return job
+
+    async def start(
+        self,
+        organization_id: UUID,
+        chunks: AsyncIterator[bytes],
+    ) -> Tuple[ContactImportJob, str]:
+        handle = tempfile.NamedTemporaryFile(
+            prefix="contact-import-", suffix=".csv", delete=False
+        )
+        try:
+            with handle:
+                async for chunk in chunks:
+                    await asyncio.to_thread(handle.write, chunk)
+            header = await asyncio.to_thread(_read_header, handle.name)
+        except UnicodeDecodeError:
+            os.unlink(handle.name)
+            raise BadRequest("CSV file must be UTF-8 encoded")
+        except BaseException:
+            os.unlink(handle.name)
+            raise
+
+        missing = [column for column in IMPORT_REQUIRED_COLUMNS if column not in header]
+        if missing:
+            os.unlink(handle.name)
+            raise BadRequest(f"Missing required columns: {', '.join(missing)}")
+
+        job = ContactImportJob(organization_id=organization_id)
+        import_jobs.set(job.id, job)
+        return job, handle.name
+
+    async def run(self, job: ContactImportJob, path: str) -> None:
+        job.status = IMPORT_RUNNING
+        staging = contact_import_staging(f"contact_import_{job.id.hex}")
+        try:
+            async with self.bind.connect() as connection:
+                async with AsyncSession(connection, expire_on_commit=False) as session:
+                    await self._load(job, path, staging, ContactRepository(session))
+            job.status = IMPORT_COMPLETED
+        except Exception as exc:
+            job.status = IMPORT_FAILED
+            job.error = f"Import aborted after {job.processed} rows: {exc.__class__.__name__}"
+        finally:
+            job.finished_at = datetime.utcnow()
+            os.unlink(path)
+
+    async def _load(
+        self,
+        job: ContactImportJob,
+        path: str,
+        staging: Table,
+        contact_repo: ContactRepository,
+    ) -> None:
+        stats_repo = OrganizationStatsRepository(contact_repo.session)
+        await contact_repo.create_import_staging(staging)
+        try:
+            with open(path, newline="", encoding=IMPORT_ENCODING) as handle:
+                reader = csv.DictReader(handle)
+                while True:
+                    rows, read = await asyncio.to_thread(self._read_chunk, reader, job)
+                    if not read:
+                        break
+                    if rows:
+                        await contact_repo.stage_import(staging, rows)
+                        imported = await contact_repo.merge_import(staging, job.organization_id)
+                        await stats_repo.apply(
+                            job.organization_id, StatsDelta().add(CONTACT_COUNTERS, imported)
+                        )
+                        await contact_repo.session.commit()
+                        job.imported += imported
+                        if imported:
+                            invalidate_analytics(job.organization_id)
+                        job.skipped += len(rows) - imported
+                    job.processed += read
+        finally:
+            await contact_repo.session.rollback()
+            await contact_repo.drop_import_staging(staging)
+
+    def _read_chunk(
+        self, reader: csv.DictReader, job: ContactImportJob
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        rows = []
+        read = 0
+        for record in islice(reader, settings.IMPORT_CHUNK_SIZE):
+            read += 1
+            values = {
+                column: (record.get(column) or "").strip() or None
+                for column in CONTACT_IMPORT_COLUMNS
+                if column in record
+            }
+            try:
+                contact = self.row_model.model_validate(values)
+            except ValidationError as exc:
+                job.reject(reader.line_num, exc)
+                continue
+            rows.append({
+                "row_number": reader.line_num,
+                "id": uuid4(),
+                **{column: None for column in CONTACT_IMPORT_COLUMNS},
+                **contact.model_dump(include=set(CONTACT_IMPORT_COLUMNS)),
+            })
+        return rows, read
@@ -1,10 +1,24 @@
 from uuid import UUID
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Contact, Deal
-from app.repositories import ContactRepository, DealRepository
+from app.core.pagination import encode_cursor
+from app.models import ActivityTypeEnum, Contact, Deal, DealStatusEnum
+from app.repositories import ContactRepository, DealRepository, OrganizationStatsRepository
+from app.repositories.organization_stats_repository import (
+    CONTACT_COUNTERS,
+    StatsDelta,
+    enum_member,
+)
 from app.core.exceptions import NotFound, BadRequest
+from app.services.bulk import BulkResults, BULK_CREATED, BULK_UPDATED, BULK_DELETED, split_ids
+from app.services.analytics_cache import invalidate_analytics
+
+
+TIMELINE_DETAIL_ENUMS = {
+    "activity": ActivityTypeEnum,
+    "deal_status_changed": DealStatusEnum,
+}
 
 
 class ContactService:
@@ -12,6 +26,7 @@ class ContactService:
         self.session = session
         self.contact_repo = ContactRepository(session)
         self.deal_repo = DealRepository(session)
+        self.stats_repo = OrganizationStatsRepository(session)
 
     async def create_contact(
         self,
@@ -42,38 +57,77 @@ class ContactService:
             postal_code=postal_code,
             notes=notes,
         )
-        return await self.contact_repo.create(contact)
+        await self.stats_repo.apply(organization_id, StatsDelta().add(CONTACT_COUNTERS))
+        contact = await self.contact_repo.create(contact)
+        invalidate_analytics(organization_id)
+        return contact
 
     async def get_contact(self, contact_id: UUID) -> Optional[Contact]:
         return await self.contact_repo.get(contact_id)
 
+    async def get_timeline(
+        self,
+        organization_id: UUID,
+        contact_id: UUID,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        contact = await self.contact_repo.get(contact_id)
+        if contact is None or contact.organization_id != organization_id:
+            raise NotFound("Contact not found")
+
+        events = []
+        for row in await self.contact_repo.timeline(contact_id, limit, cursor):
+            event = dict(row)
+            detail_enum = TIMELINE_DETAIL_ENUMS.get(event["kind"])
+            if detail_enum is not None and event["detail"] is not None:
+                event["detail"] = enum_member(detail_enum, event["detail"], None).value
+            events.append(event)
+
+        next_cursor = None
+        if len(events) == limit:
+            last = events[-1]
+            next_cursor = encode_cursor(last["occurred_at"], last["kind"], last["id"])
+        return events, next_cursor
+
     async def list_contacts(
-        self, organization_id: UUID, skip: int = 0, limit: int = 100
+        self,
+        organization_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Contact]:
-        return await self.contact_repo.list_by_organization(organization_id, skip, limit)
+        return await self.contact_repo.list_by_organization(
+            organization_id, skip, limit, cursor
+        )
 
     async def update_contact(
-        self, contact_id: UUID, updates: dict
+        self, contact_id: UUID, updates: dict, version: Optional[int] = None
     ) -> Optional[Contact]:
-        contact = await self.contact_repo.get(contact_id)
+        contact = await self.contact_repo.update(contact_id, updates, version=version)
         if contact is None:
             raise NotFound("Contact not found")
 
-        return await self.contact_repo.update(contact_id, updates)
+        return contact
 
     async def delete_contact(self, contact_id: UUID) -> bool:
-        contact = await self.contact_repo.get(contact_id)
-        if contact is None:
-            raise NotFound("Contact not found")
-
-        deals = await self.deal_repo.list_by_contact(contact_id)
+        deals = await self.deal_repo.list_by_contact(contact_id, limit=1)
         if deals:
             raise BadRequest(
                 "Cannot delete contact with associated deals. "
                 "Please delete or reassign deals first."
             )
 
-        return await self.contact_repo.delete(contact_id)
+        contact = await self.contact_repo.get_for_update(contact_id)
+        if contact is None:
+            raise NotFound("Contact not found")
+
+        await self.stats_repo.apply(
+            contact.organization_id, StatsDelta().remove(CONTACT_COUNTERS)
+        )
+        await self.contact_repo.delete(contact_id)
+        invalidate_analytics(contact.organization_id)
+        return True
 
     async def search_contacts(
         self,
@@ -88,3 +142,72 @@ class ContactService:
 
     async def get_contact_count(self, organization_id: UUID) -> int:
         return await self.contact_repo.count_by_organization(organization_id)
+
+    async def bulk_create_contacts(
+        self, organization_id: UUID, items: List[dict]
+    ) -> Dict[str, Any]:
+        results = BulkResults(len(items))
+        await self.stats_repo.apply(
+            organization_id, StatsDelta().add(CONTACT_COUNTERS, len(items))
+        )
+        created = await self.contact_repo.create_many(
+            [Contact(organization_id=organization_id, **item) for item in items]
+        )
+        for index, contact in enumerate(created):
+            results.succeed(index, BULK_CREATED, contact.id)
+
+        invalidate_analytics(organization_id)
+        return results.summary()
+
+    async def bulk_update_contacts(
+        self, organization_id: UUID, items: List[dict]
+    ) -> Dict[str, Any]:
+        results = BulkResults(len(items))
+        ids, changes = split_ids(items)
+        indexes = results.by_id(ids)
+        found = await self.contact_repo.existing_ids(
+            indexes, Contact.organization_id == organization_id, for_update=True
+        )
+
+        pending = {}
+        for contact_id, index in indexes.items():
+            if contact_id in found:
+                pending[contact_id] = changes[index]
+            else:
+                results.fail(index, "Contact not found", contact_id)
+
+        await self.contact_repo.update_many(pending)
+        for contact_id in pending:
+            results.succeed(indexes[contact_id], BULK_UPDATED, contact_id)
+
+        return results.summary()
+
+    async def bulk_delete_contacts(
+        self, organization_id: UUID, ids: List[UUID]
+    ) -> Dict[str, Any]:
+        results = BulkResults(len(ids))
+        indexes = results.by_id(ids)
+        blocked = await self.deal_repo.contacts_with_deals(indexes)
+        found = await self.contact_repo.existing_ids(
+            [contact_id for contact_id in indexes if contact_id not in blocked],
+            Contact.organization_id == organization_id,
+            for_update=True,
+        )
+        await self.stats_repo.apply(
+            organization_id, StatsDelta().remove(CONTACT_COUNTERS, len(found))
+        )
+        deleted = await self.contact_repo.delete_many(
+            found, Contact.organization_id == organization_id
+        )
+
+        for contact_id, index in indexes.items():
+            if contact_id in blocked:
+                results.fail(index, "Cannot delete contact with associated deals", contact_id)
+            elif contact_id in deleted:
+                results.succeed(index, BULK_DELETED, contact_id)
+            else:
+                results.fail(index, "Contact not found", contact_id)
+
+        if deleted:
+            invalidate_analytics(organization_id)
+        return results.summary()
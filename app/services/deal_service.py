@@ -1,12 +1,43 @@
-from uuid import UUID
-from typing import List, Optional
+from uuid import UUID, uuid4
+from typing import Any, Dict, List, Optional
 from decimal import Decimal
 from datetime import datetime
+from enum import Enum
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Deal, DealStatusEnum, Activity, ActivityTypeEnum
-from app.repositories import DealRepository, ActivityRepository
-from app.core.exceptions import NotFound, BadRequest
+from app.core.pagination import decode_cursor, encode_cursor
+
+from app.models import (
+    Deal,
+    DealStatusEnum,
+    DealStatusTransition,
+    Activity,
+    ActivityTypeEnum,
+    Contact,
+)
+from app.repositories import (
+    DealRepository,
+    ActivityRepository,
+    ContactRepository,
+    OrganizationStatsRepository,
+    DealStatusTransitionRepository,
+)
+from app.repositories.deal_repository import BOARD_ORDERINGS
+from app.repositories.organization_stats_repository import (
+    StatsDelta,
+    activity_counters,
+    deal_counters,
+    enum_member,
+)
+from app.core.exceptions import NotFound, BadRequest, Conflict
+from app.services.bulk import BulkResults, BULK_CREATED, BULK_UPDATED, BULK_DELETED, split_ids
+from app.services.analytics_cache import invalidate_analytics
+from app.services.unit_of_work import UnitOfWork
+
+
+class DealBoardSort(str, Enum):
+    AMOUNT = "amount"
+    EXPECTED_CLOSE_DATE = "expected_close_date"
 
 
 class DealService:
@@ -18,10 +49,15 @@ class DealService:
         DealStatusEnum.CLOSED: [],
     }
 
+    CLOSING_STATUSES = (DealStatusEnum.WON, DealStatusEnum.LOST)
+
     def __init__(self, session: AsyncSession):
         self.session = session
         self.deal_repo = DealRepository(session)
         self.activity_repo = ActivityRepository(session)
+        self.contact_repo = ContactRepository(session)
+        self.stats_repo = OrganizationStatsRepository(session)
+        self.transition_repo = DealStatusTransitionRepository(session)
 
     async def create_deal(
         self,
@@ -45,38 +81,64 @@ class DealService:
             amount=amount,
             expected_close_date=expected_close_date,
         )
-        return await self.deal_repo.create(deal)
+        await self.stats_repo.apply(
+            organization_id, StatsDelta().add(deal_counters(None, amount))
+        )
+        deal = await self.deal_repo.create(deal)
+        invalidate_analytics(organization_id)
+        return deal
 
     async def get_deal(self, deal_id: UUID) -> Optional[Deal]:
         return await self.deal_repo.get(deal_id)
 
     async def list_deals(
-        self, organization_id: UUID, skip: int = 0, limit: int = 100
+        self,
+        organization_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Deal]:
-        return await self.deal_repo.list_by_organization(organization_id, skip, limit)
+        return await self.deal_repo.list_by_organization(
+            organization_id, skip, limit, cursor
+        )
 
     async def update_deal(
-        self, deal_id: UUID, updates: dict
+        self,
+        deal_id: UUID,
+        updates: dict,
+        user_id: Optional[UUID] = None,
+        version: Optional[int] = None,
     ) -> Optional[Deal]:
-        deal = await self.deal_repo.get(deal_id)
-        if deal is None:
-            raise NotFound("Deal not found")
-
         if "amount" in updates and updates["amount"] is not None:
             if updates["amount"] <= 0:
                 raise BadRequest("Deal amount must be greater than 0")
 
-        return await self.deal_repo.update(deal_id, updates)
+        delta, transitions = None, []
+        if "status" in updates or "amount" in updates:
+            deal = await self._current(deal_id, version)
+            updates = self._with_closed_date(deal, updates)
+            delta = self._transition(deal, updates)
+            transitions = self._status_changes(deal, updates, user_id)
+
+        async with UnitOfWork(self.session):
+            deal = await self.deal_repo.update(deal_id, updates, version=version)
+            if deal is None:
+                raise NotFound("Deal not found")
+            if delta is not None:
+                await self.stats_repo.apply(deal.organization_id, delta)
+                await self.transition_repo.record(transitions)
+
+        invalidate_analytics(deal.organization_id)
+        return deal
 
     async def change_deal_status(
         self,
         deal_id: UUID,
         new_status: DealStatusEnum,
         user_id: UUID,
+        version: Optional[int] = None,
     ) -> Optional[Deal]:
-        deal = await self.deal_repo.get(deal_id)
-        if deal is None:
-            raise NotFound("Deal not found")
+        deal = await self._current(deal_id, version)
 
         current_status = deal.status
         if new_status not in self.VALID_STATUS_TRANSITIONS.get(current_status, []):
@@ -84,19 +146,16 @@ class DealService:
                 f"Cannot transition from {current_status} to {new_status}"
             )
 
+        updates = {"status": new_status}
         if new_status == DealStatusEnum.WON:
             if deal.amount is None or deal.amount <= 0:
                 raise BadRequest(
                     "Deal must have amount > 0 to be marked as won"
                 )
-            deal.closed_date = datetime.utcnow()
+            updates["closed_date"] = datetime.utcnow()
 
         if new_status == DealStatusEnum.LOST:
-            deal.closed_date = datetime.utcnow()
-
-        deal.status = new_status
-        await self.session.commit()
-        await self.session.refresh(deal)
+            updates["closed_date"] = datetime.utcnow()
 
         activity = Activity(
             organization_id=deal.organization_id,
@@ -106,16 +165,33 @@ class DealService:
             title=f"Deal status changed to {new_status}",
             description=f"Status changed from {current_status} to {new_status}",
         )
-        await self.activity_repo.create(activity)
+        delta = self._transition(deal, updates).add(activity_counters(activity.activity_type))
+        transitions = self._status_changes(deal, updates, user_id)
+
+        async with UnitOfWork(self.session):
+            deal = await self.deal_repo.update(deal_id, updates, version=version)
+            if deal is None:
+                raise NotFound("Deal not found")
+            await self.stats_repo.apply(deal.organization_id, delta)
+            await self.transition_repo.record(transitions)
+            await self.activity_repo.create(activity)
 
+        invalidate_analytics(deal.organization_id)
         return deal
 
     async def delete_deal(self, deal_id: UUID) -> bool:
-        deal = await self.deal_repo.get(deal_id)
+        deal = await self.deal_repo.get_for_update(deal_id)
         if deal is None:
             raise NotFound("Deal not found")
 
-        return await self.deal_repo.delete(deal_id)
+        await self.stats_repo.apply(
+            deal.organization_id,
+            StatsDelta().remove(deal_counters(deal.status, deal.amount)),
+        )
+        await self.deal_repo.delete(deal_id)
+
+        invalidate_analytics(deal.organization_id)
+        return True
 
     async def search_deals(
         self,
@@ -134,11 +210,200 @@ class DealService:
         status: DealStatusEnum,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Deal]:
-        return await self.deal_repo.list_by_status(organization_id, status, skip, limit)
+        return await self.deal_repo.list_by_status(
+            organization_id, status, skip, limit, cursor
+        )
+
+    async def get_board(
+        self,
+        organization_id: UUID,
+        sort: DealBoardSort = DealBoardSort.AMOUNT,
+        limit: int = 20,
+        status: Optional[DealStatusEnum] = None,
+        cursor: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        if cursor is not None and status is None:
+            raise BadRequest("Board cursor requires a status")
+        _, _, kind = BOARD_ORDERINGS[sort.value]
+        after = decode_cursor(cursor, kind, UUID) if cursor is not None else None
+
+        columns = {
+            member: {
+                "status": member.value,
+                "count": 0,
+                "total_amount": Decimal("0"),
+                "deals": [],
+                "next_cursor": None,
+            }
+            for member in DealStatusEnum
+            if status in (None, member)
+        }
+        keys = {}
+        rows = await self.deal_repo.board(organization_id, sort.value, limit + 1, status, after)
+        for row in rows:
+            member = enum_member(DealStatusEnum, row["status"], DealStatusEnum.NEW)
+            column = columns[member]
+            column["count"] = row["deals"]
+            column["total_amount"] = Decimal(str(row["amount"]))
+            deal = row["deal"]
+            if deal is None:
+                continue
+            if len(column["deals"]) == limit:
+                column["next_cursor"] = encode_cursor(keys[member], column["deals"][-1].id)
+                continue
+            column["deals"].append(deal)
+            keys[member] = row["sort_key"]
+        return list(columns.values())
 
     async def get_total_won_amount(self, organization_id: UUID) -> Decimal:
         return await self.deal_repo.get_total_amount_by_organization(organization_id)
 
     async def get_deal_count(self, organization_id: UUID) -> int:
         return await self.deal_repo.count_by_organization(organization_id)
+
+    async def bulk_create_deals(
+        self, organization_id: UUID, items: List[dict]
+    ) -> Dict[str, Any]:
+        results = BulkResults(len(items))
+        contacts = await self.contact_repo.existing_ids(
+            {item["contact_id"] for item in items},
+            Contact.organization_id == organization_id,
+        )
+
+        pending = {}
+        for index, item in enumerate(items):
+            if item.get("amount") is not None and item["amount"] <= 0:
+                results.fail(index, "Deal amount must be greater than 0")
+            elif item["contact_id"] not in contacts:
+                results.fail(index, "Contact not found")
+            else:
+                pending[index] = Deal(organization_id=organization_id, **item)
+
+        delta = StatsDelta()
+        for deal in pending.values():
+            delta.add(deal_counters(None, deal.amount))
+        await self.stats_repo.apply(organization_id, delta)
+        created = await self.deal_repo.create_many(list(pending.values()))
+        for index, deal in zip(pending, created):
+            results.succeed(index, BULK_CREATED, deal.id)
+
+        if created:
+            invalidate_analytics(organization_id)
+        return results.summary()
+
+    async def bulk_update_deals(
+        self, organization_id: UUID, items: List[dict], user_id: Optional[UUID] = None
+    ) -> Dict[str, Any]:
+        results = BulkResults(len(items))
+        ids, changes = split_ids(items)
+        indexes = results.by_id(ids)
+        found = await self.deal_repo.get_many(
+            indexes, Deal.organization_id == organization_id, for_update=True
+        )
+
+        pending = {}
+        delta = StatsDelta()
+        transitions = []
+        for deal_id, index in indexes.items():
+            amount = changes[index].get("amount")
+            if deal_id not in found:
+                results.fail(index, "Deal not found", deal_id)
+            elif amount is not None and amount <= 0:
+                results.fail(index, "Deal amount must be greater than 0", deal_id)
+            else:
+                pending[deal_id] = self._with_closed_date(found[deal_id], changes[index])
+                delta.add(self._transition(found[deal_id], pending[deal_id]).values)
+                transitions.extend(
+                    self._status_changes(found[deal_id], pending[deal_id], user_id)
+                )
+
+        await self.stats_repo.apply(organization_id, delta)
+        await self.transition_repo.record(transitions)
+        await self.deal_repo.update_many(pending)
+        for deal_id in pending:
+            results.succeed(indexes[deal_id], BULK_UPDATED, deal_id)
+
+        if pending:
+            invalidate_analytics(organization_id)
+        return results.summary()
+
+    async def bulk_delete_deals(
+        self, organization_id: UUID, ids: List[UUID]
+    ) -> Dict[str, Any]:
+        results = BulkResults(len(ids))
+        indexes = results.by_id(ids)
+        found = await self.deal_repo.get_many(
+            indexes, Deal.organization_id == organization_id, for_update=True
+        )
+        delta = StatsDelta()
+        for deal in found.values():
+            delta.remove(deal_counters(deal.status, deal.amount))
+        await self.stats_repo.apply(organization_id, delta)
+        deleted = await self.deal_repo.delete_many(
+            found, Deal.organization_id == organization_id
+        )
+
+        for deal_id, index in indexes.items():
+            if deal_id in deleted:
+                results.succeed(index, BULK_DELETED, deal_id)
+            else:
+                results.fail(index, "Deal not found", deal_id)
+
+        if deleted:
+            invalidate_analytics(organization_id)
+        return results.summary()
+
+    async def _current(self, deal_id: UUID, version: Optional[int]) -> Deal:
+        if version is None:
+            deal = await self.deal_repo.get_for_update(deal_id)
+        else:
+            deal = await self.deal_repo.get(deal_id)
+        if deal is None:
+            raise NotFound("Deal not found")
+        if version is not None and deal.version != version:
+            raise Conflict("Deal was modified by another request")
+        return deal
+
+    @staticmethod
+    def _transition(deal: Deal, updates: Dict[str, Any]) -> StatsDelta:
+        return StatsDelta().remove(deal_counters(deal.status, deal.amount)).add(
+            deal_counters(
+                updates.get("status", deal.status), updates.get("amount", deal.amount)
+            )
+        )
+
+    @classmethod
+    def _with_closed_date(cls, deal: Deal, updates: Dict[str, Any]) -> Dict[str, Any]:
+        if updates.get("status") is None or updates.get("closed_date") is not None:
+            return updates
+
+        to_status = enum_member(DealStatusEnum, updates["status"], deal.status)
+        if to_status == deal.status or to_status not in cls.CLOSING_STATUSES:
+            return updates
+        return {**updates, "closed_date": datetime.utcnow()}
+
+    @staticmethod
+    def _status_changes(
+        deal: Deal, updates: Dict[str, Any], user_id: Optional[UUID]
+    ) -> List[DealStatusTransition]:
+        if updates.get("status") is None:
+            return []
+
+        to_status = enum_member(DealStatusEnum, updates["status"], deal.status)
+        if to_status == deal.status:
+            return []
+
+        return [
+            DealStatusTransition(
+                id=uuid4(),
+                organization_id=deal.organization_id,
+                deal_id=deal.id,
+                from_status=deal.status,
+                to_status=to_status,
+                changed_by=user_id,
+                amount=updates.get("amount", deal.amount),
+                changed_at=datetime.utcnow(),
+            )
+        ]
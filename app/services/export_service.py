@@ -0,0 +1,102 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, Iterable, List, Type
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.repositories import (
+    ActivityRepository,
+    BaseRepository,
+    ContactRepository,
+    DealRepository,
+    TaskRepository,
+)
+
+settings = get_settings()
+
+
+class ExportResource(str, Enum):
+    CONTACTS = "contacts"
+    DEALS = "deals"
+    TASKS = "tasks"
+    ACTIVITIES = "activities"
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+EXPORT_REPOSITORIES: Dict[ExportResource, Type[BaseRepository]] = {
+    ExportResource.CONTACTS: ContactRepository,
+    ExportResource.DEALS: DealRepository,
+    ExportResource.TASKS: TaskRepository,
+    ExportResource.ACTIVITIES: ActivityRepository,
+}
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    plain = _plain(value)
+    if plain is value:
+        raise TypeError(f"{type(value).__name__} is not JSON serializable")
+    return plain
+
+
+def _csv_chunk(rows: Iterable[List[Any]]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+class ExportService:
+    def __init__(self, session: AsyncSession):
+        self.bind = session.bind
+
+    async def export(
+        self,
+        resource: ExportResource,
+        organization_id: UUID,
+        format: ExportFormat,
+    ) -> AsyncIterator[str]:
+        repository_class = EXPORT_REPOSITORIES[resource]
+        async with self.bind.connect() as connection:
+            async with AsyncSession(connection) as session:
+                repo = repository_class(session)
+                columns = [column.name for column in repo.model.__table__.columns]
+                if format == ExportFormat.CSV:
+                    yield _csv_chunk([columns])
+
+                batches = repo.stream_rows(
+                    repo.model.organization_id == organization_id,
+                    batch_size=settings.EXPORT_BATCH_SIZE,
+                )
+                async for rows in batches:
+                    if format == ExportFormat.NDJSON:
+                        yield "".join(
+                            json.dumps(dict(row), default=_json_default) + "\n"
+                            for row in rows
+                        )
+                    else:
+                        yield _csv_chunk(
+                            [_plain(row[column]) for column in columns] for row in rows
+                        )
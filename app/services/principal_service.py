@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple, Type
+from uuid import UUID
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.config import get_settings
+from app.core.cache import TTLCache
+from app.database import Base
+from app.models import User, OrganizationMember
+from app.repositories import UserRepository
+
+settings = get_settings()
+
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+PrincipalKey = Tuple[UUID, Optional[UUID]]
+
+
+@dataclass
+class Principal:
+    user: User
+    member: Optional[OrganizationMember] = None
+
+
+def invalidate_principal(user_id: UUID) -> None:
+    principal_cache.invalidate(lambda key: key[0] == user_id)
+
+
+def _snapshot(obj: Optional[Base]) -> Optional[Dict[str, Any]]:
+    if obj is None:
+        return None
+    return {
+        attr.key: getattr(obj, attr.key)
+        for attr in inspect(obj).mapper.column_attrs
+    }
+
+
+class PrincipalService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.user_repo = UserRepository(session)
+
+    @property
+    def _memo(self) -> Dict[PrincipalKey, Principal]:
+        return self.session.info.setdefault("principals", {})
+
+    async def resolve(
+        self, user_id: UUID, organization_id: Optional[UUID] = None
+    ) -> Optional[Principal]:
+        key = (user_id, organization_id)
+        memo = self._memo
+
+        if key in memo:
+            return memo[key]
+        if organization_id is None:
+            for (memo_user_id, _), principal in memo.items():
+                if memo_user_id == user_id:
+                    return principal
+
+        principal = await self._from_cache(key)
+        if principal is None:
+            principal = await self._load(user_id, organization_id)
+
+        memo[key] = principal
+        return principal
+
+    async def _from_cache(self, key: PrincipalKey) -> Optional[Principal]:
+        cached = principal_cache.get(key)
+        if cached is None:
+            return None
+
+        user_values, member_values = cached
+        user = await self._attach(User, user_values)
+        member = None
+        if member_values is not None:
+            member = await self._attach(OrganizationMember, member_values)
+        return Principal(user=user, member=member)
+
+    async def _attach(self, model: Type[Base], values: Dict[str, Any]) -> Base:
+        obj = model(**values)
+        make_transient_to_detached(obj)
+        return await self.session.merge(obj, load=False)
+
+    async def _load(
+        self, user_id: UUID, organization_id: Optional[UUID]
+    ) -> Optional[Principal]:
+        user, member = await self.user_repo.get_with_membership(
+            user_id, organization_id
+        )
+        if user is None:
+            return None
+
+        if organization_id is None or member is not None:
+            principal_cache.set(
+                (user_id, organization_id), (_snapshot(user), _snapshot(member))
+            )
+        return Principal(user=user, member=member)
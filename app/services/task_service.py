@@ -1,18 +1,34 @@
 from uuid import UUID
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Task, TaskStatusEnum, TaskPriorityEnum
-from app.repositories import TaskRepository
-from app.core.exceptions import NotFound, BadRequest, Forbidden
+from app.models import Task, TaskStatusEnum, TaskPriorityEnum, Contact, Deal
+from app.repositories import (
+    TaskRepository,
+    ContactRepository,
+    DealRepository,
+    UserRepository,
+    OrganizationStatsRepository,
+)
+from app.repositories.organization_stats_repository import (
+    StatsDelta, enum_member, task_counters,
+)
+from app.core.exceptions import NotFound, BadRequest, Conflict, Forbidden
 from app.core.permissions import Role
+from app.services.bulk import BulkResults, BULK_CREATED, BULK_UPDATED, BULK_DELETED, split_ids
+from app.services.analytics_cache import invalidate_analytics
+from app.services.unit_of_work import UnitOfWork
 
 
 class TaskService:
     def __init__(self, session: AsyncSession):
         self.session = session
         self.task_repo = TaskRepository(session)
+        self.contact_repo = ContactRepository(session)
+        self.deal_repo = DealRepository(session)
+        self.user_repo = UserRepository(session)
+        self.stats_repo = OrganizationStatsRepository(session)
 
     async def create_task(
         self,
@@ -39,15 +55,24 @@ class TaskService:
             priority=priority,
             due_date=due_date,
         )
-        return await self.task_repo.create(task)
+        await self.stats_repo.apply(organization_id, StatsDelta().add(task_counters(None)))
+        task = await self.task_repo.create(task)
+        invalidate_analytics(organization_id)
+        return task
 
     async def get_task(self, task_id: UUID) -> Optional[Task]:
         return await self.task_repo.get(task_id)
 
     async def list_tasks(
-        self, organization_id: UUID, skip: int = 0, limit: int = 100
+        self,
+        organization_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Task]:
-        return await self.task_repo.list_by_organization(organization_id, skip, limit)
+        return await self.task_repo.list_by_organization(
+            organization_id, skip, limit, cursor
+        )
 
     async def list_tasks_for_user(
         self,
@@ -55,9 +80,10 @@ class TaskService:
         user_id: UUID,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Task]:
         return await self.task_repo.list_by_assigned_to(
-            organization_id, user_id, skip, limit
+            organization_id, user_id, skip, limit, cursor
         )
 
     async def update_task(
@@ -66,35 +92,58 @@ class TaskService:
         updates: dict,
         current_user_id: UUID,
         user_role: Role,
+        version: Optional[int] = None,
     ) -> Optional[Task]:
-        task = await self.task_repo.get(task_id)
-        if task is None:
-            raise NotFound("Task not found")
-
-        if user_role.value == "sales" and task.assigned_to != current_user_id:
-            raise Forbidden("You can only update your own tasks")
-
         if "due_date" in updates and updates["due_date"] is not None:
             if updates["due_date"].date() < datetime.utcnow().date():
                 raise BadRequest("Due date cannot be in the past")
 
-        return await self.task_repo.update(task_id, updates)
+        delta = None
+        if "status" in updates:
+            task = await self._locked(
+                task_id, current_user_id, user_role, "You can only update your own tasks", version
+            )
+            updates = self._with_completed_at(task, updates)
+            delta = self._transition(task, updates)
 
-    async def complete_task(
-        self, task_id: UUID, current_user_id: UUID, user_role: Role
-    ) -> Optional[Task]:
-        task = await self.task_repo.get(task_id)
-        if task is None:
-            raise NotFound("Task not found")
+        async with UnitOfWork(self.session):
+            task = await self.task_repo.update(
+                task_id, updates, *self._ownership(current_user_id, user_role), version=version
+            )
+            if task is None:
+                await self._raise_missing(task_id, "You can only update your own tasks")
+            if delta is not None:
+                await self.stats_repo.apply(task.organization_id, delta)
 
-        if user_role.value == "sales" and task.assigned_to != current_user_id:
-            raise Forbidden("You can only complete your own tasks")
+        invalidate_analytics(task.organization_id)
+        return task
 
+    async def complete_task(
+        self,
+        task_id: UUID,
+        current_user_id: UUID,
+        user_role: Role,
+        version: Optional[int] = None,
+    ) -> Optional[Task]:
         updates = {
             "status": TaskStatusEnum.DONE,
             "completed_at": datetime.utcnow(),
         }
-        return await self.task_repo.update(task_id, updates)
+        task = await self._locked(
+            task_id, current_user_id, user_role, "You can only complete your own tasks", version
+        )
+        delta = self._transition(task, updates)
+
+        async with UnitOfWork(self.session):
+            task = await self.task_repo.update(
+                task_id, updates, *self._ownership(current_user_id, user_role), version=version
+            )
+            if task is None:
+                await self._raise_missing(task_id, "You can only complete your own tasks")
+            await self.stats_repo.apply(task.organization_id, delta)
+
+        invalidate_analytics(task.organization_id)
+        return task
 
     async def delete_task(
         self,
@@ -102,19 +151,25 @@ class TaskService:
         current_user_id: UUID,
         user_role: Role,
     ) -> bool:
-        task = await self.task_repo.get(task_id)
-        if task is None:
-            raise NotFound("Task not found")
-
-        if user_role.value == "sales" and task.assigned_to != current_user_id:
-            raise Forbidden("You can only delete your own tasks")
+        task = await self._locked(
+            task_id, current_user_id, user_role, "You can only delete your own tasks"
+        )
+        await self.stats_repo.apply(
+            task.organization_id, StatsDelta().remove(task_counters(task.status))
+        )
+        await self.task_repo.delete(task_id, *self._ownership(current_user_id, user_role))
 
-        return await self.task_repo.delete(task_id)
+        invalidate_analytics(task.organization_id)
+        return True
 
     async def list_overdue_tasks(
-        self, organization_id: UUID, skip: int = 0, limit: int = 100
+        self,
+        organization_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Task]:
-        return await self.task_repo.list_overdue(organization_id, skip, limit)
+        return await self.task_repo.list_overdue(organization_id, skip, limit, cursor)
 
     async def search_tasks(
         self,
@@ -129,3 +184,200 @@ class TaskService:
 
     async def get_task_count(self, organization_id: UUID) -> int:
         return await self.task_repo.count_by_organization(organization_id)
+
+    async def bulk_create_tasks(
+        self, organization_id: UUID, items: List[dict]
+    ) -> Dict[str, Any]:
+        results = BulkResults(len(items))
+        errors = await self._reference_errors(organization_id, dict(enumerate(items)))
+
+        pending = {}
+        for index, item in enumerate(items):
+            error = errors.get(index) or self._due_date_error(item)
+            if error:
+                results.fail(index, error)
+            else:
+                pending[index] = Task(organization_id=organization_id, **item)
+
+        await self.stats_repo.apply(
+            organization_id, StatsDelta().add(task_counters(None), len(pending))
+        )
+        created = await self.task_repo.create_many(list(pending.values()))
+        for index, task in zip(pending, created):
+            results.succeed(index, BULK_CREATED, task.id)
+
+        if created:
+            invalidate_analytics(organization_id)
+        return results.summary()
+
+    async def bulk_update_tasks(
+        self,
+        organization_id: UUID,
+        items: List[dict],
+        current_user_id: UUID,
+        user_role: Role,
+    ) -> Dict[str, Any]:
+        results = BulkResults(len(items))
+        ids, changes = split_ids(items)
+        indexes = results.by_id(ids)
+        found, owned = await self._accessible(
+            organization_id, indexes, current_user_id, user_role
+        )
+        errors = await self._reference_errors(
+            organization_id, {index: changes[index] for index in indexes.values()}
+        )
+
+        pending = {}
+        delta = StatsDelta()
+        for task_id, index in indexes.items():
+            error = errors.get(index) or self._due_date_error(changes[index])
+            if task_id not in found:
+                results.fail(index, "Task not found", task_id)
+            elif task_id not in owned:
+                results.fail(index, "You can only update your own tasks", task_id)
+            elif error:
+                results.fail(index, error, task_id)
+            else:
+                pending[task_id] = self._with_completed_at(found[task_id], changes[index])
+                delta.add(self._transition(found[task_id], pending[task_id]).values)
+
+        await self.stats_repo.apply(organization_id, delta)
+        await self.task_repo.update_many(pending)
+        for task_id in pending:
+            results.succeed(indexes[task_id], BULK_UPDATED, task_id)
+
+        if pending:
+            invalidate_analytics(organization_id)
+        return results.summary()
+
+    async def bulk_delete_tasks(
+        self,
+        organization_id: UUID,
+        ids: List[UUID],
+        current_user_id: UUID,
+        user_role: Role,
+    ) -> Dict[str, Any]:
+        results = BulkResults(len(ids))
+        indexes = results.by_id(ids)
+        found, owned = await self._accessible(
+            organization_id, indexes, current_user_id, user_role
+        )
+        delta = StatsDelta()
+        for task_id in owned:
+            delta.remove(task_counters(found[task_id].status))
+        await self.stats_repo.apply(organization_id, delta)
+        deleted = await self.task_repo.delete_many(
+            owned, Task.organization_id == organization_id
+        )
+
+        for task_id, index in indexes.items():
+            if task_id in deleted:
+                results.succeed(index, BULK_DELETED, task_id)
+            elif task_id in found:
+                results.fail(index, "You can only delete your own tasks", task_id)
+            else:
+                results.fail(index, "Task not found", task_id)
+
+        if deleted:
+            invalidate_analytics(organization_id)
+        return results.summary()
+
+    async def _accessible(
+        self,
+        organization_id: UUID,
+        task_ids: List[UUID],
+        current_user_id: UUID,
+        user_role: Role,
+    ) -> Tuple[Dict[UUID, Task], Set[UUID]]:
+        found = await self.task_repo.get_many(
+            task_ids, Task.organization_id == organization_id, for_update=True
+        )
+        ownership = self._ownership(current_user_id, user_role)
+        if not ownership:
+            return found, set(found)
+
+        owned = await self.task_repo.existing_ids(found, *ownership)
+        return found, owned
+
+    async def _locked(
+        self,
+        task_id: UUID,
+        current_user_id: UUID,
+        user_role: Role,
+        forbidden_detail: str,
+        version: Optional[int] = None,
+    ) -> Task:
+        ownership = self._ownership(current_user_id, user_role)
+        if version is None:
+            task = await self.task_repo.get_for_update(task_id, *ownership)
+        else:
+            task = (await self.task_repo.get_many([task_id], *ownership)).get(task_id)
+        if task is None:
+            await self._raise_missing(task_id, forbidden_detail)
+        if version is not None and task.version != version:
+            raise Conflict("Task was modified by another request")
+        return task
+
+    @staticmethod
+    def _transition(task: Task, updates: Dict[str, Any]) -> StatsDelta:
+        return StatsDelta().remove(task_counters(task.status)).add(
+            task_counters(updates.get("status", task.status))
+        )
+
+    @staticmethod
+    def _with_completed_at(task: Task, updates: Dict[str, Any]) -> Dict[str, Any]:
+        if updates.get("status") is None:
+            return updates
+
+        to_status = enum_member(TaskStatusEnum, updates["status"], task.status)
+        if to_status == task.status:
+            return updates
+        if to_status == TaskStatusEnum.DONE:
+            if updates.get("completed_at") is not None:
+                return updates
+            return {**updates, "completed_at": datetime.utcnow()}
+        if task.status == TaskStatusEnum.DONE:
+            return {**updates, "completed_at": None}
+        return updates
+
+    async def _reference_errors(
+        self, organization_id: UUID, rows: Dict[int, dict]
+    ) -> Dict[int, str]:
+        def referenced(key):
+            return {values[key] for values in rows.values() if values.get(key)}
+
+        contacts = await self.contact_repo.existing_ids(
+            referenced("contact_id"), Contact.organization_id == organization_id
+        )
+        deals = await self.deal_repo.existing_ids(
+            referenced("deal_id"), Deal.organization_id == organization_id
+        )
+        users = await self.user_repo.existing_ids(referenced("assigned_to"))
+
+        errors = {}
+        for index, values in rows.items():
+            if values.get("contact_id") and values["contact_id"] not in contacts:
+                errors[index] = "Contact not found"
+            elif values.get("deal_id") and values["deal_id"] not in deals:
+                errors[index] = "Deal not found"
+            elif values.get("assigned_to") and values["assigned_to"] not in users:
+                errors[index] = "Assignee not found"
+        return errors
+
+    @staticmethod
+    def _due_date_error(values: dict) -> Optional[str]:
+        due_date = values.get("due_date")
+        if due_date is not None and due_date.date() < datetime.utcnow().date():
+            return "Due date cannot be in the past"
+        return None
+
+    @staticmethod
+    def _ownership(current_user_id: UUID, user_role: Role) -> List[Any]:
+        if user_role.value == "sales":
+            return [Task.assigned_to == current_user_id]
+        return []
+
+    async def _raise_missing(self, task_id: UUID, forbidden_detail: str) -> None:
+        if await self.task_repo.exists(task_id):
+            raise Forbidden(forbidden_detail)
+        raise NotFound("Task not found")
@@ -0,0 +1,30 @@
+from typing import Any
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.base import UNIT_OF_WORK
+
+
+class UnitOfWork:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def add(self, *objs: Any) -> None:
+        self.session.add_all(objs)
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self.session.info[UNIT_OF_WORK] = self.session.info.get(UNIT_OF_WORK, 0) + 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        depth = self.session.info[UNIT_OF_WORK] - 1
+        self.session.info[UNIT_OF_WORK] = depth
+        if depth:
+            return
+        if exc_type is not None:
+            await self.session.rollback()
+            return
+        try:
+            await self.session.commit()
+        except BaseException:
+            await self.session.rollback()
+            raise
@@ -5,11 +5,14 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.pool import StaticPool
 from uuid import uuid4
 
+from app.config import get_settings
 from app.main import app
 from app.database import get_db, Base
 from app.models import User, Organization, OrganizationMember
 from app.core.security import hash_password, create_access_token, create_refresh_token
 from app.core.permissions import Role
+from app.services.principal_service import principal_cache
+from app.services.analytics_cache import analytics_cache
 
 
 @pytest.fixture(scope="session")
@@ -39,6 +42,8 @@ async def test_db():
 
     await engine.dispose()
     app.dependency_overrides.clear()
+    principal_cache.clear()
+    analytics_cache.clear()
 
 
 @pytest.fixture
@@ -154,3 +159,9 @@ async def sales_auth_headers(test_user_sales_token, test_organization):
         "Authorization": f"Bearer {test_user_sales_token['access_token']}",
         "X-Organization-Id": str(test_organization.id),
     }
+
+
+@pytest.fixture
+def cold_storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(get_settings(), "ACTIVITY_COLD_STORAGE_PATH", str(tmp_path))
+    return tmp_path
@@ -71,6 +71,7 @@ class TestAnalytics:
         assert "contacts" in data
         assert "activities" in data
         assert "recent_activities" in data
+        assert data["meta"]["partial"] is False
 
     async def test_deals_summary_with_data(self, client, auth_headers):
         contact_response = await client.post(
@@ -134,6 +135,59 @@ class TestAnalytics:
         data = response.json()
         assert isinstance(data["recent_activities"], list)
 
+    async def test_get_timeseries(self, client, auth_headers):
+        response = await client.get(
+            "/api/v1/analytics/timeseries",
+            params={"granularity": "week", "start": "2026-03-04", "end": "2026-03-17"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["granularity"] == "week"
+        assert data["start"] == "2026-03-02"
+        assert data["end"] == "2026-03-22"
+        assert [bucket["bucket"] for bucket in data["buckets"]] == [
+            "2026-03-02", "2026-03-09", "2026-03-16"
+        ]
+        assert data["buckets"][0]["deals_created"] == 0
+
+    async def test_get_timeseries_rejects_inverted_range(self, client, auth_headers):
+        response = await client.get(
+            "/api/v1/analytics/timeseries",
+            params={"start": "2026-03-10", "end": "2026-03-01"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 400
+
+    async def test_get_deals_funnel(self, client, auth_headers):
+        response = await client.post(
+            "/api/v1/contacts",
+            json={"first_name": "Funnel", "last_name": "Contact"},
+            headers=auth_headers,
+        )
+        contact_id = response.json()["id"]
+        response = await client.post(
+            "/api/v1/deals",
+            json={"contact_id": contact_id, "title": "Funnel Deal", "amount": 1000},
+            headers=auth_headers,
+        )
+        deal_id = response.json()["id"]
+        await client.patch(
+            f"/api/v1/deals/{deal_id}",
+            json={"status": "in_progress"},
+            headers=auth_headers,
+        )
+
+        response = await client.get("/api/v1/analytics/deals/funnel", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [stage["deals"] for stage in data["stages"]] == [1, 1, 0]
+        assert data["conversion"]["new_to_in_progress"] == 100.0
+        assert len(data["assignees"]) == 1
+
     async def test_analytics_requires_organization_header(self, client, test_user_token):
         response = await client.get(
             "/api/v1/analytics/deals/summary",
@@ -1,4 +1,7 @@
 import pytest
+from uuid import uuid4
+
+from app.config import get_settings
 
 
 @pytest.mark.asyncio
@@ -174,6 +177,205 @@ class TestContacts:
         data = response.json()
         assert len(data) <= 2
 
+    async def test_contact_cursor_pagination(self, client, auth_headers):
+        for i in range(5):
+            await client.post(
+                "/api/v1/contacts",
+                json={
+                    "first_name": f"Cursor{i}",
+                    "last_name": "Test",
+                },
+                headers=auth_headers,
+            )
+
+        seen = []
+        cursor = None
+        for _ in range(5):
+            url = "/api/v1/contacts?limit=2"
+            if cursor:
+                url += f"&cursor={cursor}"
+            response = await client.get(url, headers=auth_headers)
+
+            assert response.status_code == 200
+            seen.extend(c["id"] for c in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+    async def test_contact_invalid_cursor(self, client, auth_headers):
+        response = await client.get(
+            "/api/v1/contacts?cursor=not-a-cursor",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 400
+
+    async def test_bulk_contacts(self, client, auth_headers):
+        create_response = await client.post(
+            "/api/v1/contacts/bulk",
+            json={
+                "items": [
+                    {"first_name": f"Bulk{i}", "last_name": "Contact"}
+                    for i in range(3)
+                ],
+            },
+            headers=auth_headers,
+        )
+
+        assert create_response.status_code == 200
+        created = create_response.json()
+        assert created["succeeded"] == 3
+        assert [r["status"] for r in created["results"]] == ["created"] * 3
+        ids = [r["id"] for r in created["results"]]
+
+        await client.post(
+            "/api/v1/deals",
+            json={"contact_id": ids[2], "title": "Blocking Deal"},
+            headers=auth_headers,
+        )
+
+        missing_id = str(uuid4())
+        update_response = await client.patch(
+            "/api/v1/contacts/bulk",
+            json={
+                "items": [
+                    {"id": ids[0], "company": "Acme"},
+                    {"id": missing_id, "company": "Nope"},
+                    {"id": ids[1], "city": "Berlin", "company": "Globex"},
+                    {"id": ids[0], "company": "Again"},
+                ],
+            },
+            headers=auth_headers,
+        )
+
+        updated = update_response.json()
+        assert update_response.status_code == 200
+        assert [r["status"] for r in updated["results"]] == [
+            "updated", "failed", "updated", "failed"
+        ]
+        assert updated["results"][1]["error"] == "Contact not found"
+        assert updated["results"][3]["error"] == "Duplicate id in batch"
+
+        contact = (await client.get(f"/api/v1/contacts/{ids[1]}", headers=auth_headers)).json()
+        assert contact["city"] == "Berlin"
+        assert contact["company"] == "Globex"
+
+        delete_response = await client.post(
+            "/api/v1/contacts/bulk/delete",
+            json={"ids": [ids[0], ids[2], missing_id]},
+            headers=auth_headers,
+        )
+
+        deleted = delete_response.json()
+        assert [r["status"] for r in deleted["results"]] == ["deleted", "failed", "failed"]
+        assert deleted["succeeded"] == 1
+        assert deleted["failed"] == 2
+
+    async def test_import_contacts_csv(self, client, auth_headers, monkeypatch):
+        monkeypatch.setattr(get_settings(), "IMPORT_CHUNK_SIZE", 2)
+        await client.post(
+            "/api/v1/contacts",
+            json={"first_name": "Old", "last_name": "Timer", "email": "old@example.com"},
+            headers=auth_headers,
+        )
+        csv_body = (
+            "first_name,last_name,email,company,unknown\n"
+            "Ann,Lee,ann@example.com,Acme,x\n"
+            ",NoFirst,,,\n"
+            "Bob,Stone,not-an-email,,\n"
+            "Ann,Again,ann@example.com,,\n"
+            "Old,Dup,old@example.com,,\n"
+            "Cid,Moss,,Globex,\n"
+        )
+
+        response = await client.post(
+            "/api/v1/contacts/import",
+            content=csv_body.encode(),
+            headers={**auth_headers, "Content-Type": "text/csv"},
+        )
+
+        assert response.status_code == 202
+        job_id = response.json()["id"]
+
+        job = (await client.get(f"/api/v1/contacts/import/{job_id}", headers=auth_headers)).json()
+        assert job["status"] == "completed"
+        assert job["processed"] == 6
+        assert job["imported"] == 2
+        assert job["skipped"] == 2
+        assert job["failed"] == 2
+        assert [error["row"] for error in job["errors"]] == [3, 4]
+        assert job["errors"][0]["errors"][0].startswith("first_name")
+
+        contacts = (await client.get("/api/v1/contacts", headers=auth_headers)).json()
+        assert sorted(c["first_name"] for c in contacts) == ["Ann", "Cid", "Old"]
+        ann = next(c for c in contacts if c["first_name"] == "Ann")
+        assert ann["last_name"] == "Lee"
+        assert ann["company"] == "Acme"
+        assert ann["is_active"] is True
+
+    async def test_import_requires_name_columns(self, client, auth_headers):
+        response = await client.post(
+            "/api/v1/contacts/import",
+            content=b"email\nann@example.com\n",
+            headers={**auth_headers, "Content-Type": "text/csv"},
+        )
+
+        assert response.status_code == 400
+        assert "first_name" in response.json()["detail"]
+
+    async def test_get_unknown_import_job(self, client, auth_headers):
+        response = await client.get(
+            f"/api/v1/contacts/import/{uuid4()}", headers=auth_headers
+        )
+
+        assert response.status_code == 404
+
+    async def test_get_contact_timeline(self, client, auth_headers):
+        response = await client.post(
+            "/api/v1/contacts",
+            json={"first_name": "Timeline", "last_name": "Contact"},
+            headers=auth_headers,
+        )
+        contact_id = response.json()["id"]
+        await client.post(
+            "/api/v1/deals",
+            json={"contact_id": contact_id, "title": "Timeline Deal", "amount": 500},
+            headers=auth_headers,
+        )
+        await client.post(
+            f"/api/v1/activities/contacts/{contact_id}",
+            json={"activity_type": "call", "title": "Timeline Call"},
+            headers=auth_headers,
+        )
+
+        response = await client.get(
+            f"/api/v1/contacts/{contact_id}/timeline",
+            params={"limit": 1},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert [event["kind"] for event in response.json()] == ["activity"]
+        assert response.json()[0]["detail"] == "call"
+
+        response = await client.get(
+            f"/api/v1/contacts/{contact_id}/timeline",
+            params={"limit": 1, "cursor": response.headers["X-Next-Cursor"]},
+            headers=auth_headers,
+        )
+
+        assert [event["kind"] for event in response.json()] == ["deal_created"]
+
+    async def test_get_unknown_contact_timeline(self, client, auth_headers):
+        response = await client.get(
+            f"/api/v1/contacts/{uuid4()}/timeline", headers=auth_headers
+        )
+
+        assert response.status_code == 404
+
     async def test_missing_auth_headers(self, client):
         response = await client.get("/api/v1/contacts")
 
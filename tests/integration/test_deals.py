@@ -1,4 +1,5 @@
 import pytest
+from uuid import uuid4
 
 
 @pytest.mark.asyncio
@@ -307,3 +308,143 @@ class TestDeals:
         assert response.status_code == 200
         data = response.json()
         assert any(d["id"] == deal_id for d in data)
+
+    async def test_bulk_deals(self, client, auth_headers):
+        contact_response = await client.post(
+            "/api/v1/contacts",
+            json={"first_name": "Bulk", "last_name": "Deals"},
+            headers=auth_headers,
+        )
+        contact_id = contact_response.json()["id"]
+
+        create_response = await client.post(
+            "/api/v1/deals/bulk",
+            json={
+                "items": [
+                    {"contact_id": contact_id, "title": "First", "amount": 100},
+                    {"contact_id": str(uuid4()), "title": "Orphan"},
+                    {"contact_id": contact_id, "title": "Second"},
+                ],
+            },
+            headers=auth_headers,
+        )
+
+        created = create_response.json()
+        assert create_response.status_code == 200
+        assert [r["status"] for r in created["results"]] == ["created", "failed", "created"]
+        assert created["results"][1]["error"] == "Contact not found"
+
+        first_id = created["results"][0]["id"]
+        update_response = await client.patch(
+            "/api/v1/deals/bulk",
+            json={"items": [{"id": first_id, "amount": 250, "title": "Renamed"}]},
+            headers=auth_headers,
+        )
+
+        assert update_response.json()["succeeded"] == 1
+        deal = (await client.get(f"/api/v1/deals/{first_id}", headers=auth_headers)).json()
+        assert deal["title"] == "Renamed"
+        assert float(deal["amount"]) == 250
+
+        delete_response = await client.post(
+            "/api/v1/deals/bulk/delete",
+            json={"ids": [r["id"] for r in created["results"] if r["id"]]},
+            headers=auth_headers,
+        )
+
+        assert delete_response.json()["succeeded"] == 2
+
+
+    async def test_deal_board(self, client, auth_headers):
+        contact_response = await client.post(
+            "/api/v1/contacts",
+            json={"first_name": "Board", "last_name": "Contact"},
+            headers=auth_headers,
+        )
+        contact_id = contact_response.json()["id"]
+        for title, amount in [("Small", 100), ("Large", 900), ("Medium", 500)]:
+            await client.post(
+                "/api/v1/deals",
+                json={"contact_id": contact_id, "title": title, "amount": amount},
+                headers=auth_headers,
+            )
+
+        response = await client.get(
+            "/api/v1/deals/board", params={"limit": 2}, headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        columns = {column["status"]: column for column in response.json()}
+        assert [deal["title"] for deal in columns["new"]["deals"]] == ["Large", "Medium"]
+        assert columns["new"]["count"] == 3
+        assert float(columns["new"]["total_amount"]) == 1500
+        assert columns["won"]["deals"] == []
+
+        next_page = await client.get(
+            "/api/v1/deals/board",
+            params={"limit": 2, "status": "new", "cursor": columns["new"]["next_cursor"]},
+            headers=auth_headers,
+        )
+
+        assert next_page.status_code == 200
+        [column] = next_page.json()
+        assert [deal["title"] for deal in column["deals"]] == ["Small"]
+        assert column["next_cursor"] is None
+
+        invalid = await client.get(
+            "/api/v1/deals/board",
+            params={"cursor": columns["new"]["next_cursor"]},
+            headers=auth_headers,
+        )
+        assert invalid.status_code == 400
+
+    async def test_deal_if_match(self, client, auth_headers):
+        contact_response = await client.post(
+            "/api/v1/contacts",
+            json={"first_name": "Etag", "last_name": "Contact"},
+            headers=auth_headers,
+        )
+        contact_id = contact_response.json()["id"]
+        deal_id = (await client.post(
+            "/api/v1/deals",
+            json={"contact_id": contact_id, "title": "Etag Deal", "amount": 100},
+            headers=auth_headers,
+        )).json()["id"]
+
+        fetched = await client.get(
+            f"/api/v1/deals/{deal_id}",
+            headers={**auth_headers, "Origin": "https://app.example.com"},
+        )
+        assert fetched.headers["etag"] == '"1"'
+        assert "ETag" in fetched.headers["access-control-expose-headers"].split(", ")
+
+        updated = await client.patch(
+            f"/api/v1/deals/{deal_id}",
+            json={"title": "Renamed"},
+            headers={**auth_headers, "If-Match": fetched.headers["etag"]},
+        )
+        assert updated.status_code == 200
+        assert updated.headers["etag"] == '"2"'
+        assert updated.json()["version"] == 2
+
+        stale = await client.post(
+            f"/api/v1/deals/{deal_id}/status",
+            json={"status": "in_progress"},
+            headers={**auth_headers, "If-Match": fetched.headers["etag"]},
+        )
+        assert stale.status_code == 409
+
+        moved = await client.post(
+            f"/api/v1/deals/{deal_id}/status",
+            json={"status": "in_progress"},
+            headers={**auth_headers, "If-Match": updated.headers["etag"]},
+        )
+        assert moved.status_code == 200
+        assert moved.headers["etag"] == '"3"'
+
+        invalid = await client.patch(
+            f"/api/v1/deals/{deal_id}",
+            json={"title": "Again"},
+            headers={**auth_headers, "If-Match": "not-a-version"},
+        )
+        assert invalid.status_code == 400
@@ -0,0 +1,67 @@
+import csv
+import io
+import json
+import pytest
+
+from app.config import get_settings
+
+
+@pytest.mark.asyncio
+class TestExports:
+    async def test_export_contacts_ndjson(self, client, auth_headers, monkeypatch):
+        monkeypatch.setattr(get_settings(), "EXPORT_BATCH_SIZE", 2)
+        for index in range(5):
+            await client.post(
+                "/api/v1/contacts",
+                json={"first_name": f"Name{index}", "last_name": "Export"},
+                headers=auth_headers,
+            )
+
+        response = await client.get("/api/v1/exports/contacts", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert 'filename="contacts.ndjson"' in response.headers["content-disposition"]
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["first_name"] for row in rows] == [f"Name{index}" for index in range(5)]
+        assert rows[0]["is_active"] is True
+
+    async def test_export_deals_csv(self, client, auth_headers):
+        contact = (await client.post(
+            "/api/v1/contacts",
+            json={"first_name": "Deal", "last_name": "Owner"},
+            headers=auth_headers,
+        )).json()
+        deal = (await client.post(
+            "/api/v1/deals",
+            json={"contact_id": contact["id"], "title": "Big, \"quoted\" deal", "amount": 1500.5},
+            headers=auth_headers,
+        )).json()
+
+        response = await client.get(
+            "/api/v1/exports/deals", params={"format": "csv"}, headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 1
+        assert rows[0]["id"] == deal["id"]
+        assert rows[0]["title"] == 'Big, "quoted" deal'
+        assert rows[0]["status"] == "new"
+        assert float(rows[0]["amount"]) == 1500.5
+
+    async def test_export_empty_csv_has_header(self, client, auth_headers):
+        response = await client.get(
+            "/api/v1/exports/activities", params={"format": "csv"}, headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        lines = response.text.splitlines()
+        assert len(lines) == 1
+        assert "activity_type" in lines[0]
+
+    async def test_export_unknown_resource(self, client, auth_headers):
+        response = await client.get("/api/v1/exports/users", headers=auth_headers)
+
+        assert response.status_code == 422
@@ -1,4 +1,5 @@
 import pytest
+from uuid import uuid4
 
 
 @pytest.mark.asyncio
@@ -126,6 +127,79 @@ class TestTasks:
 
         assert response.status_code == 204
 
+    async def test_sales_cannot_modify_foreign_task(
+        self, client, sales_auth_headers, test_user, auth_headers, test_user_sales
+    ):
+        create_response = await client.post(
+            "/api/v1/tasks",
+            json={
+                "assigned_to": str(test_user.id),
+                "title": "Owner Task",
+            },
+            headers=auth_headers,
+        )
+        task_id = create_response.json()["id"]
+
+        update_response = await client.patch(
+            f"/api/v1/tasks/{task_id}",
+            json={"title": "Hijacked"},
+            headers=sales_auth_headers,
+        )
+        delete_response = await client.delete(
+            f"/api/v1/tasks/{task_id}",
+            headers=sales_auth_headers,
+        )
+        missing_response = await client.delete(
+            f"/api/v1/tasks/{uuid4()}",
+            headers=sales_auth_headers,
+        )
+
+        assert update_response.status_code == 403
+        assert delete_response.status_code == 403
+        assert missing_response.status_code == 404
+
+    async def test_bulk_tasks(
+        self, client, sales_auth_headers, test_user, auth_headers, test_user_sales
+    ):
+        create_response = await client.post(
+            "/api/v1/tasks/bulk",
+            json={
+                "items": [
+                    {"assigned_to": str(test_user_sales.id), "title": "Mine"},
+                    {"assigned_to": str(test_user.id), "title": "Theirs"},
+                    {"assigned_to": str(uuid4()), "title": "Nobody"},
+                    {"assigned_to": str(test_user_sales.id), "title": "Past", "due_date": "2000-01-01T00:00:00"},
+                ],
+            },
+            headers=sales_auth_headers,
+        )
+
+        created = create_response.json()
+        assert [r["status"] for r in created["results"]] == [
+            "created", "created", "failed", "failed"
+        ]
+        assert created["results"][2]["error"] == "Assignee not found"
+        assert created["results"][3]["error"] == "Due date cannot be in the past"
+        mine, theirs = created["results"][0]["id"], created["results"][1]["id"]
+
+        update_response = await client.patch(
+            "/api/v1/tasks/bulk",
+            json={"items": [{"id": mine, "status": "in_progress"}, {"id": theirs, "title": "X"}]},
+            headers=sales_auth_headers,
+        )
+
+        updated = update_response.json()
+        assert [r["status"] for r in updated["results"]] == ["updated", "failed"]
+        assert updated["results"][1]["error"] == "You can only update your own tasks"
+
+        delete_response = await client.post(
+            "/api/v1/tasks/bulk/delete",
+            json={"ids": [mine, theirs]},
+            headers=sales_auth_headers,
+        )
+
+        assert [r["status"] for r in delete_response.json()["results"]] == ["deleted", "failed"]
+
     async def test_task_default_priority_medium(self, client, sales_auth_headers, test_user_sales):
         response = await client.post(
             "/api/v1/tasks",
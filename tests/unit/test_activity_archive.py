@@ -0,0 +1,180 @@
+import gzip
+import json
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import encode_cursor
+from app.models import Activity, ActivityTypeEnum, Contact
+from app.repositories import (
+    ActivityRepository, ContactRepository, DailyRollupRepository, OrganizationStatsRepository,
+)
+
+
+@pytest.mark.asyncio
+class TestActivityArchive:
+    async def test_archives_in_bounded_segments(
+        self, test_db, test_organization, test_user, cold_storage
+    ):
+        now = datetime.utcnow()
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            self._seed(db, test_organization.id, test_user.id, now, [1, 400, 500, 600, 700, 800])
+            await db.commit()
+
+            repo = ActivityRepository(db)
+            cutoff = now - timedelta(days=365)
+            moved = [await repo.archive_before(test_organization.id, cutoff, 2) for _ in range(3)]
+            remaining = await repo.count_by_organization(test_organization.id)
+
+        assert moved == [2, 2, 1]
+        assert remaining == 1
+        segments = repo.archive.segments(test_organization.id)
+        assert [segment.rows for segment in segments] == [2, 2, 1]
+        assert segments[0].min_created_at == now - timedelta(days=800)
+        assert segments[0].max_created_at == now - timedelta(days=700)
+        with gzip.open(cold_storage / str(test_organization.id) / segments[-1].name, "rt") as file:
+            row = json.loads(file.readline())
+        assert row["title"] == "400 days ago"
+        assert row["activity_type"] == "note"
+
+    async def test_archival_keeps_aggregates(
+        self, test_db, test_organization, test_user, cold_storage
+    ):
+        now = datetime.utcnow()
+        start, end = (now - timedelta(days=900)).date(), (now + timedelta(days=1)).date()
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            self._seed(db, test_organization.id, test_user.id, now, [1, 400, 400, 500])
+            await db.commit()
+            stats = OrganizationStatsRepository(db)
+            rollups = DailyRollupRepository(db)
+            await stats.reconcile(test_organization.id)
+            await rollups.rebuild(start, end, test_organization.id)
+            before = await self._logged(rollups, test_organization.id, start, end)
+
+            await ActivityRepository(db).archive_before(
+                test_organization.id, now - timedelta(days=365), 10
+            )
+            counters = await stats.get_counters(test_organization.id)
+            logged = await self._logged(rollups, test_organization.id, start, end)
+            drift = await stats.reconcile(test_organization.id)
+            await rollups.rebuild(start, end, test_organization.id)
+            rebuilt = await self._logged(rollups, test_organization.id, start, end)
+            earliest = await rollups.earliest_day(test_organization.id)
+
+        assert counters["activities_total"] == 4
+        assert counters["activities_note"] == 4
+        assert drift == 0
+        assert logged == before
+        assert rebuilt == before
+        assert sum(before.values()) == 4
+        assert earliest == (now - timedelta(days=500)).date()
+
+    async def test_reads_fall_through_to_archive(
+        self, test_db, test_organization, test_user, cold_storage
+    ):
+        now = datetime.utcnow()
+        ages = [1, 2, 400, 500, 600]
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            self._seed(db, test_organization.id, test_user.id, now, ages)
+            await db.commit()
+            repo = ActivityRepository(db)
+            await repo.archive_before(test_organization.id, now - timedelta(days=365), 10)
+
+            first = await repo.list_by_organization(test_organization.id, limit=3)
+            last = first[-1]
+            second = await repo.list_by_organization(
+                test_organization.id, limit=3, cursor=encode_cursor(last.created_at, last.id)
+            )
+            offset = await repo.list_by_organization(test_organization.id, skip=1, limit=3)
+            recent = await repo.get_recent_by_organization(test_organization.id, limit=10)
+            notes = await repo.list_by_type(test_organization.id, ActivityTypeEnum.NOTE)
+            calls = await repo.list_by_type(test_organization.id, ActivityTypeEnum.CALL)
+
+        titles = [f"{days} days ago" for days in ages]
+        assert [activity.title for activity in first] == titles[:3]
+        assert [activity.title for activity in second] == titles[3:]
+        assert [activity.title for activity in offset] == titles[1:4]
+        assert [activity.title for activity in recent] == titles
+        assert [activity.title for activity in notes] == titles
+        assert calls == []
+
+    async def test_contact_reads_resolve_organization(
+        self, test_db, test_organization, test_user, cold_storage
+    ):
+        now = datetime.utcnow()
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            contact = Contact(
+                id=uuid4(), organization_id=test_organization.id,
+                first_name="Cold", last_name="Storage", created_at=now - timedelta(days=900),
+            )
+            db.add(contact)
+            self._seed(db, test_organization.id, test_user.id, now, [400, 500])
+            self._seed(
+                db, test_organization.id, test_user.id, now, [3, 450], contact_id=contact.id
+            )
+            await db.commit()
+            repo = ActivityRepository(db)
+            await repo.archive_before(test_organization.id, now - timedelta(days=365), 10)
+
+            activities = await repo.list_by_contact(contact.id)
+            recent = await repo.get_recent_by_contact(contact.id, limit=1)
+
+        assert [activity.title for activity in activities] == ["3 days ago", "450 days ago"]
+        assert [activity.contact_id for activity in activities] == [contact.id, contact.id]
+        assert [activity.title for activity in recent] == ["3 days ago"]
+
+    async def test_owner_reads_skip_segments_that_cannot_match(
+        self, test_db, test_organization, test_user, cold_storage, monkeypatch
+    ):
+        now = datetime.utcnow()
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            archived, old, new = [
+                Contact(
+                    id=uuid4(), organization_id=test_organization.id,
+                    first_name=name, last_name="Owner", created_at=now - timedelta(days=days),
+                )
+                for name, days in (("Archived", 900), ("Old", 900), ("New", 30))
+            ]
+            db.add_all([archived, old, new])
+            self._seed(
+                db, test_organization.id, test_user.id, now, [400], contact_id=archived.id
+            )
+            await db.commit()
+            repo = ActivityRepository(db)
+            await repo.archive_before(test_organization.id, now - timedelta(days=365), 10)
+
+            [segment] = repo.archive.segments(test_organization.id)
+            scans = []
+            scan = repo.archive._scan
+            monkeypatch.setattr(
+                repo.archive, "_scan", lambda *args: scans.append(args) or scan(*args)
+            )
+            found = await repo.list_by_contact(archived.id)
+            await repo.list_by_contact(old.id)
+            await repo.get_recent_by_contact(new.id)
+            await ContactRepository(db).timeline(new.id)
+
+        assert segment.owners["contact_id"] == {archived.id}
+        assert [activity.title for activity in found] == ["400 days ago"]
+        assert len(scans) == 1
+
+    @staticmethod
+    async def _logged(rollups, organization_id, start, end):
+        rows = await rollups.series(organization_id, start, end, "day")
+        return {
+            row["bucket"]: row["activities_logged"] for row in rows if row["activities_logged"]
+        }
+
+    @staticmethod
+    def _seed(db, organization_id, user_id, now, ages, contact_id=None):
+        for days in ages:
+            db.add(Activity(
+                id=uuid4(),
+                organization_id=organization_id,
+                created_by=user_id,
+                contact_id=contact_id,
+                activity_type=ActivityTypeEnum.NOTE,
+                title=f"{days} days ago",
+                created_at=now - timedelta(days=days),
+            ))
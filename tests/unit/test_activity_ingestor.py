@@ -0,0 +1,125 @@
+import asyncio
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Activity, ActivityTypeEnum
+from app.repositories import ActivityRepository, OrganizationStatsRepository
+from app.services import ActivityService
+from app.services import activity_service
+from app.services.activity_ingestor import (
+    ActivityIngestor,
+    activity_ingest_metrics,
+    activity_ingestors,
+    shutdown_activity_ingestors,
+)
+
+
+@pytest.mark.asyncio
+class TestActivityIngestor:
+    async def test_size_threshold_writes_one_batch(self, test_db, test_organization, test_user):
+        ingestor = ActivityIngestor(test_db, batch_size=5, flush_interval=30)
+        batches = activity_ingest_metrics()["batches"]
+
+        written = await asyncio.wait_for(
+            asyncio.gather(*[
+                ingestor.submit(self._activity(test_organization.id, test_user.id, index))
+                for index in range(5)
+            ]),
+            timeout=5,
+        )
+        await ingestor.close()
+
+        assert len(written) == 5
+        assert activity_ingest_metrics()["batches"] == batches + 1
+        async with AsyncSession(test_db) as db:
+            assert await ActivityRepository(db).count_by_organization(test_organization.id) == 5
+            counters = await OrganizationStatsRepository(db).get_counters(test_organization.id)
+        assert counters["activities_total"] == 5
+        assert counters["activities_call"] == 5
+
+    async def test_time_threshold_flushes_partial_batch(
+        self, test_db, test_organization, test_user
+    ):
+        ingestor = ActivityIngestor(test_db, batch_size=100, flush_interval=0.01)
+
+        activity = await asyncio.wait_for(
+            ingestor.submit(self._activity(test_organization.id, test_user.id)), timeout=5
+        )
+        await ingestor.close()
+
+        async with AsyncSession(test_db) as db:
+            assert await ActivityRepository(db).get(activity.id) is not None
+
+    async def test_unacknowledged_writes_are_drained_on_close(
+        self, test_db, test_organization, test_user
+    ):
+        ingestor = ActivityIngestor(test_db, batch_size=100, flush_interval=30)
+
+        activity = await ingestor.submit(
+            self._activity(test_organization.id, test_user.id), durable=False
+        )
+        async with AsyncSession(test_db) as db:
+            assert await ActivityRepository(db).get(activity.id) is None
+        await asyncio.wait_for(ingestor.close(), timeout=5)
+
+        async with AsyncSession(test_db) as db:
+            assert await ActivityRepository(db).get(activity.id) is not None
+
+    async def test_failed_row_does_not_fail_the_batch(
+        self, test_db, test_organization, test_user
+    ):
+        ingestor = ActivityIngestor(test_db, batch_size=2, flush_interval=30)
+        first = self._activity(test_organization.id, test_user.id)
+        duplicate = self._activity(test_organization.id, test_user.id)
+        duplicate.id, duplicate.created_at = first.id, first.created_at
+
+        results = await asyncio.gather(
+            ingestor.submit(first), ingestor.submit(duplicate), return_exceptions=True
+        )
+        await ingestor.close()
+
+        assert results[0] is first
+        assert isinstance(results[1], IntegrityError)
+        async with AsyncSession(test_db) as db:
+            counters = await OrganizationStatsRepository(db).get_counters(test_organization.id)
+        assert counters["activities_total"] == 1
+
+    async def test_buffered_service_mode(
+        self, test_db, test_organization, test_user, monkeypatch
+    ):
+        settings = activity_service.settings
+        monkeypatch.setattr(settings, "ACTIVITY_INGEST_BUFFERED", True)
+        monkeypatch.setattr(settings, "ACTIVITY_INGEST_FLUSH_INTERVAL_SECONDS", 0.01)
+        try:
+            async with AsyncSession(test_db, expire_on_commit=False) as db:
+                activity = await ActivityService(db).log_email(
+                    organization_id=test_organization.id,
+                    created_by=test_user.id,
+                    title="Buffered email",
+                )
+                assert test_db in activity_ingestors
+                stored = (await db.execute(
+                    select(Activity).where(Activity.id == activity.id)
+                )).scalar_one()
+        finally:
+            await shutdown_activity_ingestors()
+
+        assert stored.activity_type == ActivityTypeEnum.EMAIL
+
+    @staticmethod
+    def _activity(organization_id, user_id, index=0):
+        now = datetime.utcnow()
+        return Activity(
+            id=uuid4(),
+            organization_id=organization_id,
+            created_by=user_id,
+            activity_type=ActivityTypeEnum.CALL,
+            title=f"Call {index}",
+            activity_date=now,
+            created_at=now,
+            updated_at=now,
+        )
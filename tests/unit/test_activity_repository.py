@@ -0,0 +1,142 @@
+import pytest
+from datetime import date, datetime, time, timedelta
+from uuid import uuid4
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Activity, ActivityTypeEnum
+from app.repositories import ActivityRepository
+from app.jobs.maintain_activity_partitions import maintain_partitions
+from app.repositories.activity_repository import PARTITION_PREFIX, month_start
+
+
+def test_month_start_crosses_years():
+    assert month_start(date(2026, 12, 15)) == date(2026, 12, 1)
+    assert month_start(date(2026, 12, 15), 1) == date(2027, 1, 1)
+    assert month_start(date(2026, 1, 31), -13) == date(2024, 12, 1)
+
+
+class MigratedPartitions:
+    def __init__(self, migrated_in: date, ahead: int = 3):
+        boundary = month_start(migrated_in, 1)
+        self.ranges = {"activities_legacy": (None, self._start(boundary))}
+        for offset in range(ahead + 1):
+            month = month_start(boundary, offset)
+            self.ranges[f"{PARTITION_PREFIX}{month:%Y%m}"] = (
+                self._start(month), self._start(month_start(month, 1))
+            )
+        self.detached = []
+        self.retired = []
+
+    async def partitions(self):
+        return [(name, upper) for name, (_, upper) in sorted(self.ranges.items())]
+
+    async def create_partition(self, month):
+        name = f"{PARTITION_PREFIX}{month:%Y%m}"
+        lower, upper = self._start(month), self._start(month_start(month, 1))
+        if name not in self.ranges:
+            for other, (other_lower, other_upper) in self.ranges.items():
+                if (other_lower is None or other_lower < upper) and lower < other_upper:
+                    raise AssertionError(f"{name} would overlap partition {other}")
+            self.ranges[name] = (lower, upper)
+        return name
+
+    async def detach_partition(self, name):
+        del self.ranges[name]
+        self.detached.append(name)
+
+    async def detached_partitions(self):
+        retired = {name for name, _ in self.retired}
+        return sorted(name for name in self.detached if name not in retired)
+
+    async def retire_partition(self, name, schema):
+        self.retired.append((name, schema))
+
+    @staticmethod
+    def _start(month):
+        return datetime.combine(month, time.min)
+
+
+@pytest.mark.asyncio
+class TestPartitionMaintenance:
+    async def test_skips_months_inside_legacy_partition(self):
+        migrated_in = date(2026, 10, 1)
+        repo = MigratedPartitions(migrated_in)
+
+        created, archived = await maintain_partitions(
+            repo, repo, migrated_in, 3, datetime(2024, 10, 1), "activities_archive"
+        )
+        next_month, _ = await maintain_partitions(
+            repo, repo, date(2026, 11, 1), 4, datetime(2024, 11, 1), "activities_archive"
+        )
+
+        assert created == ["activities_p202611", "activities_p202612", "activities_p202701"]
+        assert archived == []
+        assert next_month[-1] == "activities_p202703"
+        assert "activities_p202610" not in repo.ranges
+
+    async def test_archives_legacy_once_expired(self):
+        repo = MigratedPartitions(date(2026, 10, 1))
+
+        _, archived = await maintain_partitions(
+            repo, repo, date(2028, 12, 1), 0, datetime(2026, 12, 1), "activities_archive"
+        )
+
+        assert archived == ["activities_legacy", "activities_p202611"]
+        assert repo.retired[0] == ("activities_legacy", "activities_archive")
+
+    async def test_retires_partitions_left_detached(self):
+        repo = MigratedPartitions(date(2026, 10, 1))
+        await repo.detach_partition("activities_legacy")
+
+        _, archived = await maintain_partitions(
+            repo, repo, date(2026, 11, 1), 0, datetime(2024, 11, 1), "activities_archive"
+        )
+
+        assert archived == ["activities_legacy"]
+        assert repo.retired == [("activities_legacy", "activities_archive")]
+
+
+@pytest.mark.asyncio
+class TestRecentActivities:
+    async def test_recent_spans_window_newest_first(self, test_db, test_organization, test_user):
+        now = datetime.utcnow()
+        ages = [1, 400, 3, 90, 10]
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            for days in ages:
+                db.add(Activity(
+                    id=uuid4(),
+                    organization_id=test_organization.id,
+                    created_by=test_user.id,
+                    activity_type=ActivityTypeEnum.NOTE,
+                    title=f"{days} days ago",
+                    created_at=now - timedelta(days=days),
+                ))
+            await db.commit()
+
+            repo = ActivityRepository(db)
+            everything = await repo.get_recent_by_organization(test_organization.id, limit=10)
+            newest = await repo.get_recent_by_organization(test_organization.id, limit=4)
+            statements = self._record_statements(test_db)
+            in_window = await repo.get_recent_by_organization(test_organization.id, limit=3)
+
+        assert [activity.title for activity in everything] == [
+            f"{days} days ago" for days in sorted(ages)
+        ]
+        assert [activity.title for activity in newest] == [
+            "1 days ago", "3 days ago", "10 days ago", "90 days ago"
+        ]
+        assert [activity.title for activity in in_window] == [
+            "1 days ago", "3 days ago", "10 days ago"
+        ]
+        assert len(statements) == 1
+
+    @staticmethod
+    def _record_statements(test_db):
+        statements = []
+
+        @event.listens_for(test_db.sync_engine, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        return statements
@@ -0,0 +1,127 @@
+import asyncio
+import pytest
+from uuid import uuid4
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import GenerationCounter, StaleWhileRevalidateCache
+from app.models import Contact
+from app.services import AnalyticsService, ContactService
+from app.services.analytics_cache import analytics_generations
+
+
+class _Loader:
+    def __init__(self, delay: float = 0.0):
+        self.calls = 0
+        self.delay = delay
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.calls
+
+
+@pytest.mark.asyncio
+class TestStaleWhileRevalidateCache:
+    async def test_concurrent_misses_share_one_load(self):
+        cache = StaleWhileRevalidateCache(ttl=10)
+        loader = _Loader(delay=0.01)
+
+        values = await asyncio.gather(
+            *[cache.get_or_load("org", 0, loader) for _ in range(50)]
+        )
+
+        assert loader.calls == 1
+        assert values == [1] * 50
+
+    async def test_fresh_entry_is_served_from_cache(self):
+        cache = StaleWhileRevalidateCache(ttl=10)
+        loader = _Loader()
+
+        await cache.get_or_load("org", 0, loader)
+        value = await cache.get_or_load("org", 0, loader)
+
+        assert value == 1
+        assert loader.calls == 1
+
+    async def test_stale_entry_is_served_while_refreshing(self):
+        cache = StaleWhileRevalidateCache(ttl=0, stale_ttl=10)
+        loader = _Loader()
+
+        await cache.get_or_load("org", 0, loader)
+        stale = await cache.get_or_load("org", 0, loader)
+        await asyncio.sleep(0.01)
+
+        assert stale == 1
+        assert loader.calls == 2
+        assert await cache.get_or_load("org", 0, loader) == 2
+
+    async def test_new_generation_bypasses_cached_value(self):
+        cache = StaleWhileRevalidateCache(ttl=10)
+        generations = GenerationCounter()
+        loader = _Loader()
+
+        await cache.get_or_load("org", generations.get("org"), loader)
+        value = await cache.get_or_load("org", generations.bump("org"), loader)
+
+        assert value == 2
+        assert await cache.get_or_load("org", generations.get("org"), loader) == 2
+
+    async def test_rejected_values_are_not_cached(self):
+        cache = StaleWhileRevalidateCache(ttl=10)
+        loader = _Loader()
+
+        await cache.get_or_load("org", 0, loader, cacheable=lambda value: False)
+        value = await cache.get_or_load("org", 0, loader, cacheable=lambda value: False)
+
+        assert value == 2
+
+    async def test_failed_load_is_not_cached(self):
+        cache = StaleWhileRevalidateCache(ttl=10)
+
+        async def failing():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load("org", 0, failing)
+
+        assert await cache.get_or_load("org", 0, _Loader()) == 1
+
+
+@pytest.mark.asyncio
+class TestCachedAnalytics:
+    async def test_writes_invalidate_cached_statistics(self, test_db, test_organization):
+        statements = []
+
+        @event.listens_for(test_db.sync_engine, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            service = AnalyticsService(db)
+            first = await service.cached("get_contact_statistics", test_organization.id)
+            second = await service.cached("get_contact_statistics", test_organization.id)
+            reads = len(statements)
+
+            generation = analytics_generations.get(test_organization.id)
+            await ContactService(db).create_contact(test_organization.id, "New", "Contact")
+            third = await service.cached("get_contact_statistics", test_organization.id)
+
+        assert first == second == {"total_contacts": 0}
+        assert reads == 1
+        assert analytics_generations.get(test_organization.id) == generation + 1
+        assert third == {"total_contacts": 1}
+
+    async def test_deleting_contact_bumps_its_organization(self, test_db, test_organization):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            contact = Contact(
+                id=uuid4(), organization_id=test_organization.id,
+                first_name="Gone", last_name="Soon",
+            )
+            db.add(contact)
+            await db.commit()
+            generation = analytics_generations.get(test_organization.id)
+
+            await ContactService(db).delete_contact(contact.id)
+
+        assert analytics_generations.get(test_organization.id) == generation + 1
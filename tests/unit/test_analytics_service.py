@@ -0,0 +1,203 @@
+import asyncio
+import pytest
+from uuid import uuid4
+from decimal import Decimal
+from datetime import datetime, timedelta
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models import (
+    Activity,
+    ActivityTypeEnum,
+    Contact,
+    Deal,
+    DealStatusEnum,
+    Task,
+    TaskStatusEnum,
+)
+from app.repositories import OrganizationStatsRepository
+from app.services import AnalyticsService
+
+
+@pytest.mark.asyncio
+class TestAnalyticsService:
+    async def test_deals_summary_single_query(self, test_db, test_organization, test_user):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            await self._seed(db, test_organization.id, test_user.id)
+            statements = self._record_statements(test_db)
+
+            summary = await AnalyticsService(db).get_deals_summary(test_organization.id)
+
+        assert len(statements) == 1
+        assert summary == {
+            "total_deals": 4,
+            "new": 1,
+            "in_progress": 1,
+            "won": 1,
+            "lost": 1,
+            "won_amount": Decimal("3000.00"),
+            "pipeline_amount": Decimal("2000.00"),
+            "win_rate": 25.0,
+        }
+
+    async def test_tasks_summary_counts_overdue_live(self, test_db, test_organization, test_user):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            await self._seed(db, test_organization.id, test_user.id)
+            statements = self._record_statements(test_db)
+
+            summary = await AnalyticsService(db).get_tasks_summary(test_organization.id)
+
+        assert len(statements) == 2
+        assert summary == {
+            "total_tasks": 3,
+            "todo": 1,
+            "in_progress": 1,
+            "done": 1,
+            "overdue": 1,
+            "completion_rate": 33.33,
+        }
+
+    async def test_activity_statistics_single_query(
+        self, test_db, test_organization, test_user
+    ):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            await self._seed(db, test_organization.id, test_user.id)
+            statements = self._record_statements(test_db)
+
+            stats = await AnalyticsService(db).get_activity_statistics(test_organization.id)
+
+        assert len(statements) == 1
+        assert stats == {
+            "total_activities": 3,
+            "calls": 2,
+            "emails": 0,
+            "meetings": 0,
+            "notes": 1,
+        }
+
+    async def test_dashboard_runs_sections_on_own_sessions(
+        self, test_db, test_organization, test_user
+    ):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            await self._seed(db, test_organization.id, test_user.id)
+            service = AnalyticsService(db)
+            expected_deals = await service.get_deals_summary(test_organization.id)
+            expected_tasks = await service.get_tasks_summary(test_organization.id)
+            statements = self._record_statements(test_db)
+
+            dashboard = await service.get_dashboard_summary(test_organization.id)
+
+        assert len(statements) == 7
+        assert dashboard["deals"] == expected_deals
+        assert dashboard["tasks"] == expected_tasks
+        assert dashboard["contacts"] == {"total_contacts": 1}
+        assert dashboard["activities"]["total_activities"] == 3
+        assert len(dashboard["recent_activities"]) == 3
+        assert dashboard["meta"]["partial"] is False
+        assert set(dashboard["meta"]["sections"]) == {
+            "deals", "tasks", "contacts", "activities", "recent_activities"
+        }
+        assert all(
+            meta["status"] == "ok" and meta["duration_ms"] >= 0
+            for meta in dashboard["meta"]["sections"].values()
+        )
+
+    async def test_dashboard_returns_partial_result_on_timeout(
+        self, test_db, test_organization, test_user, monkeypatch
+    ):
+        async def slow_tasks_summary(self, organization_id):
+            await asyncio.sleep(1)
+
+        monkeypatch.setattr(get_settings(), "DASHBOARD_SECTION_TIMEOUT_SECONDS", 0.05)
+        monkeypatch.setattr(AnalyticsService, "get_tasks_summary", slow_tasks_summary)
+
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            await self._seed(db, test_organization.id, test_user.id)
+            dashboard = await AnalyticsService(db).get_dashboard_summary(test_organization.id)
+
+        assert dashboard["tasks"] is None
+        assert dashboard["deals"]["total_deals"] == 4
+        assert dashboard["meta"]["partial"] is True
+        assert dashboard["meta"]["sections"]["tasks"]["status"] == "timeout"
+        assert dashboard["meta"]["sections"]["tasks"]["duration_ms"] < 1000
+        assert dashboard["meta"]["sections"]["deals"]["status"] == "ok"
+
+    async def test_summaries_are_scoped_to_organization(self, test_db, test_organization):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            dashboard = await AnalyticsService(db).get_dashboard_summary(uuid4())
+
+        assert dashboard["deals"]["total_deals"] == 0
+        assert dashboard["deals"]["won_amount"] == 0
+        assert dashboard["tasks"]["completion_rate"] == 0
+        assert dashboard["recent_activities"] == []
+
+    @staticmethod
+    def _record_statements(test_db):
+        statements = []
+
+        @event.listens_for(test_db.sync_engine, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        return statements
+
+    @staticmethod
+    async def _seed(db, organization_id, user_id):
+        contact = Contact(
+            id=uuid4(),
+            organization_id=organization_id,
+            first_name="Summary",
+            last_name="Contact",
+        )
+        db.add(contact)
+
+        for status, amount in [
+            (DealStatusEnum.NEW, Decimal("500.00")),
+            (DealStatusEnum.IN_PROGRESS, Decimal("2000.00")),
+            (DealStatusEnum.WON, Decimal("3000.00")),
+            (DealStatusEnum.LOST, Decimal("700.00")),
+        ]:
+            db.add(
+                Deal(
+                    organization_id=organization_id,
+                    contact_id=contact.id,
+                    title=f"{status.value} deal",
+                    amount=amount,
+                    status=status,
+                )
+            )
+
+        now = datetime.utcnow()
+        for status, due_date in [
+            (TaskStatusEnum.TODO, now - timedelta(days=2)),
+            (TaskStatusEnum.IN_PROGRESS, now + timedelta(days=2)),
+            (TaskStatusEnum.DONE, now - timedelta(days=2)),
+        ]:
+            db.add(
+                Task(
+                    organization_id=organization_id,
+                    assigned_to=user_id,
+                    title=f"{status.value} task",
+                    status=status,
+                    due_date=due_date,
+                )
+            )
+
+        for activity_type in [
+            ActivityTypeEnum.CALL,
+            ActivityTypeEnum.CALL,
+            ActivityTypeEnum.NOTE,
+        ]:
+            db.add(
+                Activity(
+                    organization_id=organization_id,
+                    contact_id=contact.id,
+                    created_by=user_id,
+                    activity_type=activity_type,
+                    title=f"{activity_type.value} activity",
+                )
+            )
+
+        await db.commit()
+        await OrganizationStatsRepository(db).reconcile(organization_id)
@@ -0,0 +1,179 @@
+import pytest
+from uuid import uuid4
+from decimal import Decimal
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Contact, Deal, DealStatusEnum, OrganizationMember
+from app.repositories import ContactRepository, DealRepository, OrganizationRepository
+
+
+@pytest.mark.asyncio
+class TestBaseRepositoryAggregates:
+    async def test_count_with_filters(self, test_db, test_organization):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            await self._seed_deals(db, test_organization.id)
+            repo = DealRepository(db)
+
+            assert await repo.count() == 4
+            assert await repo.count(Deal.organization_id == test_organization.id) == 4
+            assert await repo.count(Deal.status == DealStatusEnum.WON) == 2
+            assert await repo.count(Deal.organization_id == uuid4()) == 0
+
+    async def test_sum_with_filters(self, test_db, test_organization):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            await self._seed_deals(db, test_organization.id)
+            repo = DealRepository(db)
+
+            won = await repo.get_total_amount_by_organization(test_organization.id)
+            lost = await repo.get_total_amount_by_status(
+                test_organization.id, DealStatusEnum.LOST
+            )
+
+            assert won == Decimal("3000.00")
+            assert lost == Decimal(0)
+
+    async def test_count_by_groups(self, test_db, test_organization):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            await self._seed_deals(db, test_organization.id)
+            repo = DealRepository(db)
+
+            counts = await repo.count_by(
+                Deal.status, Deal.organization_id == test_organization.id
+            )
+
+            assert counts == {
+                DealStatusEnum.NEW: 1,
+                DealStatusEnum.IN_PROGRESS: 1,
+                DealStatusEnum.WON: 2,
+            }
+
+    async def test_count_other_model(self, test_db, test_organization, test_user):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            repo = OrganizationRepository(db)
+
+            assert await repo.count_members(test_organization.id) == 1
+            assert await repo.count(
+                OrganizationMember.user_id == test_user.id, model=OrganizationMember
+            ) == 1
+
+    @staticmethod
+    async def _seed_deals(db, organization_id):
+        contact = Contact(
+            id=uuid4(),
+            organization_id=organization_id,
+            first_name="Count",
+            last_name="Contact",
+        )
+        db.add(contact)
+        for status, amount in [
+            (DealStatusEnum.NEW, Decimal("100.00")),
+            (DealStatusEnum.IN_PROGRESS, Decimal("200.00")),
+            (DealStatusEnum.WON, Decimal("1000.00")),
+            (DealStatusEnum.WON, Decimal("2000.00")),
+        ]:
+            db.add(
+                Deal(
+                    organization_id=organization_id,
+                    contact_id=contact.id,
+                    title=f"{status.value} deal",
+                    amount=amount,
+                    status=status,
+                )
+            )
+        await db.commit()
+
+
+@pytest.mark.asyncio
+class TestBaseRepositoryMutations:
+    async def test_create_is_single_insert(self, test_db, test_organization):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            repo = ContactRepository(db)
+
+            with _StatementCounter(test_db) as statements:
+                contact = await repo.create(
+                    Contact(organization_id=test_organization.id, first_name="A", last_name="B")
+                )
+
+            assert contact.id is not None
+            assert contact.created_at is not None
+            assert contact.is_active is True
+            assert [s.split()[0] for s in statements] == ["INSERT"]
+
+    async def test_update_is_single_statement(self, test_db, test_organization):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            repo = ContactRepository(db)
+            contact = await repo.create(
+                Contact(organization_id=test_organization.id, first_name="A", last_name="B")
+            )
+
+            with _StatementCounter(test_db) as statements:
+                updated = await repo.update(contact.id, {"first_name": "Z"})
+
+            assert updated.first_name == "Z"
+            assert updated.updated_at >= contact.created_at
+            assert [s.split()[0] for s in statements] == ["UPDATE"]
+
+    async def test_update_missing_returns_none(self, test_db):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            assert await ContactRepository(db).update(uuid4(), {"first_name": "Z"}) is None
+
+    async def test_update_and_delete_respect_conditions(self, test_db, test_organization):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            repo = ContactRepository(db)
+            contact = await repo.create(
+                Contact(organization_id=test_organization.id, first_name="A", last_name="B")
+            )
+
+            assert await repo.update(
+                contact.id, {"first_name": "Z"}, Contact.organization_id == uuid4()
+            ) is None
+            assert await repo.delete(contact.id, Contact.organization_id == uuid4()) is False
+            assert await repo.delete(contact.id, Contact.organization_id == test_organization.id)
+            assert await repo.exists(contact.id) is False
+
+    async def test_bulk_methods_batch_statements(self, test_db, test_organization):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            repo = ContactRepository(db)
+
+            with _StatementCounter(test_db) as statements:
+                created = await repo.create_many([
+                    Contact(organization_id=test_organization.id, first_name=f"C{i}", last_name="B")
+                    for i in range(5)
+                ])
+
+            assert [c.first_name for c in created] == [f"C{i}" for i in range(5)]
+            assert [s.split()[0] for s in statements] == ["INSERT"]
+
+            with _StatementCounter(test_db) as statements:
+                updated = await repo.update_many({
+                    created[0].id: {"company": "Acme"},
+                    created[1].id: {"company": "Globex"},
+                    created[2].id: {"company": "Initech", "city": "Austin"},
+                })
+
+            assert updated == 3
+            assert [s.split()[0] for s in statements] == ["UPDATE", "UPDATE"]
+
+            deleted = await repo.delete_many([created[3].id, created[4].id, uuid4()])
+
+            assert deleted == {created[3].id, created[4].id}
+            assert await repo.existing_ids(c.id for c in created) == {
+                created[0].id, created[1].id, created[2].id
+            }
+
+
+class _StatementCounter:
+    def __init__(self, engine):
+        self.engine = engine.sync_engine
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self.statements
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._record)
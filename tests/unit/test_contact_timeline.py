@@ -0,0 +1,143 @@
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import NotFound
+from app.models import (
+    Activity,
+    ActivityTypeEnum,
+    Contact,
+    Deal,
+    DealStatusEnum,
+    DealStatusTransition,
+    Task,
+    TaskStatusEnum,
+)
+from app.repositories import ActivityRepository
+from app.services import ContactService
+
+START = datetime(2026, 3, 2, 9)
+
+TIMELINE = [
+    ("task_completed", "Send proposal"),
+    ("deal_status_changed", "Big deal"),
+    ("activity", "Intro call"),
+    ("task_created", "Send proposal"),
+    ("deal_created", "Big deal"),
+    ("activity", "First email"),
+]
+
+
+@pytest.mark.asyncio
+class TestContactTimeline:
+    async def test_pages_merge_all_sources_newest_first(
+        self, test_db, test_organization, test_user
+    ):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            contact = await self._seed(db, test_organization.id, test_user.id)
+            service = ContactService(db)
+
+            events = await self._collect(service, test_organization.id, contact.id, 2)
+
+        assert [(event["kind"], event["title"]) for event in events] == TIMELINE
+        assert events[1]["detail"] == "in_progress"
+        assert events[2]["detail"] == "call"
+        assert events[3]["deal_id"] == events[4]["id"]
+
+    async def test_pages_fall_through_to_archived_activities(
+        self, test_db, test_organization, test_user, cold_storage
+    ):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            contact = await self._seed(db, test_organization.id, test_user.id)
+            await ActivityRepository(db).archive_before(
+                test_organization.id, START + timedelta(hours=3, minutes=30), 10
+            )
+            service = ContactService(db)
+
+            pages = {
+                limit: await self._collect(service, test_organization.id, contact.id, limit)
+                for limit in (1, 2, 4)
+            }
+
+        for events in pages.values():
+            assert [(event["kind"], event["title"]) for event in events] == TIMELINE
+            assert events[2]["detail"] == "call"
+            assert events[5]["detail"] == "email"
+
+    async def test_timeline_is_scoped_to_organization(self, test_db, test_organization, test_user):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            contact = await self._seed(db, test_organization.id, test_user.id)
+            with pytest.raises(NotFound):
+                await ContactService(db).get_timeline(uuid4(), contact.id)
+
+    @staticmethod
+    async def _collect(service, organization_id, contact_id, limit):
+        events, cursor = [], None
+        while True:
+            page, cursor = await service.get_timeline(
+                organization_id, contact_id, limit=limit, cursor=cursor
+            )
+            events.extend(page)
+            if cursor is None:
+                return events
+
+    @staticmethod
+    async def _seed(db, organization_id, user_id):
+        contact = Contact(
+            id=uuid4(),
+            organization_id=organization_id,
+            first_name="Time",
+            last_name="Line",
+            created_at=START - timedelta(days=1),
+        )
+        deal = Deal(
+            id=uuid4(),
+            organization_id=organization_id,
+            contact_id=contact.id,
+            title="Big deal",
+            status=DealStatusEnum.IN_PROGRESS,
+            created_at=START + timedelta(hours=1),
+        )
+        db.add_all([
+            contact,
+            deal,
+            Activity(
+                id=uuid4(),
+                organization_id=organization_id,
+                contact_id=contact.id,
+                created_by=user_id,
+                activity_type=ActivityTypeEnum.EMAIL,
+                title="First email",
+                created_at=START,
+            ),
+            Activity(
+                id=uuid4(),
+                organization_id=organization_id,
+                contact_id=contact.id,
+                created_by=user_id,
+                activity_type=ActivityTypeEnum.CALL,
+                title="Intro call",
+                created_at=START + timedelta(hours=3),
+            ),
+            DealStatusTransition(
+                organization_id=organization_id,
+                deal_id=deal.id,
+                from_status=DealStatusEnum.NEW,
+                to_status=DealStatusEnum.IN_PROGRESS,
+                changed_at=START + timedelta(hours=4),
+            ),
+            Task(
+                id=uuid4(),
+                organization_id=organization_id,
+                contact_id=contact.id,
+                deal_id=deal.id,
+                assigned_to=user_id,
+                title="Send proposal",
+                status=TaskStatusEnum.DONE,
+                created_at=START + timedelta(hours=2),
+                completed_at=START + timedelta(hours=5),
+            ),
+        ])
+        await db.commit()
+        return contact
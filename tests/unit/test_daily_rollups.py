@@ -0,0 +1,171 @@
+import pytest
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import BadRequest
+from app.models import (
+    Activity,
+    ActivityTypeEnum,
+    Contact,
+    Deal,
+    DealStatusEnum,
+    Task,
+    TaskStatusEnum,
+)
+from app.repositories import DailyRollupRepository
+from app.services import AnalyticsService
+from app.services.analytics_service import Granularity
+
+MONDAY = date(2026, 3, 2)
+
+
+def _at(day, hour=12):
+    return datetime.combine(day, datetime.min.time()) + timedelta(hours=hour)
+
+
+@pytest.mark.asyncio
+class TestDailyRollups:
+    async def test_rebuild_buckets_by_event_day(self, test_db, test_organization, test_user):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            await self._seed(db, test_organization.id, test_user.id)
+            repo = DailyRollupRepository(db)
+
+            assert await repo.rebuild(MONDAY, MONDAY + timedelta(days=14)) == 3
+            rows = await repo.series(
+                test_organization.id, MONDAY, MONDAY + timedelta(days=14), "day"
+            )
+
+        by_day = {row["bucket"]: row for row in rows}
+        assert by_day[MONDAY]["deals_created"] == 2
+        assert by_day[MONDAY]["activities_logged"] == 1
+        assert by_day[MONDAY + timedelta(days=2)]["deals_won"] == 1
+        assert by_day[MONDAY + timedelta(days=2)]["won_amount"] == Decimal("1200.00")
+        assert by_day[MONDAY + timedelta(days=8)]["tasks_completed"] == 1
+        assert by_day[MONDAY + timedelta(days=8)]["deals_won"] == 0
+
+    async def test_rebuild_replaces_stale_days(self, test_db, test_organization, test_user):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            await self._seed(db, test_organization.id, test_user.id)
+            repo = DailyRollupRepository(db)
+            await repo.rebuild(MONDAY, MONDAY + timedelta(days=14))
+
+            await db.execute(delete(Activity))
+            await db.execute(delete(Task))
+            await db.commit()
+            await repo.rebuild(MONDAY + timedelta(days=7), MONDAY + timedelta(days=14))
+            rows = await repo.series(
+                test_organization.id, MONDAY, MONDAY + timedelta(days=14), "day"
+            )
+
+        assert [row["bucket"] for row in rows] == [MONDAY, MONDAY + timedelta(days=2)]
+        assert rows[0]["activities_logged"] == 1
+
+    async def test_earliest_day(self, test_db, test_organization, test_user):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            repo = DailyRollupRepository(db)
+            assert await repo.earliest_day(test_organization.id) is None
+
+            await self._seed(db, test_organization.id, test_user.id)
+
+            assert await repo.earliest_day(test_organization.id) == MONDAY
+
+    async def test_timeseries_rebuckets_and_fills_gaps(
+        self, test_db, test_organization, test_user
+    ):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            await self._seed(db, test_organization.id, test_user.id)
+            await DailyRollupRepository(db).rebuild(MONDAY, MONDAY + timedelta(days=31))
+            service = AnalyticsService(db)
+
+            weekly = await service.get_timeseries(
+                test_organization.id,
+                Granularity.WEEK,
+                MONDAY + timedelta(days=3),
+                MONDAY + timedelta(days=20),
+            )
+            monthly = await service.get_timeseries(
+                test_organization.id, Granularity.MONTH, MONDAY, MONDAY
+            )
+
+        assert weekly["start"] == MONDAY
+        assert weekly["end"] == MONDAY + timedelta(days=20)
+        assert [bucket["bucket"] for bucket in weekly["buckets"]] == [
+            MONDAY, MONDAY + timedelta(days=7), MONDAY + timedelta(days=14)
+        ]
+        assert weekly["buckets"][0]["deals_created"] == 2
+        assert weekly["buckets"][0]["deals_won"] == 1
+        assert weekly["buckets"][1]["tasks_completed"] == 1
+        assert weekly["buckets"][2] == {
+            "bucket": MONDAY + timedelta(days=14),
+            "deals_created": 0,
+            "deals_won": 0,
+            "won_amount": 0,
+            "tasks_completed": 0,
+            "activities_logged": 0,
+        }
+        assert monthly["start"] == date(2026, 3, 1)
+        assert monthly["end"] == date(2026, 3, 31)
+        assert monthly["buckets"][0]["won_amount"] == Decimal("1200.00")
+
+    async def test_timeseries_rejects_inverted_and_oversized_ranges(
+        self, test_db, test_organization
+    ):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            service = AnalyticsService(db)
+
+            with pytest.raises(BadRequest):
+                await service.get_timeseries(
+                    test_organization.id, Granularity.DAY, MONDAY, MONDAY - timedelta(days=1)
+                )
+            with pytest.raises(BadRequest):
+                await service.get_timeseries(
+                    test_organization.id, Granularity.DAY, date(2000, 1, 1), MONDAY
+                )
+
+    @staticmethod
+    async def _seed(db, organization_id, user_id):
+        contact = Contact(
+            id=uuid4(),
+            organization_id=organization_id,
+            first_name="Rollup",
+            last_name="Contact",
+        )
+        db.add(contact)
+        db.add(Deal(
+            organization_id=organization_id,
+            contact_id=contact.id,
+            title="Won deal",
+            amount=Decimal("1200.00"),
+            status=DealStatusEnum.WON,
+            created_at=_at(MONDAY, 9),
+            closed_date=_at(MONDAY + timedelta(days=2)),
+        ))
+        db.add(Deal(
+            organization_id=organization_id,
+            contact_id=contact.id,
+            title="Lost deal",
+            amount=Decimal("300.00"),
+            status=DealStatusEnum.LOST,
+            created_at=_at(MONDAY, 23),
+            closed_date=_at(MONDAY + timedelta(days=8)),
+        ))
+        db.add(Task(
+            organization_id=organization_id,
+            assigned_to=user_id,
+            title="Done task",
+            status=TaskStatusEnum.DONE,
+            created_at=_at(MONDAY + timedelta(days=40)),
+            completed_at=_at(MONDAY + timedelta(days=8), 0),
+        ))
+        db.add(Activity(
+            organization_id=organization_id,
+            contact_id=contact.id,
+            created_by=user_id,
+            activity_type=ActivityTypeEnum.CALL,
+            title="Call",
+            created_at=_at(MONDAY, 10),
+        ))
+        await db.commit()
@@ -0,0 +1,103 @@
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import BadRequest
+from app.models import Contact, Deal, DealStatusEnum
+from app.services import DealService
+from app.services.deal_service import DealBoardSort
+
+NEW = DealStatusEnum.NEW
+WON = DealStatusEnum.WON
+
+
+@pytest.mark.asyncio
+class TestDealBoard:
+    async def test_columns_in_one_statement(self, test_db, test_organization):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            await self._seed(db, test_organization.id, [
+                ("small", NEW, 10, None),
+                ("large", NEW, 300, None),
+                ("unpriced", NEW, None, None),
+                ("medium", NEW, 50, None),
+                ("won", WON, 70, None),
+            ])
+            statements = self._record_statements(test_db)
+
+            board = await DealService(db).get_board(test_organization.id, limit=2)
+
+        assert len(statements) == 1
+        columns = {column["status"]: column for column in board}
+        assert list(columns) == [member.value for member in DealStatusEnum]
+        assert [deal.title for deal in columns["new"]["deals"]] == ["large", "medium"]
+        assert columns["new"]["count"] == 4
+        assert columns["new"]["total_amount"] == Decimal("360")
+        assert columns["new"]["next_cursor"] is not None
+        assert [deal.title for deal in columns["won"]["deals"]] == ["won"]
+        assert columns["won"]["next_cursor"] is None
+        assert columns["lost"] == {
+            "status": "lost",
+            "count": 0,
+            "total_amount": Decimal("0"),
+            "deals": [],
+            "next_cursor": None,
+        }
+
+    async def test_column_paging_by_close_date(self, test_db, test_organization):
+        soon = datetime(2026, 11, 1)
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            await self._seed(db, test_organization.id, [
+                ("undated", NEW, 10, None),
+                ("later", NEW, 10, soon + timedelta(days=30)),
+                ("sooner", NEW, 10, soon),
+                ("middle", NEW, 10, soon + timedelta(days=7)),
+                ("won", WON, 10, soon),
+            ])
+            service = DealService(db)
+
+            titles, cursor = [], None
+            while True:
+                [column] = await service.get_board(
+                    test_organization.id, DealBoardSort.EXPECTED_CLOSE_DATE, 1, NEW, cursor
+                )
+                titles.extend(deal.title for deal in column["deals"])
+                cursor = column["next_cursor"]
+                if cursor is None:
+                    break
+
+            with pytest.raises(BadRequest):
+                await service.get_board(test_organization.id, cursor=cursor or "x")
+
+        assert titles == ["sooner", "middle", "later", "undated"]
+        assert column["count"] == 4
+
+    @staticmethod
+    async def _seed(db, organization_id, deals):
+        contact = Contact(
+            id=uuid4(), organization_id=organization_id, first_name="Board", last_name="Owner"
+        )
+        db.add(contact)
+        for title, status, amount, expected_close_date in deals:
+            db.add(Deal(
+                id=uuid4(),
+                organization_id=organization_id,
+                contact_id=contact.id,
+                title=title,
+                status=status,
+                amount=Decimal(amount) if amount is not None else None,
+                expected_close_date=expected_close_date,
+            ))
+        await db.commit()
+
+    @staticmethod
+    def _record_statements(test_db):
+        statements = []
+
+        @event.listens_for(test_db.sync_engine, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        return statements
@@ -0,0 +1,143 @@
+import pytest
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import BadRequest
+from app.models import Contact, Deal, DealStatusEnum, DealStatusTransition
+from app.services import AnalyticsService
+from app.services.analytics_service import FUNNEL_STAGES
+
+START = datetime(2026, 3, 2, 9)
+
+NEW = DealStatusEnum.NEW
+IN_PROGRESS = DealStatusEnum.IN_PROGRESS
+WON = DealStatusEnum.WON
+LOST = DealStatusEnum.LOST
+
+
+def test_stages_follow_valid_transitions():
+    assert FUNNEL_STAGES == [NEW, IN_PROGRESS, WON]
+
+
+@pytest.mark.asyncio
+class TestDealFunnel:
+    async def test_conversion_durations_and_assignees(
+        self, test_db, test_organization, test_user
+    ):
+        other = uuid4()
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            await self._seed(db, test_organization.id, [
+                (test_user.id, [(IN_PROGRESS, 1), (WON, 11)]),
+                (test_user.id, [(IN_PROGRESS, 2), (WON, 22)]),
+                (test_user.id, [(IN_PROGRESS, 3), (LOST, 33)]),
+                (test_user.id, [(IN_PROGRESS, 4)]),
+                (other, [(LOST, 5)]),
+                (other, []),
+            ])
+            statements = self._record_statements(test_db)
+
+            funnel = await AnalyticsService(db).get_deals_funnel(
+                test_organization.id, date(2026, 3, 1), date(2026, 3, 31)
+            )
+
+        assert len(statements) == 1
+        stages = {stage["stage"]: stage for stage in funnel["stages"]}
+        assert stages["new"] == {
+            "stage": "new",
+            "deals": 6,
+            "advanced": 4,
+            "lost": 1,
+            "median_hours": 3.0,
+            "p90_hours": 5.0,
+        }
+        assert stages["in_progress"]["deals"] == 4
+        assert stages["in_progress"]["advanced"] == 2
+        assert stages["in_progress"]["lost"] == 1
+        assert stages["in_progress"]["median_hours"] == 20.0
+        assert stages["in_progress"]["p90_hours"] == 30.0
+        assert stages["won"]["deals"] == 2
+        assert stages["won"]["median_hours"] is None
+        assert funnel["conversion"] == {
+            "new_to_in_progress": 66.67,
+            "in_progress_to_won": 50.0,
+            "new_to_won": 33.33,
+        }
+
+        assignees = {row["assigned_to"]: row for row in funnel["assignees"]}
+        assert assignees[test_user.id] == {
+            "assigned_to": test_user.id,
+            "new": 4,
+            "in_progress": 4,
+            "won": 2,
+            "lost_from_new": 0,
+            "lost_from_in_progress": 1,
+            "drop_off_rate": 25.0,
+            "win_rate": 50.0,
+        }
+        assert assignees[other]["lost_from_new"] == 1
+        assert assignees[other]["drop_off_rate"] == 50.0
+
+    async def test_range_selects_cohort_by_creation_date(
+        self, test_db, test_organization, test_user
+    ):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            await self._seed(db, test_organization.id, [
+                (test_user.id, [(IN_PROGRESS, 1)]),
+            ])
+            service = AnalyticsService(db)
+
+            before = await service.get_deals_funnel(
+                test_organization.id, date(2026, 2, 1), date(2026, 3, 1)
+            )
+            with pytest.raises(BadRequest):
+                await service.get_deals_funnel(
+                    test_organization.id, date(2026, 3, 2), date(2026, 3, 1)
+                )
+
+        assert [stage["deals"] for stage in before["stages"]] == [0, 0, 0]
+        assert before["assignees"] == []
+        assert before["conversion"]["new_to_won"] == 0
+
+    @staticmethod
+    def _record_statements(test_db):
+        statements = []
+
+        @event.listens_for(test_db.sync_engine, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        return statements
+
+    @staticmethod
+    async def _seed(db, organization_id, deals):
+        contact = Contact(
+            id=uuid4(),
+            organization_id=organization_id,
+            first_name="Funnel",
+            last_name="Contact",
+        )
+        db.add(contact)
+        for index, (assigned_to, transitions) in enumerate(deals):
+            deal = Deal(
+                id=uuid4(),
+                organization_id=organization_id,
+                contact_id=contact.id,
+                assigned_to=assigned_to,
+                title=f"Deal {index}",
+                status=transitions[-1][0] if transitions else NEW,
+                created_at=START + timedelta(minutes=index),
+            )
+            db.add(deal)
+            previous = NEW
+            for status, hours in transitions:
+                db.add(DealStatusTransition(
+                    organization_id=organization_id,
+                    deal_id=deal.id,
+                    from_status=previous,
+                    to_status=status,
+                    changed_at=deal.created_at + timedelta(hours=hours),
+                ))
+                previous = status
+        await db.commit()
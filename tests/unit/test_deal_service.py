@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.services import DealService
 from app.models import Deal, DealStatusEnum, Contact, Organization
 from app.core.exceptions import BadRequest
-from app.repositories import DealRepository, ContactRepository
+from app.repositories import DealRepository, ContactRepository, DealStatusTransitionRepository
 
 
 @pytest.mark.asyncio
@@ -148,6 +148,127 @@ class TestDealService:
 
         await db.close()
 
+    async def test_status_changes_are_recorded_as_transitions(
+        self, test_db, test_organization, test_user
+    ):
+        db = await self._get_db_session(test_db)
+
+        contact = Contact(
+            id=uuid4(),
+            organization_id=test_organization.id,
+            first_name="Dana",
+            last_name="White",
+        )
+        db.add(contact)
+        await db.commit()
+
+        service = DealService(db)
+        deal = await service.create_deal(
+            organization_id=test_organization.id,
+            contact_id=contact.id,
+            title="Tracked Deal",
+            amount=Decimal("2500.00"),
+        )
+        await service.change_deal_status(deal.id, DealStatusEnum.IN_PROGRESS, test_user.id)
+        await service.update_deal(deal.id, {"amount": Decimal("4000.00")}, test_user.id)
+        await service.update_deal(deal.id, {"status": "won"}, test_user.id)
+        await service.update_deal(deal.id, {"status": "won"}, test_user.id)
+
+        transitions = await DealStatusTransitionRepository(db).list_by_deal(deal.id)
+
+        assert [(t.from_status, t.to_status) for t in transitions] == [
+            (DealStatusEnum.NEW, DealStatusEnum.IN_PROGRESS),
+            (DealStatusEnum.IN_PROGRESS, DealStatusEnum.WON),
+        ]
+        assert [t.amount for t in transitions] == [Decimal("2500.00"), Decimal("4000.00")]
+        assert all(t.changed_by == test_user.id for t in transitions)
+        assert all(t.organization_id == test_organization.id for t in transitions)
+
+        await db.close()
+
+    async def test_bulk_update_records_transitions(self, test_db, test_organization, test_user):
+        db = await self._get_db_session(test_db)
+
+        contact = Contact(
+            id=uuid4(),
+            organization_id=test_organization.id,
+            first_name="Eve",
+            last_name="Black",
+        )
+        db.add(contact)
+        await db.commit()
+
+        service = DealService(db)
+        first = await service.create_deal(
+            organization_id=test_organization.id, contact_id=contact.id, title="First"
+        )
+        second = await service.create_deal(
+            organization_id=test_organization.id, contact_id=contact.id, title="Second"
+        )
+        await service.bulk_update_deals(
+            test_organization.id,
+            [
+                {"id": first.id, "status": DealStatusEnum.LOST},
+                {"id": second.id, "title": "Renamed"},
+            ],
+            test_user.id,
+        )
+
+        repo = DealStatusTransitionRepository(db)
+        first_transitions = await repo.list_by_deal(first.id)
+        second_transitions = await repo.list_by_deal(second.id)
+
+        assert [(t.from_status, t.to_status) for t in first_transitions] == [
+            (DealStatusEnum.NEW, DealStatusEnum.LOST)
+        ]
+        assert second_transitions == []
+
+        await db.close()
+
+    async def test_updates_to_won_or_lost_set_closed_date(
+        self, test_db, test_organization, test_user
+    ):
+        db = await self._get_db_session(test_db)
+
+        contact = Contact(
+            id=uuid4(),
+            organization_id=test_organization.id,
+            first_name="Closing",
+            last_name="Date",
+        )
+        db.add(contact)
+        await db.commit()
+
+        service = DealService(db)
+        won, lost, open_ = [
+            await service.create_deal(
+                organization_id=test_organization.id,
+                contact_id=contact.id,
+                title=title,
+                amount=Decimal("100.00"),
+            )
+            for title in ("Won", "Lost", "Open")
+        ]
+        await service.update_deal(won.id, {"status": DealStatusEnum.WON})
+        await service.bulk_update_deals(
+            test_organization.id,
+            [
+                {"id": lost.id, "status": DealStatusEnum.LOST},
+                {"id": open_.id, "status": DealStatusEnum.IN_PROGRESS},
+            ],
+        )
+
+        stored = {
+            deal_id: await db.get(Deal, deal_id, populate_existing=True)
+            for deal_id in (won.id, lost.id, open_.id)
+        }
+
+        assert stored[won.id].closed_date is not None
+        assert stored[lost.id].closed_date is not None
+        assert stored[open_.id].closed_date is None
+
+        await db.close()
+
     @staticmethod
     async def _get_db_session(test_db):
         from sqlalchemy.ext.asyncio import AsyncSession
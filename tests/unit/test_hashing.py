@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+import pytest
+
+from app.core.exceptions import ServiceUnavailable
+from app.core.hashing import PasswordHasher
+from app.core.security import hash_password
+
+
+@pytest.mark.asyncio
+class TestPasswordHasher:
+    async def test_hash_and_verify_roundtrip(self):
+        hasher = PasswordHasher(max_workers=2)
+
+        hashed = await hasher.hash("securepassword123")
+
+        assert hashed != "securepassword123"
+        assert await hasher.verify("securepassword123", hashed)
+        assert not await hasher.verify("wrongpassword123", hashed)
+
+        hasher.shutdown()
+
+    async def test_verify_accepts_sync_hashes(self):
+        hasher = PasswordHasher(max_workers=1)
+
+        assert await hasher.verify("testpassword123", hash_password("testpassword123"))
+
+        hasher.shutdown()
+
+    async def test_event_loop_not_blocked_while_hashing(self):
+        hasher = PasswordHasher(max_workers=1)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        task = asyncio.create_task(ticker())
+        await hasher.hash("securepassword123")
+        task.cancel()
+
+        assert ticks > 1
+
+        hasher.shutdown()
+
+    async def test_rejects_when_saturated(self):
+        hasher = PasswordHasher(max_workers=1, max_pending=1, queue_timeout=0.05)
+
+        busy = asyncio.create_task(hasher._run(time.sleep, 0.5))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(ServiceUnavailable):
+            await hasher.hash("securepassword123")
+
+        await busy
+        hasher.shutdown()
+
+    async def test_unknown_executor_type(self):
+        with pytest.raises(ValueError):
+            PasswordHasher(executor_type="fiber")
@@ -0,0 +1,122 @@
+import pytest
+from decimal import Decimal
+from uuid import uuid4
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import BadRequest, Conflict
+from app.core.permissions import Role
+from app.core.versioning import parse_if_match
+from app.models import (
+    Activity, Contact, Deal, DealStatusEnum, DealStatusTransition, Task, TaskStatusEnum,
+)
+from app.repositories import ContactRepository, OrganizationStatsRepository
+from app.services import DealService, TaskService
+
+
+def test_parse_if_match():
+    assert parse_if_match(None) is None
+    assert parse_if_match("*") is None
+    assert parse_if_match('"3"') == 3
+    assert parse_if_match('W/"4"') == 4
+    with pytest.raises(BadRequest):
+        parse_if_match('"abc"')
+
+
+@pytest.mark.asyncio
+class TestOptimisticConcurrency:
+    async def test_updates_bump_version(self, test_db, test_organization):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            repo = ContactRepository(db)
+            contact = await repo.create(self._contact(test_organization.id))
+            assert contact.version == 1
+
+            updated = await repo.update(contact.id, {"first_name": "Renamed"}, version=1)
+            await repo.update_many({contact.id: {"last_name": "Bulk"}})
+            stored = await db.scalar(
+                select(Contact.version).where(Contact.id == contact.id)
+            )
+
+            with pytest.raises(Conflict):
+                await repo.update(contact.id, {"first_name": "Stale"}, version=1)
+            missing = await repo.update(uuid4(), {"first_name": "Ghost"}, version=1)
+
+        assert updated.version == 2
+        assert stored == 3
+        assert missing is None
+
+    async def test_stale_deal_writes_leave_no_side_effects(
+        self, test_db, test_organization, test_user
+    ):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            contact = self._contact(test_organization.id)
+            db.add(contact)
+            await db.commit()
+            service = DealService(db)
+            deal = await service.create_deal(
+                organization_id=test_organization.id,
+                contact_id=contact.id,
+                title="Versioned",
+                amount=Decimal("100.00"),
+            )
+            counters = await OrganizationStatsRepository(db).get_counters(test_organization.id)
+
+            moved = await service.change_deal_status(
+                deal.id, DealStatusEnum.IN_PROGRESS, test_user.id, version=1
+            )
+            with pytest.raises(Conflict):
+                await service.change_deal_status(
+                    deal.id, DealStatusEnum.WON, test_user.id, version=1
+                )
+            with pytest.raises(Conflict):
+                await service.update_deal(deal.id, {"amount": Decimal("5.00")}, version=1)
+
+            stored = await db.get(Deal, deal.id, populate_existing=True)
+            activities = await db.scalar(
+                select(func.count()).select_from(Activity).where(Activity.deal_id == deal.id)
+            )
+            transitions = await db.scalar(
+                select(func.count()).select_from(DealStatusTransition)
+                .where(DealStatusTransition.deal_id == deal.id)
+            )
+            after = await OrganizationStatsRepository(db).get_counters(test_organization.id)
+
+        assert moved.version == 2
+        assert stored.status == DealStatusEnum.IN_PROGRESS
+        assert stored.amount == Decimal("100.00")
+        assert stored.version == 2
+        assert activities == 1
+        assert transitions == 1
+        assert after["deals_in_progress"] == counters["deals_in_progress"] + 1
+        assert after["deals_new"] == counters["deals_new"] - 1
+
+    async def test_stale_task_completion_conflicts(self, test_db, test_organization, test_user):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            task = Task(
+                id=uuid4(),
+                organization_id=test_organization.id,
+                assigned_to=test_user.id,
+                title="Versioned task",
+                status=TaskStatusEnum.TODO,
+            )
+            db.add(task)
+            await db.commit()
+            service = TaskService(db)
+
+            renamed = await service.update_task(
+                task.id, {"title": "Renamed"}, test_user.id, Role.OWNER, version=1
+            )
+            renamed_version = renamed.version
+            with pytest.raises(Conflict):
+                await service.complete_task(task.id, test_user.id, Role.OWNER, version=1)
+            completed = await service.complete_task(task.id, test_user.id, Role.OWNER, version=2)
+
+        assert renamed_version == 2
+        assert completed.status == TaskStatusEnum.DONE
+        assert completed.version == 3
+
+    @staticmethod
+    def _contact(organization_id):
+        return Contact(
+            id=uuid4(), organization_id=organization_id, first_name="Version", last_name="Check"
+        )
@@ -0,0 +1,116 @@
+import pytest
+from uuid import uuid4
+from decimal import Decimal
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.permissions import Role
+from app.models import Contact, DealStatusEnum, OrganizationStats, Task, TaskStatusEnum
+from app.repositories import OrganizationStatsRepository
+from app.services import ContactService, DealService, TaskService
+
+
+@pytest.mark.asyncio
+class TestOrganizationStats:
+    async def test_missing_row_reads_as_zero(self, test_db, test_organization):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            stats = await OrganizationStatsRepository(db).get_counters(test_organization.id)
+
+        assert stats["contacts_total"] == 0
+        assert stats["won_amount"] == 0
+
+    async def test_deal_lifecycle_moves_counters(self, test_db, test_organization, test_user):
+        org_id = test_organization.id
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            contact = await ContactService(db).create_contact(
+                organization_id=org_id, first_name="Stats", last_name="Contact"
+            )
+            service = DealService(db)
+            won = await service.create_deal(
+                organization_id=org_id,
+                contact_id=contact.id,
+                title="Won",
+                amount=Decimal("1500.00"),
+            )
+            lost = await service.create_deal(
+                organization_id=org_id,
+                contact_id=contact.id,
+                title="Lost",
+                amount=Decimal("400.00"),
+            )
+            await service.change_deal_status(won.id, DealStatusEnum.IN_PROGRESS, test_user.id)
+            await service.change_deal_status(won.id, DealStatusEnum.WON, test_user.id)
+            await service.update_deal(lost.id, {"amount": Decimal("600.00")})
+            await service.change_deal_status(lost.id, DealStatusEnum.IN_PROGRESS, test_user.id)
+
+            stats = await OrganizationStatsRepository(db).get_counters(org_id)
+            assert stats["contacts_total"] == 1
+            assert stats["deals_total"] == 2
+            assert stats["deals_new"] == 0
+            assert stats["deals_in_progress"] == 1
+            assert stats["deals_won"] == 1
+            assert stats["won_amount"] == Decimal("1500.00")
+            assert stats["pipeline_amount"] == Decimal("600.00")
+            assert stats["activities_total"] == 3
+            assert stats["activities_note"] == 3
+
+            await service.delete_deal(lost.id)
+            stats = await OrganizationStatsRepository(db).get_counters(org_id)
+
+        assert stats["deals_total"] == 1
+        assert stats["deals_in_progress"] == 0
+        assert stats["pipeline_amount"] == 0
+
+    async def test_bulk_operations_apply_one_delta(self, test_db, test_organization, test_user):
+        org_id = test_organization.id
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            contacts = ContactService(db)
+            created = await contacts.bulk_create_contacts(org_id, [
+                {"first_name": f"Bulk{index}", "last_name": "Contact"} for index in range(3)
+            ])
+            ids = [item["id"] for item in created["results"]]
+            await contacts.bulk_delete_contacts(org_id, [ids[0], uuid4()])
+
+            tasks = TaskService(db)
+            created = await tasks.bulk_create_tasks(org_id, [
+                {"assigned_to": test_user.id, "title": f"Task {index}"} for index in range(2)
+            ])
+            task_ids = [item["id"] for item in created["results"]]
+            await tasks.bulk_update_tasks(
+                org_id,
+                [{"id": task_ids[0], "status": TaskStatusEnum.DONE}],
+                test_user.id,
+                Role.OWNER,
+            )
+
+            stats = await OrganizationStatsRepository(db).get_counters(org_id)
+
+        assert stats["contacts_total"] == 2
+        assert stats["tasks_total"] == 2
+        assert stats["tasks_todo"] == 1
+        assert stats["tasks_done"] == 1
+
+    async def test_reconcile_repairs_drift(self, test_db, test_organization, test_user):
+        org_id = test_organization.id
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            repo = OrganizationStatsRepository(db)
+            db.add(Contact(organization_id=org_id, first_name="Raw", last_name="Insert"))
+            db.add(Task(organization_id=org_id, assigned_to=test_user.id, title="Raw"))
+            await db.commit()
+
+            assert await repo.reconcile() == 1
+            assert await repo.reconcile() == 0
+
+            await db.execute(
+                update(OrganizationStats)
+                .where(OrganizationStats.organization_id == org_id)
+                .values(contacts_total=42)
+            )
+            await db.commit()
+            assert await repo.reconcile(org_id) == 1
+
+            stats = await repo.get_counters(org_id)
+
+        assert stats["contacts_total"] == 1
+        assert stats["tasks_total"] == 1
+        assert stats["tasks_todo"] == 1
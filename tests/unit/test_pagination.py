@@ -0,0 +1,47 @@
+import pytest
+from datetime import datetime
+from uuid import uuid4, UUID
+
+from app.core.exceptions import BadRequest
+from app.core.pagination import decode_cursor, encode_cursor, next_page_cursor
+
+
+class _Row:
+    def __init__(self):
+        self.id = uuid4()
+        self.created_at = datetime.utcnow()
+
+
+class TestCursor:
+    def test_roundtrip(self):
+        created_at = datetime(2025, 1, 2, 3, 4, 5, 678)
+        row_id = uuid4()
+
+        token = encode_cursor(created_at, row_id)
+
+        assert decode_cursor(token, datetime, UUID) == (created_at, row_id)
+
+    def test_token_is_url_safe(self):
+        token = encode_cursor(datetime.utcnow(), uuid4())
+
+        assert "=" not in token
+        assert "/" not in token
+        assert "+" not in token
+
+    def test_invalid_token(self):
+        with pytest.raises(BadRequest):
+            decode_cursor("garbage", datetime, UUID)
+
+    def test_arity_mismatch(self):
+        token = encode_cursor(datetime.utcnow())
+
+        with pytest.raises(BadRequest):
+            decode_cursor(token, datetime, UUID)
+
+    def test_next_page_cursor_only_for_full_pages(self):
+        rows = [_Row(), _Row()]
+
+        assert next_page_cursor(rows, 3) is None
+        assert next_page_cursor([], 2) is None
+        token = next_page_cursor(rows, 2)
+        assert decode_cursor(token, datetime, UUID) == (rows[1].created_at, rows[1].id)
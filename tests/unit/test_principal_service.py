@@ -0,0 +1,87 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.models import RoleEnum
+from app.services import PrincipalService
+
+
+class TestTTLCache:
+    def test_get_and_set(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_expired_entries_are_dropped(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1, ttl=0)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_invalidate_by_predicate(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set(("u1", "o1"), 1)
+        cache.set(("u1", "o2"), 2)
+        cache.set(("u2", "o1"), 3)
+
+        assert cache.invalidate(lambda key: key[0] == "u1") == 2
+        assert ("u2", "o1") in cache
+
+
+@pytest.mark.asyncio
+class TestPrincipalService:
+    async def test_resolve_loads_user_and_member_in_one_query(
+        self, test_db, test_user, test_organization
+    ):
+        statements = self._count_statements(test_db)
+
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            principal = await PrincipalService(db).resolve(
+                test_user.id, test_organization.id
+            )
+
+        assert principal.user.id == test_user.id
+        assert principal.member.role == RoleEnum.OWNER
+        assert len(statements) == 1
+
+    async def test_resolve_is_memoized_and_cached(
+        self, test_db, test_user, test_organization
+    ):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            await PrincipalService(db).resolve(test_user.id, test_organization.id)
+
+        statements = self._count_statements(test_db)
+
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            service = PrincipalService(db)
+            first = await service.resolve(test_user.id, test_organization.id)
+            second = await service.resolve(test_user.id)
+
+        assert first is second
+        assert first.user.email == test_user.email
+        assert len(statements) == 0
+
+    @staticmethod
+    def _count_statements(test_db):
+        statements = []
+
+        @event.listens_for(test_db.sync_engine, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        return statements
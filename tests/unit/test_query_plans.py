@@ -0,0 +1,141 @@
+import pytest
+from datetime import date, datetime
+from uuid import uuid4
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ActivityTypeEnum, DealStatusEnum, TaskStatusEnum, TaskPriorityEnum
+from app.core.pagination import encode_cursor
+from app.repositories import (
+    ActivityRepository,
+    ContactRepository,
+    DailyRollupRepository,
+    DealRepository,
+    DealStatusTransitionRepository,
+    OrganizationRepository,
+    TaskRepository,
+    UserRepository,
+)
+from app.services import AnalyticsService
+
+
+def _repository_calls(db, organization_id, user_id, record_id):
+    contacts = ContactRepository(db)
+    deals = DealRepository(db)
+    tasks = TaskRepository(db)
+    activities = ActivityRepository(db)
+    users = UserRepository(db)
+    organizations = OrganizationRepository(db)
+
+    return {
+        "contacts.list_by_organization": contacts.list_by_organization(organization_id),
+        "contacts.list_active_by_organization": contacts.list_active_by_organization(organization_id),
+        "contacts.search_by_organization": contacts.search_by_organization(organization_id, "a"),
+        "contacts.get_by_email": contacts.get_by_email(organization_id, "a@b.c"),
+        "contacts.list_by_company": contacts.list_by_company(organization_id, "Acme"),
+        "contacts.count_by_organization": contacts.count_by_organization(organization_id),
+        "deals.list_by_organization": deals.list_by_organization(organization_id),
+        "deals.list_by_contact": deals.list_by_contact(record_id),
+        "deals.list_by_status": deals.list_by_status(organization_id, DealStatusEnum.WON),
+        "deals.list_by_assigned_to": deals.list_by_assigned_to(organization_id, user_id),
+        "deals.board": deals.board(organization_id, "amount", 21),
+        "deals.board_after_cursor": deals.board(
+            organization_id, "expected_close_date", 21, DealStatusEnum.NEW,
+            (datetime(2026, 1, 1), record_id),
+        ),
+        "deals.search_by_organization": deals.search_by_organization(organization_id, "a"),
+        "deals.get_total_amount_by_status": deals.get_total_amount_by_status(
+            organization_id, DealStatusEnum.WON
+        ),
+        "deals.count_by_status": deals.count_by_status(organization_id, DealStatusEnum.NEW),
+        "tasks.list_by_organization": tasks.list_by_organization(organization_id),
+        "tasks.list_by_contact": tasks.list_by_contact(record_id),
+        "tasks.list_by_deal": tasks.list_by_deal(record_id),
+        "tasks.list_by_assigned_to": tasks.list_by_assigned_to(organization_id, user_id),
+        "tasks.list_by_status": tasks.list_by_status(organization_id, TaskStatusEnum.TODO),
+        "tasks.list_by_priority": tasks.list_by_priority(organization_id, TaskPriorityEnum.HIGH),
+        "tasks.list_overdue": tasks.list_overdue(organization_id),
+        "tasks.search_by_organization": tasks.search_by_organization(organization_id, "a"),
+        "tasks.count_overdue": tasks.count_overdue(organization_id),
+        "activities.list_by_organization": activities.list_by_organization(organization_id),
+        "activities.list_by_contact": activities.list_by_contact(record_id),
+        "activities.list_by_deal": activities.list_by_deal(record_id),
+        "activities.list_by_created_by": activities.list_by_created_by(organization_id, user_id),
+        "activities.list_by_type": activities.list_by_type(organization_id, ActivityTypeEnum.CALL),
+        "activities.get_recent_by_organization": activities.get_recent_by_organization(organization_id),
+        "activities.get_recent_by_deal": activities.get_recent_by_deal(record_id),
+        "activities.count_by_type": activities.count_by_type(organization_id, ActivityTypeEnum.NOTE),
+        "users.get_by_email": users.get_by_email("a@b.c"),
+        "users.get_by_username": users.get_by_username("a"),
+        "users.get_with_membership": users.get_with_membership(user_id, organization_id),
+        "users.list_by_organization": users.list_by_organization(organization_id),
+        "organizations.get_by_name": organizations.get_by_name("Acme"),
+        "organizations.count_members": organizations.count_members(organization_id),
+        "contacts.timeline": contacts.timeline(record_id),
+        "contacts.timeline_after_cursor": contacts.timeline(
+            record_id, cursor=encode_cursor(datetime(2026, 1, 1), "deal_created", record_id)
+        ),
+        "transitions.funnel_by_assignee": DealStatusTransitionRepository(db).funnel_by_assignee(
+            organization_id, datetime(2026, 1, 1), datetime(2026, 4, 1)
+        ),
+        "rollups.series": DailyRollupRepository(db).series(
+            organization_id, date(2026, 1, 1), date(2026, 4, 1), "week"
+        ),
+        "analytics.dashboard": AnalyticsService(db).get_dashboard_summary(organization_id),
+    }
+
+
+def _full_scans(plan):
+    derived = {
+        detail.split()[-1] for detail in plan
+        if detail.startswith(("MATERIALIZE ", "CO-ROUTINE "))
+    }
+    return [
+        detail for detail in plan
+        if detail.startswith("SCAN ")
+        and detail.split()[1] not in derived
+    ]
+
+
+@pytest.mark.asyncio
+class TestRepositoryQueryPlans:
+    async def test_hot_queries_use_indexes(self, test_db):
+        captured = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+                captured.append((statement, parameters))
+
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            calls = _repository_calls(db, uuid4(), uuid4(), uuid4())
+            regressions = {}
+            for name, call in calls.items():
+                captured.clear()
+                event.listen(test_db.sync_engine, "before_cursor_execute", record)
+                try:
+                    await call
+                finally:
+                    event.remove(test_db.sync_engine, "before_cursor_execute", record)
+
+                assert captured, name
+                for statement, parameters in captured:
+                    plan = await self._explain(db, statement, parameters)
+                    scans = _full_scans(plan)
+                    if scans:
+                        regressions.setdefault(name, []).extend(scans)
+
+        assert regressions == {}
+
+    async def test_detects_full_scan(self, test_db):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            plan = await self._explain(db, "SELECT * FROM contacts WHERE notes = ?", ("x",))
+
+        assert _full_scans(plan) == ["SCAN contacts"]
+
+    @staticmethod
+    async def _explain(db, statement, parameters):
+        connection = await db.connection()
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", tuple(parameters)
+        )
+        return [row[-1] for row in result.all()]
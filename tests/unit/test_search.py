@@ -0,0 +1,121 @@
+import pytest
+from uuid import uuid4
+from datetime import datetime, timedelta
+from sqlalchemy import create_mock_engine, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import Base
+from app.models import Contact
+from app.repositories import ContactRepository
+from app.repositories.search import TextSearch, search_terms
+
+
+class TestSearchTerms:
+    def test_splits_and_lowercases(self):
+        assert search_terms("John  SMITH, acme.com") == ["john", "smith", "acme", "com"]
+
+    def test_drops_punctuation_only_queries(self):
+        assert search_terms(" %&* ") == []
+
+
+class TestPostgresSearch:
+    def test_uses_tsvector_and_trigram_operators(self):
+        stmt = TextSearch(Contact).apply(select(Contact.id), "Jon Smi", "postgresql")
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+
+        assert "contacts.search_vector @@ to_tsquery('simple'::regconfig" in sql
+        assert "<%% contacts.search_text" in sql
+        assert "ORDER BY ts_rank(" in sql
+        assert "jon:* & smi:*" in compiled.params.values()
+        assert "jon smi" in compiled.params.values()
+
+    def test_create_all_emits_search_ddl(self):
+        statements = []
+
+        def executor(sql, *args, **kwargs):
+            statements.append(str(sql.compile(dialect=engine.dialect)))
+
+        engine = create_mock_engine("postgresql://", executor)
+
+        Base.metadata.create_all(engine, checkfirst=False)
+        ddl = "\n".join(statements)
+
+        assert "CREATE EXTENSION IF NOT EXISTS pg_trgm" in ddl
+        for table in ("contacts", "deals", "tasks"):
+            assert f"ALTER TABLE {table} ADD COLUMN search_vector tsvector" in ddl
+            assert f"ON {table} USING gin (search_text gin_trgm_ops)" in ddl
+
+
+@pytest.mark.asyncio
+class TestPortableSearch:
+    async def test_prefix_matches_rank_first(self, test_db, test_organization):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            ids = await self._seed(db, test_organization.id, [
+                ("Bob", "Blacksmith", None),
+                ("Anna", "Smith", None),
+                ("Carl", "Jones", "Goldsmiths"),
+                ("Dora", "Miller", None),
+            ])
+
+            results = await ContactRepository(db).search_by_organization(
+                test_organization.id, "smith"
+            )
+
+        assert results[0].id == ids["Anna"]
+        assert {c.id for c in results[1:]} == {ids["Bob"], ids["Carl"]}
+
+    async def test_every_term_must_match(self, test_db, test_organization):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            await self._seed(db, test_organization.id, [
+                ("Anna", "Smith", None),
+                ("Anna", "Jones", None),
+            ])
+
+            results = await ContactRepository(db).search_by_organization(
+                test_organization.id, "anna smi"
+            )
+
+        assert [c.last_name for c in results] == ["Smith"]
+
+    async def test_like_wildcards_are_escaped(self, test_db, test_organization):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            await self._seed(db, test_organization.id, [
+                ("a_b", "One", None),
+                ("axb", "Two", None),
+            ])
+
+            results = await ContactRepository(db).search_by_organization(
+                test_organization.id, "a_b"
+            )
+
+        assert [c.first_name for c in results] == ["a_b"]
+
+    async def test_empty_query_matches_nothing(self, test_db, test_organization):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            await self._seed(db, test_organization.id, [("Anna", "Smith", None)])
+
+            results = await ContactRepository(db).search_by_organization(
+                test_organization.id, "  "
+            )
+
+        assert results == []
+
+    @staticmethod
+    async def _seed(db, organization_id, rows):
+        now = datetime.utcnow()
+        ids = {}
+        for index, (first_name, last_name, company) in enumerate(rows):
+            contact = Contact(
+                id=uuid4(),
+                organization_id=organization_id,
+                first_name=first_name,
+                last_name=last_name,
+                company=company,
+                created_at=now - timedelta(minutes=index),
+            )
+            db.add(contact)
+            ids[first_name] = contact.id
+        await db.commit()
+        return ids
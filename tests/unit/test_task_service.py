@@ -0,0 +1,54 @@
+import pytest
+from uuid import uuid4
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.permissions import Role
+from app.models import Task, TaskStatusEnum
+from app.services import TaskService
+
+
+@pytest.mark.asyncio
+class TestTaskService:
+    async def test_status_updates_maintain_completed_at(
+        self, test_db, test_organization, test_user
+    ):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            done, bulk_done, reopened, started = [
+                Task(
+                    id=uuid4(),
+                    organization_id=test_organization.id,
+                    assigned_to=test_user.id,
+                    title=title,
+                    status=TaskStatusEnum.TODO,
+                )
+                for title in ("Done", "Bulk done", "Reopened", "Started")
+            ]
+            db.add_all([done, bulk_done, reopened, started])
+            await db.commit()
+
+            service = TaskService(db)
+            await service.update_task(
+                done.id, {"status": TaskStatusEnum.DONE}, test_user.id, Role.OWNER
+            )
+            await service.complete_task(reopened.id, test_user.id, Role.OWNER)
+            await service.bulk_update_tasks(
+                test_organization.id,
+                [
+                    {"id": bulk_done.id, "status": TaskStatusEnum.DONE},
+                    {"id": reopened.id, "status": TaskStatusEnum.IN_PROGRESS},
+                    {"id": started.id, "status": TaskStatusEnum.IN_PROGRESS},
+                ],
+                test_user.id,
+                Role.OWNER,
+            )
+
+            stored = {
+                task.title: await db.get(Task, task.id, populate_existing=True)
+                for task in (done, bulk_done, reopened, started)
+            }
+
+        assert stored["Done"].completed_at is not None
+        assert stored["Bulk done"].completed_at is not None
+        assert stored["Reopened"].status == TaskStatusEnum.IN_PROGRESS
+        assert stored["Reopened"].completed_at is None
+        assert stored["Started"].completed_at is None
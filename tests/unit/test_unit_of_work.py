@@ -0,0 +1,135 @@
+import pytest
+from decimal import Decimal
+from uuid import uuid4
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import BadRequest, Conflict
+from app.models import (
+    Activity, Contact, Deal, DealStatusEnum, Organization, OrganizationMember, User,
+)
+from app.core.permissions import Role
+from app.repositories import ContactRepository
+from app.services import AuthService, DealService
+from app.services.unit_of_work import UnitOfWork
+
+
+@pytest.mark.asyncio
+class TestUnitOfWork:
+    async def test_repository_writes_commit_once(self, test_db, test_organization):
+        commits = self._record_commits(test_db)
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            repo = ContactRepository(db)
+            async with UnitOfWork(db):
+                await repo.create(self._contact(test_organization.id, "First"))
+                async with UnitOfWork(db):
+                    await repo.create(self._contact(test_organization.id, "Second"))
+                assert commits == []
+
+            assert len(commits) == 1
+            assert await repo.count_by_organization(test_organization.id) == 2
+
+    async def test_failure_rolls_back_every_write(self, test_db, test_organization):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            repo = ContactRepository(db)
+            with pytest.raises(BadRequest):
+                async with UnitOfWork(db):
+                    await repo.create(self._contact(test_organization.id, "First"))
+                    raise BadRequest("abort")
+
+            assert await repo.count_by_organization(test_organization.id) == 0
+            await repo.create(self._contact(test_organization.id, "Later"))
+            assert await repo.count_by_organization(test_organization.id) == 1
+
+    async def test_change_deal_status_writes_deal_and_activity_together(
+        self, test_db, test_organization, test_user
+    ):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            contact = self._contact(test_organization.id, "Deal")
+            db.add(contact)
+            await db.commit()
+            service = DealService(db)
+            deal = await service.create_deal(
+                organization_id=test_organization.id,
+                contact_id=contact.id,
+                title="Atomic Deal",
+                amount=Decimal("100.00"),
+            )
+
+            commits = self._record_commits(test_db)
+            await service.change_deal_status(deal.id, DealStatusEnum.IN_PROGRESS, test_user.id)
+
+            assert len(commits) == 1
+            activities = (await db.execute(
+                select(Activity).where(Activity.deal_id == deal.id)
+            )).scalars().all()
+            assert len(activities) == 1
+            assert (await db.get(Deal, deal.id)).status == DealStatusEnum.IN_PROGRESS
+
+    async def test_register_commits_once(self, test_db):
+        commits = self._record_commits(test_db)
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            result = await AuthService(db).register(
+                email="uow@example.com",
+                username="uow",
+                first_name="Unit",
+                last_name="Work",
+                password="password123",
+            )
+
+            assert len(commits) == 1
+            member = (await db.execute(
+                select(OrganizationMember).where(OrganizationMember.user_id == result["user"].id)
+            )).scalar_one()
+            assert member.organization_id == result["organization"].id
+            assert member.role.value == Role.OWNER.value
+            assert (await db.get(User, result["user"].id)).email == "uow@example.com"
+
+    async def test_register_conflict_leaves_no_rows(self, test_db, test_user):
+        async with AsyncSession(test_db, expire_on_commit=False) as db:
+            service = AuthService(db)
+            with pytest.raises(Conflict) as email_taken:
+                await service.register(
+                    email=test_user.email,
+                    username="fresh",
+                    first_name="Dup",
+                    last_name="Email",
+                    password="password123",
+                )
+            with pytest.raises(Conflict) as username_taken:
+                await service.register(
+                    email="fresh@example.com",
+                    username=test_user.username,
+                    first_name="Dup",
+                    last_name="Username",
+                    password="password123",
+                )
+
+            organizations = await db.scalar(
+                select(func.count()).select_from(Organization).where(
+                    Organization.name.like("Dup %")
+                )
+            )
+
+        assert email_taken.value.detail == "Email already registered"
+        assert username_taken.value.detail == "Username already taken"
+        assert organizations == 0
+
+    @staticmethod
+    def _contact(organization_id, first_name):
+        return Contact(
+            id=uuid4(),
+            organization_id=organization_id,
+            first_name=first_name,
+            last_name="Contact",
+        )
+
+    @staticmethod
+    def _record_commits(test_db):
+        commits = []
+
+        @event.listens_for(test_db.sync_engine, "commit")
+        def record(conn):
+            commits.append(conn)
+
+        return commits